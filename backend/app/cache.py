@@ -0,0 +1,117 @@
+"""
+In-process TTL cache for the polled dashboard reads.
+
+Each entry names the sync entities it was computed from (see
+app.services.change_log.SYNC_ENTITIES). Committing a session that wrote any
+of those entities drops the dependent entries straight away, so the TTL only
+bounds staleness from the passage of time (e.g. "due in 3 days" thresholds).
+Steady-state polling is served from memory without touching the database.
+
+The cache lives in the API process. The app runs as a single uvicorn worker;
+with more workers each one keeps its own copy, invalidated by its own writes
+and otherwise expiring after the TTL.
+"""
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Iterable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.config import get_settings
+
+settings = get_settings()
+
+# Session.info key the change-log hook fills with the entity names each
+# transaction wrote
+CHANGED_ENTITIES_KEY = "changed_entities"
+
+
+class QueryCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple, tuple[float, frozenset[str], Any]] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+        # Bumped on every invalidation so a result computed from a snapshot
+        # taken before a concurrent commit is never stored
+        self._generations: Counter = Counter()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.invalidations: Counter = Counter()
+        self._listeners: list[Callable[[set[str]], None]] = []
+
+    def add_listener(self, callback: Callable[[set[str]], None]) -> None:
+        """Call `callback(entities)` after every invalidation (e.g. to push updates)."""
+        self._listeners.append(callback)
+
+    async def get_or_compute(
+        self,
+        name: str,
+        depends_on: Iterable[str],
+        compute: Callable[[], Awaitable[Any]],
+        key: Any = None,
+    ) -> Any:
+        cache_key = (name, key)
+        entry = self._entries.get(cache_key)
+        if entry and entry[0] > time.monotonic():
+            self.hits[name] += 1
+            return entry[2]
+
+        # Concurrent misses for the same key wait for one computation
+        lock = self._locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(cache_key)
+            if entry and entry[0] > time.monotonic():
+                self.hits[name] += 1
+                return entry[2]
+
+            self.misses[name] += 1
+            deps = frozenset(depends_on)
+            generations = {dep: self._generations[dep] for dep in deps}
+            value = await compute()
+            if self.ttl_seconds > 0 and all(
+                self._generations[dep] == gen for dep, gen in generations.items()
+            ):
+                self._entries[cache_key] = (time.monotonic() + self.ttl_seconds, deps, value)
+            return value
+
+    def invalidate(self, entities: Iterable[str]) -> None:
+        """Drop every entry computed from any of the given entities."""
+        entities = set(entities)
+        for entity in entities:
+            self._generations[entity] += 1
+        for cache_key, (_, deps, _) in list(self._entries.items()):
+            if deps & entities:
+                del self._entries[cache_key]
+                self.invalidations[cache_key[0]] += 1
+        for callback in self._listeners:
+            callback(entities)
+
+    def stats(self) -> dict:
+        names = set(self.hits) | set(self.misses) | {k[0] for k in self._entries}
+        return {
+            name: {
+                "hits": self.hits[name],
+                "misses": self.misses[name],
+                "invalidations": self.invalidations[name],
+                "cached_entries": sum(1 for k in self._entries if k[0] == name),
+            }
+            for name in sorted(names)
+        }
+
+
+dashboard_cache = QueryCache(settings.dashboard_cache_ttl_seconds)
+# Closed-month analytics (cohorts): keyed by month and never invalidated by
+# writes, since current-month activity can't change them
+analytics_cache = QueryCache(settings.analytics_cache_ttl_seconds)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    entities = session.info.pop(CHANGED_ENTITIES_KEY, None)
+    if entities:
+        dashboard_cache.invalidate(entities)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(CHANGED_ENTITIES_KEY, None)
@@ -0,0 +1,90 @@
+"""
+Conditional GET (ETag / Last-Modified) for read endpoints.
+
+The validator for a response is the version of every table it reads: the
+newest change_log id for the entity, appended in the same transaction as the
+write and committed in id order (app.services.change_log). Reading those is
+one indexed statement, so an unchanged resource is answered with 304 before
+the body query runs or anything is serialized.
+
+    @router.get("/")
+    async def list_things(request: Request, response: Response, db=...):
+        if not_modified := await conditional_get(request, response, db, "clients"):
+            return not_modified
+        ...
+"""
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.change_log import ChangeLogEntry
+
+
+def _latest_change(entity: str, column):
+    return (
+        select(column)
+        .where(ChangeLogEntry.entity == entity)
+        .order_by(ChangeLogEntry.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def _version_columns(entity: str) -> list:
+    return [
+        _latest_change(entity, ChangeLogEntry.id),
+        _latest_change(entity, ChangeLogEntry.changed_at),
+    ]
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" match
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    *entities: str,
+) -> Response | None:
+    """
+    Set ETag / Last-Modified for a response built from `entities`. Returns a
+    304 response if the client's copy is current, otherwise None.
+    """
+    columns = [column for entity in entities for column in _version_columns(entity)]
+    row = (await db.execute(select(*columns))).one()
+    versions = row[0::2]
+    modified = [m for m in row[1::2] if m is not None]
+
+    digest = hashlib.sha1(
+        f"{request.url.path}?{request.url.query}|{versions}".encode()
+    ).hexdigest()[:20]
+    etag = f'W/"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    last_modified = max(modified).replace(tzinfo=timezone.utc) if modified else None
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    elif if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+            not_modified = last_modified.replace(microsecond=0) <= since
+        except (TypeError, ValueError):
+            not_modified = False
+    else:
+        not_modified = False
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
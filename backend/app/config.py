@@ -14,9 +14,53 @@ class Settings(BaseSettings):
     app_base_url: str = "http://localhost:8000"
     # Comma-separated list of allowed frontend origins (add your Vercel URL here)
     cors_origins: str = "http://localhost:5173,http://localhost:3000"
+    # Adds X-DB-* query stats headers to every response
+    debug: bool = False
+
+    # SQL instrumentation
+    slow_query_ms: int = 250  # log statements at least this slow (0 disables)
+    enforce_query_budgets: bool = False  # raise instead of log when a route exceeds its budget
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./salon.db"
+    # Optional Postgres read replica for read-only (GET) endpoints
+    database_read_url: str = ""
+
+    # SQLite tuning (ignored on Postgres) — applied to every new connection
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 20000
+    sqlite_mmap_size: int = 268435456  # 256 MiB
+    sqlite_temp_store: str = "MEMORY"
+    # Periodic maintenance jobs (0 disables)
+    sqlite_checkpoint_interval_minutes: int = 15
+    sqlite_checkpoint_mode: str = "PASSIVE"  # PASSIVE/FULL/RESTART/TRUNCATE
+    sqlite_optimize_interval_hours: int = 6
+
+    # Dashboard KPI / alerts / today cache (0 disables); writes invalidate it immediately
+    dashboard_cache_ttl_seconds: int = 60
+    # Closed-month analytics cache (0 disables); bounds how long edits to past
+    # months take to show up in /reports/cohorts
+    analytics_cache_ttl_seconds: int = 86400
+    # Recount the dashboard counters and repair drift (0 disables)
+    counter_reconcile_interval_minutes: int = 60
+    # Months computed in parallel by POST /reports/backfill
+    report_backfill_concurrency: int = 4
+
+    # Background jobs (report generation): parallel jobs, idle poll interval,
+    # and how long finished jobs are kept for GET /jobs/{id}
+    job_worker_concurrency: int = 2
+    job_poll_seconds: float = 5
+    job_retention_days: int = 7
+
+    # Google Calendar outbox: idle poll interval, entries pushed per batch,
+    # first retry delay (doubles per attempt, capped at an hour) and attempts
+    # before an entry is marked failed
+    calendar_outbox_poll_seconds: float = 10
+    calendar_outbox_batch_size: int = 50
+    calendar_outbox_retry_seconds: float = 30
+    calendar_outbox_max_attempts: int = 8
 
     # Anthropic
     anthropic_api_key: str = ""
@@ -37,6 +81,8 @@ class Settings(BaseSettings):
     salon_timezone: str = "America/New_York"
     salon_hours_start: str = "09:00"
     salon_hours_end: str = "18:00"
+    # How far ahead GET /calendar/next-available searches
+    next_available_horizon_days: int = 56
     booking_link: str = ""
 
     # Scheduler
@@ -1,24 +1,57 @@
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 from app.config import get_settings
 
 settings = get_settings()
 
-# Railway provides DATABASE_URL as postgresql://... — convert to async driver
-db_url = settings.database_url
-if db_url.startswith("postgresql://"):
-    db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-elif db_url.startswith("postgres://"):
-    db_url = db_url.replace("postgres://", "postgresql+asyncpg://", 1)
+
+def _async_url(url: str) -> str:
+    # Railway provides DATABASE_URL as postgresql://... — convert to async driver
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    return url
+
+
+db_url = _async_url(settings.database_url)
 
 is_sqlite = db_url.startswith("sqlite")
 
 engine = create_async_engine(
     db_url,
     echo=False,
-    connect_args={"check_same_thread": False} if is_sqlite else {},
+    connect_args=(
+        {
+            "check_same_thread": False,
+            # Driver-level wait on a locked database, matches PRAGMA busy_timeout
+            "timeout": settings.sqlite_busy_timeout_ms / 1000,
+        }
+        if is_sqlite
+        else {}
+    ),
 )
 
+
+if is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Production profile for SQLite: WAL lets readers run alongside the
+        single writer (webhooks + scheduler jobs), and busy_timeout makes
+        writers wait for the lock instead of failing with "database is locked".
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        # Negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA temp_store={settings.sqlite_temp_store}")
+        cursor.close()
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -26,6 +59,40 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Read-only traffic goes to the replica when one is configured (Postgres only —
+# a second SQLite engine would just be the same file behind another pool).
+read_db_url = _async_url(settings.database_read_url) if settings.database_read_url else ""
+
+if read_db_url and not is_sqlite:
+    read_engine = create_async_engine(
+        read_db_url,
+        echo=False,
+        execution_options={"postgresql_readonly": True},
+    )
+else:
+    read_engine = engine
+
+
+class _ReadOnlySession(Session):
+    """Session that refuses to write: any pending change is a bug on a read path."""
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise RuntimeError(
+                "Attempted to write through a read-only session. "
+                "Use get_db for endpoints that modify data."
+            )
+
+
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    sync_session_class=_ReadOnlySession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -40,10 +107,76 @@ async def get_db():
             raise
 
 
-async def create_tables():
-    """Create all tables on startup."""
-    from app.models import (  # noqa: F401
-        client, appointment, lead, inventory, communication, report
-    )
+async def get_read_db():
+    """
+    Session for read-only endpoints. Never flushes or commits, so GET polling
+    doesn't open a write transaction (or take the SQLite write lock) and can be
+    served from DATABASE_READ_URL when a replica is configured.
+    """
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+async def begin_read_snapshot(session: AsyncSession) -> None:
+    """
+    Pin every following read in this session's transaction to one consistent
+    snapshot. Call before the first query. pysqlite only opens a transaction
+    ahead of DML, so without an explicit BEGIN each SELECT would see whatever
+    was committed at that moment; on Postgres READ COMMITTED has the same
+    effect, so switch the transaction to REPEATABLE READ.
+    """
+    if is_sqlite:
+        await session.execute(text("BEGIN"))
+    else:
+        await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+
+def _upgrade_schema(connection) -> None:
+    """Bring the schema to the latest Alembic revision (runs inside run_sync)."""
+    from pathlib import Path
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import inspect
+
+    cfg = Config(str(Path(__file__).resolve().parent.parent / "alembic.ini"))
+    cfg.attributes["connection"] = connection
+
+    # Databases created by the old create_all() startup have every table but no
+    # alembic_version row — adopt them at the initial revision instead of
+    # trying to re-create their tables.
+    tables = set(inspect(connection).get_table_names())
+    if "alembic_version" not in tables and "clients" in tables:
+        command.stamp(cfg, "0001")
+
+    command.upgrade(cfg, "head")
+
+
+async def run_migrations():
+    """Apply pending Alembic migrations on startup."""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade_schema)
+
+
+async def sqlite_checkpoint() -> tuple | None:
+    """
+    Checkpoint the WAL back into the main database file so it doesn't grow
+    unbounded between automatic checkpoints. Returns (busy, log, checkpointed).
+    """
+    if not is_sqlite:
+        return None
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(f"PRAGMA wal_checkpoint({settings.sqlite_checkpoint_mode})")
+        )
+        return tuple(result.one())
+
+
+async def sqlite_optimize() -> None:
+    """Refresh query-planner statistics for tables whose indexes need it."""
+    if not is_sqlite:
+        return
+    async with engine.connect() as conn:
+        await conn.execute(text("PRAGMA optimize"))
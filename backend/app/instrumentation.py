@@ -0,0 +1,133 @@
+"""
+Per-request SQL instrumentation.
+
+Cursor-execute hooks on the engines count every statement, time it, and keep
+the slowest few. The HTTP middleware in main.py opens a QueryStats for each
+request; in DEBUG mode the totals come back as X-DB-* response headers.
+Statements slower than SLOW_QUERY_MS are printed as they happen.
+
+Routes can declare a query budget:
+
+    @router.post("/sync", dependencies=[Depends(query_budget(5))])
+
+Going over budget is logged. With ENFORCE_QUERY_BUDGETS=true (the test suite
+sets it) it raises QueryBudgetExceeded instead, so an N+1 regression fails
+loudly. The check runs in before_commit, after flushing what the commit would
+write, so an over-budget write is rolled back rather than reported as a 500
+after it has committed; requests that don't commit are checked when they end.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.database import engine, read_engine
+
+settings = get_settings()
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time-Ms"
+SLOWEST_QUERY_HEADER = "X-DB-Slowest-Ms"
+
+SLOWEST_KEPT = 5
+
+_current_stats: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class QueryStats:
+    """Statement count, total time and the slowest statements for one unit of work."""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest: list[tuple[float, str]] = []
+        self.budget: int | None = None
+        # Set once a transaction commits; enforcing after that can't undo the write
+        self.committed = False
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if len(self.slowest) < SLOWEST_KEPT or elapsed_ms > self.slowest[-1][0]:
+            self.slowest.append((elapsed_ms, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+
+@contextmanager
+def track_queries(label: str = ""):
+    """Collect QueryStats for every statement run inside the block."""
+    stats = QueryStats(label)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def query_budget(max_queries: int):
+    """Route dependency declaring the most statements a request may run."""
+    def _set_budget():
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.budget = max_queries
+    return _set_budget
+
+
+def _report_overrun(stats: QueryStats, can_raise: bool) -> None:
+    message = f"{stats.label} ran {stats.count} queries (budget {stats.budget})"
+    if settings.enforce_query_budgets and can_raise:
+        raise QueryBudgetExceeded(message)
+    print(f"[QueryBudget] {message}")
+
+
+def check_budget(stats: QueryStats) -> None:
+    """End-of-request check. Overruns after a commit are only logged: raising can't undo the write."""
+    if stats.over_budget:
+        _report_overrun(stats, can_raise=not stats.committed)
+
+
+@event.listens_for(Session, "before_commit")
+def _check_budget_before_commit(session):
+    stats = _current_stats.get()
+    if stats is None or stats.budget is None or not settings.enforce_query_budgets:
+        return
+    # Count the statements the commit is about to flush too
+    session.flush()
+    if stats.over_budget:
+        _report_overrun(stats, can_raise=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.committed = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+    if settings.slow_query_ms and elapsed_ms >= settings.slow_query_ms:
+        print(f"[SlowQuery] {elapsed_ms:.1f} ms: {' '.join(statement.split())[:500]}")
+
+
+for _engine in {engine.sync_engine, read_engine.sync_engine}:
+    event.listen(_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(_engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,14 +1,21 @@
 from app.models.client import Client, WaitlistEntry
 from app.models.appointment import Appointment
+from app.models.appointment_series import AppointmentSeries
 from app.models.lead import ExtensionLead
 from app.models.inventory import InventoryProduct, InventoryTransaction, PurchaseOrder
 from app.models.communication import SmsMessage, ChatSession
 from app.models.report import AftercareSequence, Report, AppSetting
+from app.models.change_log import ChangeLogEntry
+from app.models.counter import Counter
+from app.models.rollup import DailyRollup, DailyServiceRollup
+from app.models.job import Job
+from app.models.calendar_outbox import CalendarOutboxEntry
 
 __all__ = [
     "Client",
     "WaitlistEntry",
     "Appointment",
+    "AppointmentSeries",
     "ExtensionLead",
     "InventoryProduct",
     "InventoryTransaction",
@@ -18,4 +25,10 @@ __all__ = [
     "AftercareSequence",
     "Report",
     "AppSetting",
+    "ChangeLogEntry",
+    "Counter",
+    "DailyRollup",
+    "DailyServiceRollup",
+    "Job",
+    "CalendarOutboxEntry",
 ]
@@ -1,20 +1,40 @@
 from datetime import datetime
 from sqlalchemy import (
-    Integer, String, Boolean, Text, DateTime, Numeric,
-    ForeignKey, func
+    Integer, String, Boolean, Text, DateTime,
+    ForeignKey, Index, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.models.types import Money
 
 
 class Appointment(Base):
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Dashboard, scheduler and report range filters: status + time window
+        Index("ix_appointments_status_start", "status", "start_datetime"),
+        # Keyset pagination on (start_datetime, id)
+        Index("ix_appointments_start_id", "start_datetime", "id"),
+        # Overlap probes (double booking, availability): start range, then
+        # end/status read from the index
+        Index("ix_appointments_start_end", "start_datetime", "end_datetime", "status"),
+        # Visits of a recurring series
+        Index("ix_appointments_series_id", "series_id"),
+        # Client timeline / last completed service
+        Index("ix_appointments_client_start", "client_id", "start_datetime"),
+        # Google Calendar sync lookups
+        Index(
+            "ix_appointments_google_event_id", "google_event_id",
+            sqlite_where=text("google_event_id IS NOT NULL"),
+            postgresql_where=text("google_event_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     client_id: Mapped[int] = mapped_column(Integer, ForeignKey("clients.id"), nullable=False)
     service_type: Mapped[str] = mapped_column(String(60), nullable=False)
     duration_minutes: Mapped[int] = mapped_column(Integer, nullable=False)
-    price: Mapped[float] = mapped_column(Numeric(8, 2), nullable=False)
+    price: Mapped[float] = mapped_column(Money, nullable=False)
     status: Mapped[str] = mapped_column(
         String(20), default="scheduled"
     )  # scheduled/completed/cancelled/no_show/needs_review
@@ -23,8 +43,11 @@ class Appointment(Base):
     google_event_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     deposit_paid: Mapped[bool] = mapped_column(Boolean, default=False)
-    deposit_amount: Mapped[float] = mapped_column(Numeric(8, 2), default=0.00)
+    deposit_amount: Mapped[float] = mapped_column(Money, default=0)
     cancellation_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    series_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("appointment_series.id"), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), onupdate=func.now()
@@ -32,6 +55,9 @@ class Appointment(Base):
 
     # Relationships
     client: Mapped["Client"] = relationship("Client", back_populates="appointments")  # type: ignore[name-defined]  # noqa
+    series: Mapped["AppointmentSeries | None"] = relationship(  # type: ignore[name-defined]  # noqa
+        "AppointmentSeries", back_populates="appointments"
+    )
     aftercare_sequence: Mapped["AftercareSequence | None"] = relationship(  # type: ignore[name-defined]  # noqa
         "AftercareSequence", back_populates="appointment", uselist=False
     )
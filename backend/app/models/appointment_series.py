@@ -0,0 +1,28 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.database import Base
+from app.models.types import Money
+
+
+class AppointmentSeries(Base):
+    """A recurring booking (e.g. extension move-ups every 6 weeks); each visit is an Appointment."""
+    __tablename__ = "appointment_series"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    client_id: Mapped[int] = mapped_column(Integer, ForeignKey("clients.id"), nullable=False)
+    service_type: Mapped[str] = mapped_column(String(60), nullable=False)
+    duration_minutes: Mapped[int] = mapped_column(Integer, nullable=False)
+    price: Mapped[float] = mapped_column(Money, nullable=False)
+    first_start_datetime: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    interval_weeks: Mapped[int] = mapped_column(Integer, nullable=False)
+    occurrences: Mapped[int] = mapped_column(Integer, nullable=False)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now()
+    )
+
+    appointments: Mapped[list["Appointment"]] = relationship(  # type: ignore[name-defined]  # noqa
+        "Appointment", back_populates="series"
+    )
@@ -0,0 +1,30 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class CalendarOutboxEntry(Base):
+    """
+    A pending Google Calendar write for an appointment, committed with the
+    appointment change itself and pushed by app.services.calendar_outbox.
+    """
+    __tablename__ = "calendar_outbox"
+    __table_args__ = (
+        # The worker claims due entries oldest first
+        Index("ix_calendar_outbox_status_next", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    appointment_id: Mapped[int] = mapped_column(Integer, ForeignKey("appointments.id"), nullable=False)
+    op: Mapped[str] = mapped_column(String(10), nullable=False)  # create/update/cancel
+    status: Mapped[str] = mapped_column(String(20), default="pending")  # pending/failed
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    # Python-side default: the worker compares it with naive local datetime.now(),
+    # while func.now() is UTC on SQLite
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now()
+    )
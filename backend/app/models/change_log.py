@@ -0,0 +1,25 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class ChangeLogEntry(Base):
+    """
+    One row per write to a synced entity. The autoincrement id is the global
+    version number: clients remember the highest id they've seen and ask for
+    everything after it. Writers commit in id order (see
+    app.services.change_log). Deletes are kept as op="delete" tombstones.
+    """
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_entity_entity_id", "entity", "entity_id"),
+        # Latest version per entity, for ETags
+        Index("ix_change_log_entity_id", "entity", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entity: Mapped[str] = mapped_column(String(30), nullable=False)  # clients/appointments/leads/inventory/aftercare/chat_sessions
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    op: Mapped[str] = mapped_column(String(10), nullable=False)  # upsert/delete
+    changed_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
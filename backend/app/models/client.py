@@ -1,14 +1,28 @@
 from datetime import datetime, date
 from sqlalchemy import (
-    Integer, String, Boolean, Text, Date, DateTime, Numeric,
-    ForeignKey, func
+    Integer, String, Boolean, Text, Date, DateTime,
+    ForeignKey, Index, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.models.types import Money
 
 
 class Client(Base):
     __tablename__ = "clients"
+    __table_args__ = (
+        # Keyset pagination on (full_name, id)
+        Index("ix_clients_full_name_id", "full_name", "id"),
+        Index("ix_clients_created_at", "created_at"),
+        # flag_lapsed_clients scan and monthly recovered-client counts
+        Index("ix_clients_last_visit_date", "last_visit_date"),
+        # Lapsed list / alert count only ever touch the lapsed subset
+        Index(
+            "ix_clients_lapsed_last_visit", "last_visit_date",
+            sqlite_where=text("is_lapsed"),
+            postgresql_where=text("is_lapsed"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     full_name: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -18,7 +32,7 @@ class Client(Base):
     first_visit_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     last_visit_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     total_visits: Mapped[int] = mapped_column(Integer, default=0)
-    total_spent: Mapped[float] = mapped_column(Numeric(10, 2), default=0.00)
+    total_spent: Mapped[float] = mapped_column(Money, default=0)
     is_lapsed: Mapped[bool] = mapped_column(Boolean, default=False)
     hair_profile: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
     gdpr_consent: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -44,6 +58,9 @@ class Client(Base):
 
 class WaitlistEntry(Base):
     __tablename__ = "waitlist_entries"
+    __table_args__ = (
+        Index("ix_waitlist_entries_status_created_id", "status", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     client_id: Mapped[int] = mapped_column(Integer, ForeignKey("clients.id"), nullable=False)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy import (
-    Integer, String, Text, DateTime, ForeignKey, func
+    Integer, String, Text, DateTime, ForeignKey, Index, func
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
@@ -8,6 +8,11 @@ from app.database import Base
 
 class SmsMessage(Base):
     __tablename__ = "sms_messages"
+    __table_args__ = (
+        # Client SMS history / timeline
+        Index("ix_sms_messages_client_created", "client_id", "created_at"),
+        Index("ix_sms_messages_lead_created", "lead_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     client_id: Mapped[int | None] = mapped_column(
@@ -0,0 +1,19 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class Counter(Base):
+    """
+    Running dashboard counts (lapsed clients, active leads, ...), kept up to
+    date by app.services.counters in the same transaction as the writes that
+    move them, so reads are a primary-key lookup instead of a COUNT scan.
+    """
+    __tablename__ = "counters"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now()
+    )
@@ -1,14 +1,18 @@
 from datetime import datetime
 from sqlalchemy import (
     Integer, String, Boolean, Text, DateTime, Numeric,
-    ForeignKey, func
+    ForeignKey, Index, func
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.models.types import Money
 
 
 class InventoryProduct(Base):
     __tablename__ = "inventory_products"
+    __table_args__ = (
+        Index("ix_inventory_products_active_category_name", "is_active", "category", "name"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -16,8 +20,8 @@ class InventoryProduct(Base):
     category: Mapped[str] = mapped_column(String(60), nullable=False)  # extensions/tools/retail/color/care
     supplier_name: Mapped[str | None] = mapped_column(String(120), nullable=True)
     supplier_contact: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    unit_cost: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
-    retail_price: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
+    unit_cost: Mapped[float | None] = mapped_column(Money, nullable=True)
+    retail_price: Mapped[float | None] = mapped_column(Money, nullable=True)
     current_stock: Mapped[float] = mapped_column(Numeric(10, 2), default=0)
     stock_unit: Mapped[str] = mapped_column(String(20), default="units")  # units/grams/packs
     reorder_threshold: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
@@ -39,6 +43,12 @@ class InventoryProduct(Base):
 
 class InventoryTransaction(Base):
     __tablename__ = "inventory_transactions"
+    __table_args__ = (
+        # Product detail: recent transactions
+        Index("ix_inventory_transactions_product_created", "product_id", "created_at"),
+        # Reorder advice: usage over the last 30 days
+        Index("ix_inventory_transactions_type_created", "transaction_type", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     product_id: Mapped[int] = mapped_column(
@@ -65,6 +75,9 @@ class InventoryTransaction(Base):
 
 class PurchaseOrder(Base):
     __tablename__ = "purchase_orders"
+    __table_args__ = (
+        Index("ix_purchase_orders_created_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     status: Mapped[str] = mapped_column(
@@ -73,7 +86,7 @@ class PurchaseOrder(Base):
     supplier_name: Mapped[str | None] = mapped_column(String(120), nullable=True)
     ai_generated: Mapped[bool] = mapped_column(Boolean, default=False)
     items_json: Mapped[str] = mapped_column(Text, nullable=False)  # JSON array
-    total_cost: Mapped[float | None] = mapped_column(Numeric(10, 2), nullable=True)
+    total_cost: Mapped[float | None] = mapped_column(Money, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     ordered_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     received_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
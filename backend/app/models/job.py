@@ -0,0 +1,30 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, Text, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+
+class Job(Base):
+    """A unit of background work (e.g. computing report metrics), run by app.services.jobs."""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # The worker claims the oldest queued job
+        Index("ix_jobs_status_id", "status", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(40), nullable=False)  # report_metrics
+    params_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
+    status: Mapped[str] = mapped_column(
+        String(20), default="queued"
+    )  # queued/running/succeeded/failed
+    progress_done: Mapped[int] = mapped_column(Integer, default=0)
+    progress_total: Mapped[int] = mapped_column(Integer, default=0)
+    result_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now()
+    )
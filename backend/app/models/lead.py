@@ -1,14 +1,26 @@
 from datetime import datetime
 from sqlalchemy import (
-    Integer, String, Boolean, Text, DateTime, Numeric,
-    ForeignKey, func
+    Integer, String, Boolean, Text, DateTime,
+    ForeignKey, Index, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.models.types import Money
 
 
 class ExtensionLead(Base):
     __tablename__ = "extension_leads"
+    __table_args__ = (
+        # Pipeline board / list filtered by stage, newest first (keyset on created_at, id)
+        Index("ix_extension_leads_stage_created_id", "pipeline_stage", "created_at", "id"),
+        Index("ix_extension_leads_created_id", "created_at", "id"),
+        # Overdue follow-ups only ever look at open leads
+        Index(
+            "ix_extension_leads_open_follow_up", "next_follow_up_at",
+            sqlite_where=text("pipeline_stage NOT IN ('lost', 'booked')"),
+            postgresql_where=text("pipeline_stage NOT IN ('lost', 'booked')"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     client_id: Mapped[int | None] = mapped_column(
@@ -39,7 +51,7 @@ class ExtensionLead(Base):
     )  # new/contacted/qualified/quoted/follow_up/booked/lost
 
     # Quote
-    quote_amount: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
+    quote_amount: Mapped[float | None] = mapped_column(Money, nullable=True)
     quote_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     quote_sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
@@ -1,14 +1,29 @@
 from datetime import datetime
 from sqlalchemy import (
-    Integer, String, Boolean, Text, DateTime, Numeric,
-    ForeignKey, func
+    Integer, String, Boolean, Text, DateTime,
+    ForeignKey, Index, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
+from app.models.types import Money
 
 
 class AftercareSequence(Base):
     __tablename__ = "aftercare_sequences"
+    __table_args__ = (
+        Index("ix_aftercare_sequences_created_at", "created_at"),
+        # D3 / W2 "due" scans only ever look at unsent sequences
+        Index(
+            "ix_aftercare_sequences_d3_pending", "appointment_id",
+            sqlite_where=text("d3_sent_at IS NULL"),
+            postgresql_where=text("d3_sent_at IS NULL"),
+        ),
+        Index(
+            "ix_aftercare_sequences_w2_pending", "appointment_id",
+            sqlite_where=text("w2_sent_at IS NULL AND d3_sent_at IS NOT NULL"),
+            postgresql_where=text("w2_sent_at IS NULL AND d3_sent_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     appointment_id: Mapped[int] = mapped_column(
@@ -42,13 +57,13 @@ class Report(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     report_month: Mapped[str] = mapped_column(String(7), unique=True, nullable=False)  # "2026-02"
-    revenue_total: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    revenue_total: Mapped[float] = mapped_column(Money, nullable=False)
     appointments_count: Mapped[int] = mapped_column(Integer, nullable=False)
     new_clients_count: Mapped[int] = mapped_column(Integer, nullable=False)
     lapsed_recovered: Mapped[int] = mapped_column(Integer, default=0)
     leads_converted: Mapped[int] = mapped_column(Integer, default=0)
     top_services_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
-    inventory_spend: Mapped[float] = mapped_column(Numeric(10, 2), default=0.00)
+    inventory_spend: Mapped[float] = mapped_column(Money, default=0)
     ai_summary_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     ai_generated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     charts_data_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON
@@ -0,0 +1,34 @@
+from datetime import date, datetime
+from sqlalchemy import Integer, String, Date, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+from app.models.types import Money
+
+
+class DailyRollup(Base):
+    """
+    Per-day activity totals, maintained by app.services.rollups as
+    appointments change status and clients are added. Appointment metrics
+    are bucketed by the appointment's start date, new clients by created_at.
+    """
+    __tablename__ = "daily_rollup"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    revenue: Mapped[float] = mapped_column(Money, nullable=False, default=0)  # completed only
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    no_show_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cancelled_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    new_clients_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now()
+    )
+
+
+class DailyServiceRollup(Base):
+    """Completed appointments and revenue per service per day."""
+    __tablename__ = "daily_service_rollup"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    service_type: Mapped[str] = mapped_column(String(60), primary_key=True)
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(Money, nullable=False, default=0)
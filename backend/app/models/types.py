@@ -0,0 +1,39 @@
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+_CENT = Decimal("1")
+
+
+def to_cents(amount) -> int | None:
+    """Dollar amount (int/float/Decimal/str) -> integer cents, rounded half-up."""
+    if amount is None:
+        return None
+    return int((Decimal(str(amount)) * 100).quantize(_CENT, rounding=ROUND_HALF_UP))
+
+
+class Money(TypeDecorator):
+    """
+    Money stored as integer cents.
+
+    The database only ever sees integers, so SUM/AVG over money columns are
+    exact and cheap on every backend (SQLite would otherwise store Numeric as
+    a float). Python code keeps working in dollars: values bind from any
+    numeric type and load as float dollars, including aggregates such as
+    func.sum(Appointment.price), which inherit this type.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return float
+
+    def process_bind_param(self, value, dialect):
+        return to_cents(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return int(value) / 100
@@ -0,0 +1,87 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are ordered on (sort column, id) and the cursor encodes the last row's
+pair, so fetching page N costs the same index seek as page 1 — unlike
+OFFSET, which re-reads and discards every earlier row.
+
+The cursor is opaque to clients: they pass back whatever they received in the
+X-Next-Cursor response header. An absent header means there are no more rows.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, and_, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    if isinstance(sort_value, (datetime, date)):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column) -> tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        python_type = sort_column.type.python_type
+        if sort_value is not None and python_type is datetime:
+            sort_value = datetime.fromisoformat(sort_value)
+        elif sort_value is not None and python_type is date:
+            sort_value = date.fromisoformat(sort_value)
+        return sort_value, int(row_id)
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset(
+    query: Select,
+    sort_column,
+    id_column,
+    cursor: str | None,
+    limit: int,
+    descending: bool = False,
+) -> Select:
+    """Order by (sort_column, id_column), seek past the cursor, fetch limit + 1."""
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, sort_column)
+        if descending:
+            query = query.where(
+                or_(
+                    sort_column < sort_value,
+                    and_(sort_column == sort_value, id_column < row_id),
+                )
+            )
+        else:
+            query = query.where(
+                or_(
+                    sort_column > sort_value,
+                    and_(sort_column == sort_value, id_column > row_id),
+                )
+            )
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    # One extra row tells us whether another page exists
+    return query.limit(limit + 1)
+
+
+def paginate(
+    rows: Sequence,
+    limit: int,
+    response: Response,
+    key: Callable[[Any], tuple[Any, int]],
+) -> list:
+    """Trim the look-ahead row and publish the next cursor, if any."""
+    rows = list(rows)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(rows[-1]))
+    return rows
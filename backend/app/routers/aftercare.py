@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.report import AftercareSequence
 from app.models.appointment import Appointment
 from app.models.client import Client
@@ -15,7 +15,7 @@ settings = get_settings()
 
 
 @router.get("/")
-async def list_sequences(db: AsyncSession = Depends(get_db)):
+async def list_sequences(db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(AftercareSequence, Appointment, Client)
         .join(Appointment, AftercareSequence.appointment_id == Appointment.id)
@@ -44,7 +44,7 @@ async def list_sequences(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/pending")
-async def get_pending_sequences(db: AsyncSession = Depends(get_db)):
+async def get_pending_sequences(db: AsyncSession = Depends(get_read_db)):
     """Sequences where D3 or W2 is due but not yet sent."""
     now = datetime.now()
     d3_threshold = now - timedelta(days=3)
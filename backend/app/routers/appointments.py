@@ -1,12 +1,23 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
-from app.database import get_db
+from app.conditional import conditional_get
+from app.database import get_db, get_read_db
 from app.models.appointment import Appointment
 from app.models.client import Client
-from app.schemas.appointment import AppointmentCreate, AppointmentUpdate, AppointmentRead, AppointmentListItem
-from app.services.google_calendar import google_calendar_service
+from app.pagination import keyset, paginate
+from app.models.appointment_series import AppointmentSeries
+from app.schemas.appointment import (
+    AppointmentBulkCreate, AppointmentCreate, AppointmentUpdate, AppointmentRead, AppointmentListItem
+)
+from app.services.appointment_batch import (
+    MAX_BULK_APPOINTMENTS, appointment_row, insert_appointments, series_rows
+)
+from app.services.booking import (
+    describe_overlaps, find_batch_overlaps, find_overlaps, holds_slot, lock_bookings
+)
+from app.services.calendar_outbox import queue_calendar_sync, queue_calendar_sync_many
 
 router = APIRouter(prefix="/appointments", tags=["appointments"])
 
@@ -17,17 +28,34 @@ def _enrich(appt: Appointment, client: Client | None) -> dict:
         **{c.key: getattr(appt, c.key) for c in appt.__table__.columns},
         "client_name": client.full_name if client else None,
         "client_phone": client.phone if client else None,
-        "price": float(appt.price),
-        "deposit_amount": float(appt.deposit_amount),
     }
 
 
+# Exactly the columns behind AppointmentListItem. List endpoints select these
+# directly and hand the Core rows to the response model, skipping ORM
+# hydration of both Appointment and Client.
+LIST_COLUMNS = (
+    Appointment.id,
+    Appointment.client_id,
+    Client.full_name.label("client_name"),
+    Appointment.service_type,
+    Appointment.price,
+    Appointment.status,
+    Appointment.start_datetime,
+    Appointment.end_datetime,
+    Appointment.deposit_paid,
+)
+
+
+def _list_query():
+    return select(*LIST_COLUMNS).join(Client, Appointment.client_id == Client.id)
+
+
 @router.get("/today", response_model=list[AppointmentListItem])
-async def get_today(db: AsyncSession = Depends(get_db)):
+async def get_today(db: AsyncSession = Depends(get_read_db)):
     today = datetime.now().date()
     result = await db.execute(
-        select(Appointment, Client)
-        .join(Client, Appointment.client_id == Client.id)
+        _list_query()
         .where(
             and_(
                 Appointment.start_datetime >= datetime.combine(today, datetime.min.time()),
@@ -37,21 +65,15 @@ async def get_today(db: AsyncSession = Depends(get_db)):
         )
         .order_by(Appointment.start_datetime)
     )
-    rows = result.all()
-    return [
-        {**{c.key: getattr(a, c.key) for c in a.__table__.columns},
-         "client_name": cl.full_name, "price": float(a.price), "deposit_amount": float(a.deposit_amount)}
-        for a, cl in rows
-    ]
+    return result.mappings().all()
 
 
 @router.get("/upcoming", response_model=list[AppointmentListItem])
-async def get_upcoming(days: int = 7, db: AsyncSession = Depends(get_db)):
+async def get_upcoming(days: int = 7, db: AsyncSession = Depends(get_read_db)):
     now = datetime.now()
     end = now + timedelta(days=days)
     result = await db.execute(
-        select(Appointment, Client)
-        .join(Client, Appointment.client_id == Client.id)
+        _list_query()
         .where(
             and_(
                 Appointment.start_datetime >= now,
@@ -61,28 +83,25 @@ async def get_upcoming(days: int = 7, db: AsyncSession = Depends(get_db)):
         )
         .order_by(Appointment.start_datetime)
     )
-    rows = result.all()
-    return [
-        {**{c.key: getattr(a, c.key) for c in a.__table__.columns},
-         "client_name": cl.full_name, "price": float(a.price), "deposit_amount": float(a.deposit_amount)}
-        for a, cl in rows
-    ]
+    return result.mappings().all()
 
 
 @router.get("/", response_model=list[AppointmentListItem])
 async def list_appointments(
+    request: Request,
+    response: Response,
     start_date: str | None = None,
     end_date: str | None = None,
     status: str | None = None,
     client_id: int | None = None,
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    query = (
-        select(Appointment, Client)
-        .join(Client, Appointment.client_id == Client.id)
-    )
+    if not_modified := await conditional_get(request, response, db, "appointments", "clients"):
+        return not_modified
+    query = _list_query()
     conditions = []
     if start_date:
         conditions.append(Appointment.start_datetime >= datetime.fromisoformat(start_date))
@@ -95,14 +114,22 @@ async def list_appointments(
     if conditions:
         query = query.where(and_(*conditions))
 
-    query = query.order_by(Appointment.start_datetime.desc()).offset(skip).limit(limit)
+    query = keyset(
+        query, Appointment.start_datetime, Appointment.id, cursor, limit, descending=True
+    )
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    rows = result.all()
-    return [
-        {**{c.key: getattr(a, c.key) for c in a.__table__.columns},
-         "client_name": cl.full_name, "price": float(a.price), "deposit_amount": float(a.deposit_amount)}
-        for a, cl in rows
-    ]
+    return paginate(
+        result.mappings().all(), limit, response,
+        lambda r: (r["start_datetime"], r["id"]),
+    )
+
+
+async def _reject_overlaps(db: AsyncSession, appt: Appointment) -> None:
+    """409 if a flushed appointment overlaps another booking (get_db rolls the write back)."""
+    if overlaps := await find_overlaps(db, appt):
+        raise HTTPException(status_code=409, detail=describe_overlaps(overlaps))
 
 
 @router.post("/", response_model=AppointmentRead, status_code=201)
@@ -127,24 +154,85 @@ async def create_appointment(data: AppointmentCreate, db: AsyncSession = Depends
         deposit_paid=data.deposit_paid,
         deposit_amount=data.deposit_amount,
     )
+    await lock_bookings(db)
     db.add(appt)
     await db.flush()
-
-    # Sync to Google Calendar
-    if google_calendar_service.is_configured():
-        event_id = await google_calendar_service.create_event(db, appt, client)
-        if event_id:
-            appt.google_event_id = event_id
+    await _reject_overlaps(db, appt)
+    queue_calendar_sync(db, appt, "create")
 
     await db.refresh(appt)
-    result = {**{c.key: getattr(appt, c.key) for c in appt.__table__.columns},
-               "client_name": client.full_name, "client_phone": client.phone,
-               "price": float(appt.price), "deposit_amount": float(appt.deposit_amount)}
-    return result
+    return _enrich(appt, client)
+
+
+@router.post("/bulk", status_code=201)
+async def bulk_create_appointments(data: AppointmentBulkCreate, db: AsyncSession = Depends(get_db)):
+    """
+    Book a batch of appointments and/or a recurring series, all or nothing.
+    409 lists every item that overlaps an existing booking or another item.
+    """
+    series = data.series
+    if series and not 1 <= series.interval_weeks <= 52:
+        raise HTTPException(status_code=400, detail="interval_weeks must be between 1 and 52")
+    if series and series.occurrences < 1:
+        raise HTTPException(status_code=400, detail="occurrences must be at least 1")
+    total = len(data.appointments) + (series.occurrences if series else 0)
+    if not total:
+        raise HTTPException(status_code=400, detail="Nothing to book")
+    if total > MAX_BULK_APPOINTMENTS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_BULK_APPOINTMENTS} appointments per request"
+        )
+    rows = [appointment_row(**item.model_dump()) for item in data.appointments]
+    if series:
+        rows += series_rows(series)
+
+    client_ids = {row["client_id"] for row in rows}
+    found = set((await db.execute(select(Client.id).where(Client.id.in_(client_ids)))).scalars())
+    if missing := client_ids - found:
+        raise HTTPException(status_code=404, detail=f"Client not found: {sorted(missing)}")
+
+    await lock_bookings(db)
+    if overlapping := sorted(await find_batch_overlaps(db, rows)):
+        raise HTTPException(
+            status_code=409,
+            detail="Overlapping bookings: " + ", ".join(
+                f"item {i} ({rows[i]['start_datetime']:%Y-%m-%d %H:%M})" for i in overlapping
+            ),
+        )
+
+    series_id = None
+    if series:
+        series_record = AppointmentSeries(**series.model_dump())
+        db.add(series_record)
+        await db.flush()
+        series_id = series_record.id
+        for row in rows[len(data.appointments):]:
+            row["series_id"] = series_id
+
+    ids = await insert_appointments(db, rows)
+    queued = await queue_calendar_sync_many(db, ids, "create")
+    await db.commit()
+
+    return {
+        "created": len(ids),
+        "series_id": series_id,
+        "calendar_sync_queued": queued,
+        "appointments": [
+            {"id": appt_id, "start_datetime": row["start_datetime"], "end_datetime": row["end_datetime"]}
+            for appt_id, row in zip(ids, rows)
+        ],
+    }
 
 
 @router.get("/{appointment_id}", response_model=AppointmentRead)
-async def get_appointment(appointment_id: int, db: AsyncSession = Depends(get_db)):
+async def get_appointment(
+    appointment_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    if not_modified := await conditional_get(request, response, db, "appointments", "clients"):
+        return not_modified
     result = await db.execute(
         select(Appointment, Client)
         .join(Client, Appointment.client_id == Client.id)
@@ -154,9 +242,7 @@ async def get_appointment(appointment_id: int, db: AsyncSession = Depends(get_db
     if not row:
         raise HTTPException(status_code=404, detail="Appointment not found")
     appt, client = row
-    return {**{c.key: getattr(appt, c.key) for c in appt.__table__.columns},
-            "client_name": client.full_name, "client_phone": client.phone,
-            "price": float(appt.price), "deposit_amount": float(appt.deposit_amount)}
+    return _enrich(appt, client)
 
 
 @router.put("/{appointment_id}", response_model=AppointmentRead)
@@ -180,15 +266,17 @@ async def update_appointment(
     if data.start_datetime or data.duration_minutes:
         appt.end_datetime = appt.start_datetime + timedelta(minutes=appt.duration_minutes)
 
-    # Sync to Google Calendar
-    if appt.google_event_id and google_calendar_service.is_configured():
-        await google_calendar_service.update_event(db, appt.google_event_id, appt, client)
+    # Moving, lengthening or reinstating a booking must not land on another
+    rebooked = data.start_datetime or data.duration_minutes or data.status
+    if rebooked and holds_slot(appt.status):
+        await lock_bookings(db)
+        await db.flush()
+        await _reject_overlaps(db, appt)
 
     await db.flush()
+    queue_calendar_sync(db, appt, "update")
     await db.refresh(appt)
-    return {**{c.key: getattr(appt, c.key) for c in appt.__table__.columns},
-            "client_name": client.full_name, "client_phone": client.phone,
-            "price": float(appt.price), "deposit_amount": float(appt.deposit_amount)}
+    return _enrich(appt, client)
 
 
 @router.delete("/{appointment_id}")
@@ -204,11 +292,7 @@ async def cancel_appointment(
 
     appt.status = "cancelled"
     appt.cancellation_reason = reason
-
-    # Delete from Google Calendar
-    if appt.google_event_id and google_calendar_service.is_configured():
-        await google_calendar_service.delete_event(db, appt.google_event_id)
-        appt.google_event_id = None
+    queue_calendar_sync(db, appt, "cancel")
 
     await db.commit()
 
@@ -272,7 +356,7 @@ async def complete_appointment(appointment_id: int, db: AsyncSession = Depends(g
     # Update client stats
     client.total_visits += 1
     client.last_visit_date = appt.start_datetime.date()
-    client.total_spent = float(client.total_spent) + float(appt.price)
+    client.total_spent = client.total_spent + appt.price
     client.is_lapsed = False
     if not client.first_visit_date:
         client.first_visit_date = appt.start_datetime.date()
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.services.availability import availability
+from app.services.calendar_outbox import outbox_summary
 from app.services.google_calendar import google_calendar_service
 from app.config import get_settings
+from app.instrumentation import query_budget
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
 settings = get_settings()
@@ -13,6 +18,8 @@ settings = get_settings()
 @router.get("/status")
 async def check_status(db: AsyncSession = Depends(get_db)):
     status = await google_calendar_service.check_connection(db)
+    # Appointment changes still waiting to reach Google (or given up on)
+    status["outbox"] = await outbox_summary(db)
     return status
 
 
@@ -41,46 +48,76 @@ async def oauth_callback(code: str, db: AsyncSession = Depends(get_db)):
 @router.get("/slots")
 async def get_available_slots(
     date: str,
-    duration: int = 60,
-    db: AsyncSession = Depends(get_db),
+    duration: int = Query(60, ge=1, le=24 * 60),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Get available booking slots for a date."""
+    """Get available booking slots for a date, from local appointment data."""
     from datetime import date as date_type
     try:
         check_date = date_type.fromisoformat(date)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-    slots = await google_calendar_service.get_available_slots(db, check_date, duration)
+    slots = await availability.available_slots(db, check_date, duration)
     return {"date": date, "duration_minutes": duration, "available_slots": slots}
 
 
-@router.post("/sync")
+@router.get("/next-available")
+async def get_next_available(
+    duration: int = Query(..., ge=1, le=24 * 60),
+    start: datetime | None = Query(None, alias="from"),
+    count: int = Query(5, ge=1, le=50),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """First `count` open slots that fit `duration` minutes, from `from` (default now) onwards."""
+    # Appointment times are naive salon-local datetimes
+    if start is None:
+        after = datetime.now()
+    elif start.tzinfo is not None:
+        after = start.astimezone(ZoneInfo(settings.salon_timezone)).replace(tzinfo=None)
+    else:
+        after = start
+    slots = await availability.next_available(
+        db, duration, after, count, settings.next_available_horizon_days
+    )
+    return {
+        "from": after.isoformat(),
+        "duration_minutes": duration,
+        "horizon_days": settings.next_available_horizon_days,
+        "available_slots": [slot.isoformat() for slot in slots],
+    }
+
+
+# Token read + refresh, the appointment lookup, the status UPDATE and what the
+# write hooks add: review counter, daily and per-service rollups, change log
+@router.post("/sync", dependencies=[Depends(query_budget(8))])
 async def sync_from_google(db: AsyncSession = Depends(get_db)):
     """Pull events from Google Calendar and surface any discrepancies."""
     from app.models.appointment import Appointment
 
     events = await google_calendar_service.sync_from_google(db)
+    events = [event for event in events if event.get("id")]
+
+    # One lookup for every event instead of a SELECT per event
+    appts_by_event_id = {}
+    event_ids = [event["id"] for event in events]
+    for start in range(0, len(event_ids), 500):
+        result = await db.execute(
+            select(Appointment).where(Appointment.google_event_id.in_(event_ids[start:start + 500]))
+        )
+        appts_by_event_id.update({appt.google_event_id: appt for appt in result.scalars()})
 
     synced = 0
     needs_review = []
 
     for event in events:
-        event_id = event.get("id")
-        if not event_id:
-            continue
-
-        # Check if we have this event
-        result = await db.execute(
-            select(Appointment).where(Appointment.google_event_id == event_id)
-        )
-        appt = result.scalar_one_or_none()
+        event_id = event["id"]
+        appt = appts_by_event_id.get(event_id)
 
         if appt:
             # Check if times match
             event_start = event.get("start", {}).get("dateTime", "")
             if event_start:
-                from datetime import datetime
                 try:
                     gcal_start = datetime.fromisoformat(event_start.replace("Z", "+00:00")).replace(tzinfo=None)
                     db_start = appt.start_datetime
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.communication import ChatSession
 from app.schemas.communication import ChatSessionCreate, ChatSessionRead, SendMessageRequest
 from app.services.ai.chat_agent import stream_chat_response
@@ -29,7 +29,7 @@ async def create_session(data: ChatSessionCreate, db: AsyncSession = Depends(get
 
 
 @router.get("/session/{token}/history", response_model=ChatSessionRead)
-async def get_session_history(token: str, db: AsyncSession = Depends(get_db)):
+async def get_session_history(token: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(ChatSession).where(ChatSession.session_token == token)
     )
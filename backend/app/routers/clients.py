@@ -1,12 +1,15 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_, and_, func
-from app.database import get_db
+from app.conditional import conditional_get
+from app.database import get_db, get_read_db
 from app.models.client import Client, WaitlistEntry
 from app.models.appointment import Appointment
+from app.pagination import keyset, paginate
 from app.schemas.client import (
-    ClientCreate, ClientUpdate, ClientRead, ClientListItem, WaitlistEntryCreate, WaitlistEntryRead
+    ClientCreate, ClientUpdate, ClientRead, ClientListItem, WaitlistEntryCreate, WaitlistEntryRead,
+    ClientImport,
 )
 
 router = APIRouter(prefix="/clients", tags=["clients"])
@@ -14,11 +17,16 @@ router = APIRouter(prefix="/clients", tags=["clients"])
 
 @router.get("/", response_model=list[ClientListItem])
 async def list_clients(
+    request: Request,
+    response: Response,
     search: str | None = Query(None),
-    skip: int = 0,
-    limit: int = 50,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=500),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_read_db),
 ):
+    if not_modified := await conditional_get(request, response, db, "clients"):
+        return not_modified
     query = select(Client)
     if search:
         query = query.where(
@@ -28,9 +36,11 @@ async def list_clients(
                 Client.email.ilike(f"%{search}%"),
             )
         )
-    query = query.order_by(Client.full_name).offset(skip).limit(limit)
+    query = keyset(query, Client.full_name, Client.id, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    return result.scalars().all()
+    return paginate(result.scalars().all(), limit, response, lambda c: (c.full_name, c.id))
 
 
 @router.post("/", response_model=ClientRead, status_code=201)
@@ -47,8 +57,21 @@ async def create_client(data: ClientCreate, db: AsyncSession = Depends(get_db)):
     return client
 
 
+@router.post("/import")
+async def import_clients(data: ClientImport, db: AsyncSession = Depends(get_db)):
+    """
+    Bulk-load clients and historical appointments (e.g. from a previous booking
+    tool). Valid rows are imported; invalid ones are listed under "errors".
+    """
+    from app.services.importer import import_records
+
+    summary = await import_records(db, data.clients, data.appointments)
+    await db.commit()
+    return summary
+
+
 @router.get("/lapsed", response_model=list[ClientListItem])
-async def list_lapsed_clients(db: AsyncSession = Depends(get_db)):
+async def list_lapsed_clients(db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(Client)
         .where(Client.is_lapsed == True)  # noqa: E712
@@ -58,7 +81,14 @@ async def list_lapsed_clients(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{client_id}", response_model=ClientRead)
-async def get_client(client_id: int, db: AsyncSession = Depends(get_db)):
+async def get_client(
+    client_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    if not_modified := await conditional_get(request, response, db, "clients"):
+        return not_modified
     result = await db.execute(select(Client).where(Client.id == client_id))
     client = result.scalar_one_or_none()
     if not client:
@@ -83,7 +113,7 @@ async def update_client(
 
 
 @router.get("/{client_id}/timeline")
-async def get_client_timeline(client_id: int, db: AsyncSession = Depends(get_db)):
+async def get_client_timeline(client_id: int, db: AsyncSession = Depends(get_read_db)):
     """Return the full communication + appointment timeline for a client."""
     from app.models.communication import SmsMessage
     from app.models.report import AftercareSequence
@@ -118,7 +148,7 @@ async def get_client_timeline(client_id: int, db: AsyncSession = Depends(get_db)
             "phone": client.phone,
             "email": client.email,
             "total_visits": client.total_visits,
-            "total_spent": float(client.total_spent),
+            "total_spent": client.total_spent,
             "is_lapsed": client.is_lapsed,
             "hair_profile": client.hair_profile,
         },
@@ -127,7 +157,7 @@ async def get_client_timeline(client_id: int, db: AsyncSession = Depends(get_db)
                 "id": a.id,
                 "service_type": a.service_type,
                 "status": a.status,
-                "price": float(a.price),
+                "price": a.price,
                 "start_datetime": a.start_datetime.isoformat(),
                 "notes": a.notes,
             }
@@ -218,10 +248,15 @@ async def add_to_waitlist(data: WaitlistEntryCreate, db: AsyncSession = Depends(
 
 
 @router.get("/waitlist/", response_model=list[WaitlistEntryRead])
-async def list_waitlist(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(WaitlistEntry)
-        .where(WaitlistEntry.status == "waiting")
-        .order_by(WaitlistEntry.created_at.asc())
+async def list_waitlist(
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+):
+    query = keyset(
+        select(WaitlistEntry).where(WaitlistEntry.status == "waiting"),
+        WaitlistEntry.created_at, WaitlistEntry.id, cursor, limit,
     )
-    return result.scalars().all()
+    result = await db.execute(query)
+    return paginate(result.scalars().all(), limit, response, lambda e: (e.created_at, e.id))
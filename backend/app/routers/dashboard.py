@@ -1,20 +1,38 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
-from app.database import get_db
+from app.cache import dashboard_cache
+from app.config import get_settings
+from app.database import ReadSessionLocal, begin_read_snapshot, get_read_db
+from app.instrumentation import query_budget
 from app.models.appointment import Appointment
 from app.models.client import Client
 from app.models.lead import ExtensionLead
 from app.models.report import AftercareSequence
 from app.models.inventory import InventoryProduct
 from app.models.communication import SmsMessage
+from app.models.types import to_cents
+from app.services.counters import counter_value
+from app.services.dashboard_stream import DashboardBroadcaster
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
-@router.get("/alerts")
-async def get_alerts(db: AsyncSession = Depends(get_db)):
+ALERTS_DEPENDS_ON = ("inventory", "clients", "leads", "aftercare", "appointments")
+TODAY_DEPENDS_ON = ("appointments", "clients")
+BOOTSTRAP_DEPENDS_ON = ALERTS_DEPENDS_ON
+
+
+@router.get("/alerts", dependencies=[Depends(query_budget(1))])
+async def get_alerts(db: AsyncSession = Depends(get_read_db)):
+    return await dashboard_cache.get_or_compute(
+        "alerts", ALERTS_DEPENDS_ON, lambda: _compute_alerts(db)
+    )
+
+
+async def _compute_alerts(db: AsyncSession) -> dict:
     """
     Aggregated alert panel — surfaces all items that need attention:
     - Low-stock inventory
@@ -25,19 +43,83 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
     - No-show appointments pending re-engagement
     """
     now = datetime.now()
-    alerts = []
+    d3_threshold = now - timedelta(days=3)
+    w2_threshold = now - timedelta(days=14)
+    no_show_threshold = now - timedelta(days=7)
 
-    # --- Low stock ---
-    low_stock_result = await db.execute(
-        select(InventoryProduct).where(
+    # Every count as a scalar subquery in a one-row derived table, LEFT JOINed
+    # to the low-stock products — the whole panel is one round trip, and the
+    # counts still come back when nothing is low on stock.
+    counts = select(
+        counter_value("lapsed_clients").label("lapsed_count"),
+        select(func.count(ExtensionLead.id))
+        .where(
+            and_(
+                ExtensionLead.next_follow_up_at <= now,
+                ExtensionLead.pipeline_stage.notin_(["lost", "booked"]),
+            )
+        )
+        .scalar_subquery().label("overdue_leads"),
+        select(func.count(AftercareSequence.id))
+        .join(Appointment, AftercareSequence.appointment_id == Appointment.id)
+        .where(
+            and_(
+                AftercareSequence.d3_sent_at.is_(None),
+                Appointment.end_datetime <= d3_threshold,
+                Appointment.status == "completed",
+            )
+        )
+        .scalar_subquery().label("d3_count"),
+        select(func.count(AftercareSequence.id))
+        .join(Appointment, AftercareSequence.appointment_id == Appointment.id)
+        .where(
+            and_(
+                AftercareSequence.w2_sent_at.is_(None),
+                AftercareSequence.d3_sent_at.is_not(None),
+                Appointment.end_datetime <= w2_threshold,
+                Appointment.status == "completed",
+            )
+        )
+        .scalar_subquery().label("w2_count"),
+        counter_value("needs_review_appointments").label("conflicts_count"),
+        select(func.count(Appointment.id))
+        .where(
+            and_(
+                Appointment.status == "no_show",
+                Appointment.start_datetime >= no_show_threshold,
+            )
+        )
+        .scalar_subquery().label("no_show_count"),
+    ).subquery("counts")
+
+    result = await db.execute(
+        select(
+            counts,
+            InventoryProduct.id,
+            InventoryProduct.name,
+            InventoryProduct.current_stock,
+            InventoryProduct.stock_unit,
+            InventoryProduct.reorder_threshold,
+        )
+        .select_from(counts)
+        .outerjoin(
+            InventoryProduct,
             and_(
                 InventoryProduct.is_active == True,  # noqa: E712
                 InventoryProduct.current_stock <= InventoryProduct.reorder_threshold,
-            )
+            ),
         )
+        # Same order the old per-panel query produced via the active/category/name index
+        .order_by(InventoryProduct.category, InventoryProduct.name, InventoryProduct.id)
     )
-    low_stock_items = low_stock_result.scalars().all()
-    for item in low_stock_items:
+    rows = result.all()
+    totals = rows[0]
+    alerts = []
+
+    # --- Low stock ---
+    for item in rows:
+        if item.id is None:
+            continue
         alerts.append(
             {
                 "type": "low_stock",
@@ -50,10 +132,7 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
         )
 
     # --- Lapsed clients ---
-    lapsed_result = await db.execute(
-        select(func.count(Client.id)).where(Client.is_lapsed == True)  # noqa: E712
-    )
-    lapsed_count = lapsed_result.scalar() or 0
+    lapsed_count = totals.lapsed_count or 0
     if lapsed_count > 0:
         alerts.append(
             {
@@ -67,15 +146,7 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
         )
 
     # --- Overdue lead follow-ups ---
-    overdue_leads_result = await db.execute(
-        select(func.count(ExtensionLead.id)).where(
-            and_(
-                ExtensionLead.next_follow_up_at <= now,
-                ExtensionLead.pipeline_stage.notin_(["lost", "booked"]),
-            )
-        )
-    )
-    overdue_leads = overdue_leads_result.scalar() or 0
+    overdue_leads = totals.overdue_leads or 0
     if overdue_leads > 0:
         alerts.append(
             {
@@ -89,19 +160,7 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
         )
 
     # --- Aftercare D3 due ---
-    d3_threshold = now - timedelta(days=3)
-    d3_result = await db.execute(
-        select(func.count(AftercareSequence.id))
-        .join(Appointment, AftercareSequence.appointment_id == Appointment.id)
-        .where(
-            and_(
-                AftercareSequence.d3_sent_at.is_(None),
-                Appointment.end_datetime <= d3_threshold,
-                Appointment.status == "completed",
-            )
-        )
-    )
-    d3_count = d3_result.scalar() or 0
+    d3_count = totals.d3_count or 0
     if d3_count > 0:
         alerts.append(
             {
@@ -115,20 +174,7 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
         )
 
     # --- Aftercare W2 due ---
-    w2_threshold = now - timedelta(days=14)
-    w2_result = await db.execute(
-        select(func.count(AftercareSequence.id))
-        .join(Appointment, AftercareSequence.appointment_id == Appointment.id)
-        .where(
-            and_(
-                AftercareSequence.w2_sent_at.is_(None),
-                AftercareSequence.d3_sent_at.is_not(None),
-                Appointment.end_datetime <= w2_threshold,
-                Appointment.status == "completed",
-            )
-        )
-    )
-    w2_count = w2_result.scalar() or 0
+    w2_count = totals.w2_count or 0
     if w2_count > 0:
         alerts.append(
             {
@@ -142,12 +188,7 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
         )
 
     # --- Calendar conflicts (needs_review) ---
-    conflicts_result = await db.execute(
-        select(func.count(Appointment.id)).where(
-            Appointment.status == "needs_review"
-        )
-    )
-    conflicts_count = conflicts_result.scalar() or 0
+    conflicts_count = totals.conflicts_count or 0
     if conflicts_count > 0:
         alerts.append(
             {
@@ -161,16 +202,7 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
         )
 
     # --- No-shows needing re-engagement ---
-    no_show_threshold = now - timedelta(days=7)
-    no_show_result = await db.execute(
-        select(func.count(Appointment.id)).where(
-            and_(
-                Appointment.status == "no_show",
-                Appointment.start_datetime >= no_show_threshold,
-            )
-        )
-    )
-    no_show_count = no_show_result.scalar() or 0
+    no_show_count = totals.no_show_count or 0
     if no_show_count > 0:
         alerts.append(
             {
@@ -191,14 +223,28 @@ async def get_alerts(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/today")
-async def get_today_overview(db: AsyncSession = Depends(get_db)):
+async def get_today_overview(db: AsyncSession = Depends(get_read_db)):
     """Today's schedule and quick stats."""
     now = datetime.now()
+    return await dashboard_cache.get_or_compute(
+        "today", TODAY_DEPENDS_ON, lambda: _compute_today(db, now), key=now.date()
+    )
+
+
+async def _compute_today(db: AsyncSession, now: datetime) -> dict:
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
 
     result = await db.execute(
-        select(Appointment, Client)
+        select(
+            Appointment.id,
+            Appointment.service_type,
+            Appointment.start_datetime,
+            Appointment.end_datetime,
+            Appointment.status,
+            Appointment.price,
+            Client.full_name,
+        )
         .join(Client, Appointment.client_id == Client.id)
         .where(
             and_(
@@ -212,19 +258,19 @@ async def get_today_overview(db: AsyncSession = Depends(get_db)):
     rows = result.all()
 
     appointments = []
-    total_revenue = 0.0
-    for appt, client in rows:
+    revenue_cents = 0
+    for appt in rows:
         if appt.status == "completed" and appt.price:
-            total_revenue += float(appt.price)
+            revenue_cents += to_cents(appt.price)
         appointments.append(
             {
                 "id": appt.id,
-                "client_name": client.full_name,
+                "client_name": appt.full_name,
                 "service_type": appt.service_type,
                 "start_time": appt.start_datetime.strftime("%H:%M"),
                 "end_time": appt.end_datetime.strftime("%H:%M") if appt.end_datetime else None,
                 "status": appt.status,
-                "price": float(appt.price) if appt.price else None,
+                "price": appt.price if appt.price else None,
             }
         )
 
@@ -233,5 +279,70 @@ async def get_today_overview(db: AsyncSession = Depends(get_db)):
         "appointments": appointments,
         "total_appointments": len(appointments),
         "completed_count": sum(1 for a in appointments if a["status"] == "completed"),
-        "revenue_today": total_revenue,
+        "revenue_today": revenue_cents / 100,
+    }
+
+
+@router.get("/bootstrap")
+async def get_bootstrap(db: AsyncSession = Depends(get_read_db)):
+    """
+    Everything the dashboard needs on first load — KPIs, alerts, today and
+    the next 7 days — in one response, all read from the same snapshot.
+    """
+    now = datetime.now()
+    return await dashboard_cache.get_or_compute(
+        "bootstrap", BOOTSTRAP_DEPENDS_ON, lambda: _compute_bootstrap(db, now), key=now.date()
+    )
+
+
+async def _compute_bootstrap(db: AsyncSession, now: datetime) -> dict:
+    from app.routers.appointments import get_upcoming
+    from app.routers.reports import _compute_dashboard_stats
+
+    # One session runs its statements one after another; what matters is that
+    # they all see the same committed state
+    await begin_read_snapshot(db)
+    return {
+        "stats": await _compute_dashboard_stats(db),
+        "alerts": await _compute_alerts(db),
+        "today": await _compute_today(db, now),
+        "upcoming": [dict(row) for row in await get_upcoming(days=7, db=db)],
     }
+
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """Hit/miss/invalidation counters for the cached dashboard views."""
+    return dashboard_cache.stats()
+
+
+async def _dashboard_snapshot() -> dict:
+    from app.routers.reports import get_dashboard_stats
+
+    async with ReadSessionLocal() as db:
+        return {
+            "kpis": await get_dashboard_stats(db),
+            "alerts": await get_alerts(db),
+            "today": await get_today_overview(db),
+        }
+
+
+broadcaster = DashboardBroadcaster(
+    _dashboard_snapshot, refresh_seconds=get_settings().dashboard_cache_ttl_seconds or 60
+)
+dashboard_cache.add_listener(broadcaster.notify)
+
+
+@router.get("/stream")
+async def stream_dashboard(last_event_id: str | None = Header(None)):
+    """
+    Server-sent events replacing the 60-second dashboard polls: a snapshot on
+    connect, then kpis/alerts/today deltas as writes land, with a heartbeat
+    comment every 15 s. EventSource resends Last-Event-ID on reconnect and
+    missed events are replayed.
+    """
+    return StreamingResponse(
+        broadcaster.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,94 @@
+"""
+Bulk CSV / NDJSON exports for accounting.
+
+Rows are read through a server-side cursor (yield_per) and written out one
+batch at a time, so a multi-year export runs in constant memory and yields
+to the event loop between batches instead of holding up other requests.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Literal
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from app.database import ReadSessionLocal
+from app.models.appointment import Appointment
+from app.models.client import Client
+from app.models.communication import SmsMessage
+from app.models.inventory import InventoryTransaction
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+# Dataset -> (model, column the from/to range applies to)
+EXPORTS = {
+    "clients": (Client, Client.created_at),
+    "appointments": (Appointment, Appointment.start_datetime),
+    "sms_messages": (SmsMessage, SmsMessage.created_at),
+    "inventory_transactions": (InventoryTransaction, InventoryTransaction.created_at),
+}
+
+BATCH_SIZE = 1000
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def _cell(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+async def _stream_rows(query, columns: list[str], fmt: str):
+    async with ReadSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=BATCH_SIZE))
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue()
+            async for batch in result.partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows([[_cell(v) for v in row] for row in batch])
+                yield buffer.getvalue()
+        else:
+            async for batch in result.partitions():
+                yield "".join(
+                    json.dumps({c: _cell(v) for c, v in zip(columns, row)}) + "\n"
+                    for row in batch
+                )
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: Literal["csv", "ndjson"] = "csv",
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+):
+    """Stream a whole table as CSV or NDJSON, optionally limited to [from, to)."""
+    if dataset not in EXPORTS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown export. Available: {', '.join(EXPORTS)}",
+        )
+    model, range_column = EXPORTS[dataset]
+    table_columns = list(model.__table__.columns)
+
+    query = select(*table_columns).order_by(model.id)
+    if date_from:
+        query = query.where(range_column >= datetime.combine(date_from, datetime.min.time()))
+    if date_to:
+        query = query.where(range_column < datetime.combine(date_to, datetime.min.time()))
+
+    filename = f"{dataset}-{date.today().isoformat()}.{format}"
+    return StreamingResponse(
+        _stream_rows(query, [c.key for c in table_columns], format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,10 +1,13 @@
 import json
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from app.database import get_db
+from sqlalchemy import select, and_, func, insert
+from app.conditional import conditional_get
+from app.database import get_db, get_read_db
 from app.models.inventory import InventoryProduct, InventoryTransaction, PurchaseOrder
+from app.instrumentation import query_budget
+from app.pagination import keyset, paginate
 from app.schemas.inventory import (
     ProductCreate, ProductUpdate, ProductRead,
     StockAdjustment, TransactionRead,
@@ -14,12 +17,44 @@ from app.services.ai.reorder_advisor import get_reorder_recommendations
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
+# Columns behind ProductRead, with the low-stock flag computed in SQL. Read
+# endpoints select these directly and skip ORM hydration.
+PRODUCT_COLUMNS = (
+    InventoryProduct.id,
+    InventoryProduct.name,
+    InventoryProduct.sku,
+    InventoryProduct.category,
+    InventoryProduct.supplier_name,
+    InventoryProduct.supplier_contact,
+    InventoryProduct.unit_cost,
+    InventoryProduct.retail_price,
+    InventoryProduct.current_stock,
+    InventoryProduct.stock_unit,
+    InventoryProduct.reorder_threshold,
+    InventoryProduct.reorder_quantity,
+    InventoryProduct.last_ordered_at,
+    InventoryProduct.last_restocked_at,
+    InventoryProduct.notes,
+    InventoryProduct.is_active,
+    InventoryProduct.created_at,
+    InventoryProduct.updated_at,
+    (InventoryProduct.current_stock <= InventoryProduct.reorder_threshold).label("is_low_stock"),
+)
+
 
 @router.get("/alerts")
-async def get_stock_alerts(db: AsyncSession = Depends(get_db)):
+async def get_stock_alerts(db: AsyncSession = Depends(get_read_db)):
     """Return products that are at or below reorder threshold."""
     result = await db.execute(
-        select(InventoryProduct)
+        select(
+            InventoryProduct.id,
+            InventoryProduct.name,
+            InventoryProduct.sku,
+            InventoryProduct.current_stock,
+            InventoryProduct.reorder_threshold,
+            InventoryProduct.stock_unit,
+            InventoryProduct.category,
+        )
         .where(
             and_(
                 InventoryProduct.is_active == True,  # noqa: E712
@@ -28,7 +63,7 @@ async def get_stock_alerts(db: AsyncSession = Depends(get_db)):
         )
         .order_by(InventoryProduct.current_stock.asc())
     )
-    products = result.scalars().all()
+    products = result.all()
     return [
         {
             "id": p.id,
@@ -128,30 +163,22 @@ async def get_reorder_advice(db: AsyncSession = Depends(get_db)):
 
 @router.get("/products", response_model=list[ProductRead])
 async def list_products(
+    request: Request,
+    response: Response,
     category: str | None = None,
     low_stock_only: bool = False,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    query = select(InventoryProduct).where(InventoryProduct.is_active == True)  # noqa: E712
+    if not_modified := await conditional_get(request, response, db, "inventory"):
+        return not_modified
+    query = select(*PRODUCT_COLUMNS).where(InventoryProduct.is_active == True)  # noqa: E712
     if category:
         query = query.where(InventoryProduct.category == category)
     if low_stock_only:
         query = query.where(InventoryProduct.current_stock <= InventoryProduct.reorder_threshold)
     query = query.order_by(InventoryProduct.category, InventoryProduct.name)
     result = await db.execute(query)
-    products = result.scalars().all()
-    return [
-        {
-            **{c.key: getattr(p, c.key) for c in p.__table__.columns},
-            "current_stock": float(p.current_stock),
-            "reorder_threshold": float(p.reorder_threshold),
-            "unit_cost": float(p.unit_cost) if p.unit_cost else None,
-            "retail_price": float(p.retail_price) if p.retail_price else None,
-            "reorder_quantity": float(p.reorder_quantity) if p.reorder_quantity else None,
-            "is_low_stock": float(p.current_stock) <= float(p.reorder_threshold),
-        }
-        for p in products
-    ]
+    return result.mappings().all()
 
 
 @router.post("/products", response_model=ProductRead, status_code=201)
@@ -168,33 +195,39 @@ async def create_product(data: ProductCreate, db: AsyncSession = Depends(get_db)
 
 
 @router.get("/products/{product_id}")
-async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(InventoryProduct).where(InventoryProduct.id == product_id))
-    product = result.scalar_one_or_none()
+async def get_product(
+    product_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    if not_modified := await conditional_get(request, response, db, "inventory"):
+        return not_modified
+    result = await db.execute(select(*PRODUCT_COLUMNS).where(InventoryProduct.id == product_id))
+    product = result.mappings().one_or_none()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
     # Get recent transactions
     tx_result = await db.execute(
-        select(InventoryTransaction)
+        select(*InventoryTransaction.__table__.columns)
         .where(InventoryTransaction.product_id == product_id)
         .order_by(InventoryTransaction.created_at.desc())
         .limit(20)
     )
-    transactions = tx_result.scalars().all()
 
     return {
         "product": {
-            **{c.key: getattr(product, c.key) for c in product.__table__.columns},
-            "current_stock": float(product.current_stock),
-            "reorder_threshold": float(product.reorder_threshold),
-            "is_low_stock": float(product.current_stock) <= float(product.reorder_threshold),
+            **product,
+            "current_stock": float(product["current_stock"]),
+            "reorder_threshold": float(product["reorder_threshold"]),
+            "is_low_stock": bool(product["is_low_stock"]),
         },
         "recent_transactions": [
-            {**{c.key: getattr(t, c.key) for c in t.__table__.columns},
-             "quantity_change": float(t.quantity_change),
-             "quantity_after": float(t.quantity_after)}
-            for t in transactions
+            {**t,
+             "quantity_change": float(t["quantity_change"]),
+             "quantity_after": float(t["quantity_after"])}
+            for t in tx_result.mappings()
         ],
     }
 
@@ -249,11 +282,18 @@ async def adjust_stock(
 
 
 @router.get("/purchase-orders", response_model=list[PurchaseOrderRead])
-async def list_purchase_orders(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(PurchaseOrder).order_by(PurchaseOrder.created_at.desc())
+async def list_purchase_orders(
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+):
+    query = keyset(
+        select(PurchaseOrder), PurchaseOrder.created_at, PurchaseOrder.id,
+        cursor, limit, descending=True,
     )
-    return result.scalars().all()
+    result = await db.execute(query)
+    return paginate(result.scalars().all(), limit, response, lambda po: (po.created_at, po.id))
 
 
 @router.post("/purchase-orders", response_model=PurchaseOrderRead, status_code=201)
@@ -265,7 +305,9 @@ async def create_purchase_order(data: PurchaseOrderCreate, db: AsyncSession = De
     return po
 
 
-@router.put("/purchase-orders/{po_id}")
+# PO, products, then the autoflushed PO/stock UPDATEs with their low-stock
+# counter and change-log writes, and the ledger INSERT
+@router.put("/purchase-orders/{po_id}", dependencies=[Depends(query_budget(7))])
 async def update_purchase_order(
     po_id: int,
     status: str,
@@ -283,24 +325,32 @@ async def update_purchase_order(
         # Update stock for each item in the order
         try:
             items = json.loads(po.items_json)
-            for item in items:
-                product_result = await db.execute(
-                    select(InventoryProduct).where(InventoryProduct.id == item["product_id"])
+            # Load every product on the order in one query
+            product_result = await db.execute(
+                select(InventoryProduct).where(
+                    InventoryProduct.id.in_({item["product_id"] for item in items})
                 )
-                product = product_result.scalar_one_or_none()
+            )
+            products = {p.id: p for p in product_result.scalars()}
+            transactions = []
+            for item in items:
+                product = products.get(item["product_id"])
                 if product:
                     qty = float(item.get("qty", 0))
                     new_stock = float(product.current_stock) + qty
-                    db.add(InventoryTransaction(
-                        product_id=product.id,
-                        transaction_type="received",
-                        quantity_change=qty,
-                        quantity_after=new_stock,
-                        note=f"Purchase order #{po_id}",
-                    ))
+                    transactions.append({
+                        "product_id": product.id,
+                        "transaction_type": "received",
+                        "quantity_change": qty,
+                        "quantity_after": new_stock,
+                        "note": f"Purchase order #{po_id}",
+                    })
                     product.current_stock = new_stock
                     product.last_ordered_at = po.ordered_at
                     product.last_restocked_at = datetime.now()
+            # One executemany for the ledger rows rather than an INSERT per line
+            if transactions:
+                await db.execute(insert(InventoryTransaction), transactions)
         except Exception as e:
             print(f"Error updating stock from PO: {e}")
     await db.commit()
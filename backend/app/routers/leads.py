@@ -1,12 +1,14 @@
 import json
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from app.database import get_db
+from app.conditional import conditional_get
+from app.database import get_db, get_read_db
 from app.models.lead import ExtensionLead
 from app.models.communication import SmsMessage
+from app.pagination import keyset, paginate
 from app.schemas.lead import LeadCreate, LeadUpdate, LeadRead, LeadPipelineSummary
 from app.services.ai.lead_qualifier import qualify_lead, generate_quote_stream, draft_follow_up_sms
 from app.services.twilio_service import twilio_service
@@ -15,7 +17,7 @@ router = APIRouter(prefix="/leads", tags=["leads"])
 
 
 @router.get("/pipeline-summary", response_model=LeadPipelineSummary)
-async def get_pipeline_summary(db: AsyncSession = Depends(get_db)):
+async def get_pipeline_summary(db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(ExtensionLead.pipeline_stage, func.count(ExtensionLead.id))
         .group_by(ExtensionLead.pipeline_stage)
@@ -26,17 +28,26 @@ async def get_pipeline_summary(db: AsyncSession = Depends(get_db)):
 
 @router.get("/", response_model=list[LeadRead])
 async def list_leads(
+    request: Request,
+    response: Response,
     stage: str | None = Query(None),
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_read_db),
 ):
+    if not_modified := await conditional_get(request, response, db, "leads"):
+        return not_modified
     query = select(ExtensionLead)
     if stage:
         query = query.where(ExtensionLead.pipeline_stage == stage)
-    query = query.order_by(ExtensionLead.created_at.desc()).offset(skip).limit(limit)
+    query = keyset(
+        query, ExtensionLead.created_at, ExtensionLead.id, cursor, limit, descending=True
+    )
+    if skip and not cursor:
+        query = query.offset(skip)
     result = await db.execute(query)
-    return result.scalars().all()
+    return paginate(result.scalars().all(), limit, response, lambda lead: (lead.created_at, lead.id))
 
 
 @router.post("/", response_model=LeadRead, status_code=201)
@@ -49,7 +60,14 @@ async def create_lead(data: LeadCreate, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{lead_id}", response_model=LeadRead)
-async def get_lead(lead_id: int, db: AsyncSession = Depends(get_db)):
+async def get_lead(
+    lead_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
+    if not_modified := await conditional_get(request, response, db, "leads"):
+        return not_modified
     result = await db.execute(select(ExtensionLead).where(ExtensionLead.id == lead_id))
     lead = result.scalar_one_or_none()
     if not lead:
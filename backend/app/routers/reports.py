@@ -1,20 +1,31 @@
 from datetime import datetime, date
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, extract
-from app.database import get_db
+from app.cache import analytics_cache, dashboard_cache
+from app.conditional import conditional_get
+from app.database import get_db, get_read_db
 from app.models.report import Report, AftercareSequence
 from app.models.appointment import Appointment
 from app.models.client import Client
-from app.models.lead import ExtensionLead
+from app.models.rollup import DailyRollup
 from app.services.ai.report_generator import generate_report_stream
+from app.services.counters import read_counters
+from app.services.jobs import enqueue_job, job_worker
+from app.services.report_builder import month_bounds, month_range
+from app.services.retention import cohort_retention, last_closed_month
+from app.services.rollups import rebuild_rollups
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+MAX_BACKFILL_MONTHS = 120
+
 
 @router.get("/")
-async def list_reports(db: AsyncSession = Depends(get_db)):
+async def list_reports(request: Request, response: Response, db: AsyncSession = Depends(get_read_db)):
+    if not_modified := await conditional_get(request, response, db, "reports"):
+        return not_modified
     result = await db.execute(
         select(Report).order_by(Report.report_month.desc()).limit(24)
     )
@@ -34,50 +45,38 @@ async def list_reports(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/dashboard-stats")
-async def get_dashboard_stats(db: AsyncSession = Depends(get_db)):
+async def get_dashboard_stats(db: AsyncSession = Depends(get_read_db)):
     """Real-time KPIs for the dashboard."""
+    return await dashboard_cache.get_or_compute(
+        "dashboard_stats",
+        ("appointments", "clients", "leads", "inventory"),
+        lambda: _compute_dashboard_stats(db),
+    )
+
+
+async def _compute_dashboard_stats(db: AsyncSession) -> dict:
     now = datetime.now()
     current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-    # Revenue this month
-    revenue_result = await db.execute(
-        select(func.sum(Appointment.price)).where(
-            and_(
-                Appointment.status == "completed",
-                Appointment.start_datetime >= current_month_start,
-            )
-        )
-    )
-    revenue_month = revenue_result.scalar() or 0.0
-
-    # Appointments this month
-    appt_result = await db.execute(
-        select(func.count(Appointment.id)).where(
-            and_(
-                Appointment.status == "completed",
-                Appointment.start_datetime >= current_month_start,
-            )
-        )
+    # Revenue and completed appointments this month
+    month_result = await db.execute(
+        select(
+            func.sum(DailyRollup.revenue),
+            func.sum(DailyRollup.completed_count),
+        ).where(DailyRollup.day >= current_month_start.date())
     )
-    appts_month = appt_result.scalar() or 0
+    revenue_month, appts_month = month_result.one()
+    revenue_month = revenue_month or 0.0
+    appts_month = appts_month or 0
 
     # Total clients
     total_clients_result = await db.execute(select(func.count(Client.id)))
     total_clients = total_clients_result.scalar() or 0
 
-    # Lapsed clients
-    lapsed_result = await db.execute(
-        select(func.count(Client.id)).where(Client.is_lapsed == True)  # noqa: E712
+    # Lapsed clients, active leads (not lost/booked), review queue, low stock
+    counters = await read_counters(
+        db, "lapsed_clients", "active_leads", "needs_review_appointments", "low_stock_products"
     )
-    lapsed_count = lapsed_result.scalar() or 0
-
-    # Active leads in pipeline (not lost/booked)
-    active_leads_result = await db.execute(
-        select(func.count(ExtensionLead.id)).where(
-            ExtensionLead.pipeline_stage.notin_(["lost", "booked"])
-        )
-    )
-    active_leads = active_leads_result.scalar() or 0
 
     # Upcoming appointments (next 7 days)
     from datetime import timedelta
@@ -94,18 +93,58 @@ async def get_dashboard_stats(db: AsyncSession = Depends(get_db)):
     upcoming_count = upcoming_result.scalar() or 0
 
     return {
-        "revenue_this_month": float(revenue_month),
+        "revenue_this_month": revenue_month,
         "appointments_this_month": appts_month,
         "total_clients": total_clients,
-        "lapsed_clients": lapsed_count,
-        "active_leads": active_leads,
+        "lapsed_clients": counters["lapsed_clients"],
+        "active_leads": counters["active_leads"],
         "upcoming_7_days": upcoming_count,
+        "needs_review": counters["needs_review_appointments"],
+        "low_stock_products": counters["low_stock_products"],
     }
 
 
+@router.get("/cohorts")
+async def get_cohorts(
+    months: int = Query(12, ge=2, le=60),
+    as_of: str | None = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Monthly acquisition cohorts: retention matrix, churn curve and rebooking intervals."""
+    if as_of:
+        try:
+            month_bounds(as_of)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="as_of must be in YYYY-MM format")
+    closed = last_closed_month()
+    as_of = min(as_of or closed, closed)
+    return await analytics_cache.get_or_compute(
+        "cohorts", (), lambda: cohort_retention(db, as_of, months), key=(as_of, months)
+    )
+
+
+@router.post("/rollups/rebuild")
+async def rebuild_daily_rollups(
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Recompute daily rollups for [from, to) from raw appointments (default: all history)."""
+    if date_from and date_to and date_from >= date_to:
+        raise HTTPException(status_code=400, detail="'from' must be before 'to'")
+    return await rebuild_rollups(db, date_from, date_to)
+
+
 @router.get("/{month}")
-async def get_report(month: str, db: AsyncSession = Depends(get_db)):
+async def get_report(
+    month: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+):
     """Fetch report for a month (format: YYYY-MM)."""
+    if not_modified := await conditional_get(request, response, db, "reports"):
+        return not_modified
     result = await db.execute(
         select(Report).where(Report.report_month == month)
     )
@@ -127,144 +166,47 @@ async def get_report(month: str, db: AsyncSession = Depends(get_db)):
     }
 
 
-@router.post("/{month}/generate")
-async def generate_report(month: str, db: AsyncSession = Depends(get_db)):
-    """Compute report data from DB for a given month (YYYY-MM)."""
+@router.post("/backfill", status_code=202)
+async def backfill_reports(
+    month_from: str = Query(..., alias="from", pattern=r"^\d{4}-\d{2}$"),
+    month_to: str = Query(..., alias="to", pattern=r"^\d{4}-\d{2}$"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Queue generation of every monthly report from `from` to `to` inclusive (YYYY-MM)."""
     try:
-        year, mon = map(int, month.split("-"))
+        months = month_range(month_from, month_to)
     except ValueError:
-        raise HTTPException(status_code=400, detail="Month must be in YYYY-MM format")
-
-    month_start = datetime(year, mon, 1)
-    if mon == 12:
-        month_end = datetime(year + 1, 1, 1)
-    else:
-        month_end = datetime(year, mon + 1, 1)
-
-    # Revenue + appointments
-    appt_result = await db.execute(
-        select(
-            func.count(Appointment.id),
-            func.sum(Appointment.price),
-        ).where(
-            and_(
-                Appointment.status == "completed",
-                Appointment.start_datetime >= month_start,
-                Appointment.start_datetime < month_end,
-            )
-        )
-    )
-    row = appt_result.one()
-    appt_count = row[0] or 0
-    revenue = float(row[1] or 0)
-
-    # New clients this month
-    new_clients_result = await db.execute(
-        select(func.count(Client.id)).where(
-            and_(
-                Client.created_at >= month_start,
-                Client.created_at < month_end,
-            )
-        )
-    )
-    new_clients = new_clients_result.scalar() or 0
-
-    # Lapsed clients recovered (had appointment this month but was lapsed)
-    # (simplified: clients with last_visit_date in this month who have >1 visits)
-    lapsed_recovered_result = await db.execute(
-        select(func.count(Client.id)).where(
-            and_(
-                Client.last_visit_date >= month_start.date(),
-                Client.last_visit_date < month_end.date(),
-                Client.total_visits > 1,
-                Client.is_lapsed == False,  # noqa: E712
-            )
+        raise HTTPException(status_code=400, detail="Months must be in YYYY-MM format")
+    if not months:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if len(months) > MAX_BACKFILL_MONTHS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_BACKFILL_MONTHS} months per backfill"
         )
-    )
-    lapsed_recovered = lapsed_recovered_result.scalar() or 0
+    return await _enqueue_report_job(db, months)
 
-    # Leads converted this month
-    leads_converted_result = await db.execute(
-        select(func.count(ExtensionLead.id)).where(
-            and_(
-                ExtensionLead.pipeline_stage == "booked",
-                ExtensionLead.updated_at >= month_start,
-                ExtensionLead.updated_at < month_end,
-            )
-        )
-    )
-    leads_converted = leads_converted_result.scalar() or 0
 
-    # Top services by count
-    top_services_result = await db.execute(
-        select(
-            Appointment.service_type,
-            func.count(Appointment.id).label("count"),
-            func.sum(Appointment.price).label("revenue"),
-        )
-        .where(
-            and_(
-                Appointment.status == "completed",
-                Appointment.start_datetime >= month_start,
-                Appointment.start_datetime < month_end,
-            )
-        )
-        .group_by(Appointment.service_type)
-        .order_by(func.count(Appointment.id).desc())
-        .limit(5)
-    )
-    top_services = [
-        {"service": row[0], "count": row[1], "revenue": float(row[2] or 0)}
-        for row in top_services_result.all()
-    ]
-
-    # Charts data: daily revenue for the month
-    daily_result = await db.execute(
-        select(
-            func.date(Appointment.start_datetime).label("day"),
-            func.sum(Appointment.price).label("revenue"),
-        )
-        .where(
-            and_(
-                Appointment.status == "completed",
-                Appointment.start_datetime >= month_start,
-                Appointment.start_datetime < month_end,
-            )
-        )
-        .group_by(func.date(Appointment.start_datetime))
-        .order_by(func.date(Appointment.start_datetime))
-    )
-    daily_revenue = [
-        {"date": str(row[0]), "revenue": float(row[1] or 0)}
-        for row in daily_result.all()
-    ]
-
-    # Upsert report
-    existing_result = await db.execute(
-        select(Report).where(Report.report_month == month)
-    )
-    report = existing_result.scalar_one_or_none()
-    if not report:
-        report = Report(report_month=month)
-        db.add(report)
+@router.post("/{month}/generate", status_code=202)
+async def generate_report(month: str, db: AsyncSession = Depends(get_db)):
+    """Queue computation of report data for a given month (YYYY-MM); poll GET /jobs/{job_id}."""
+    try:
+        month_bounds(month)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Month must be in YYYY-MM format")
+    return await _enqueue_report_job(db, [month])
 
-    report.revenue_total = revenue
-    report.appointments_count = appt_count
-    report.new_clients_count = new_clients
-    report.lapsed_recovered = lapsed_recovered
-    report.leads_converted = leads_converted
-    report.top_services_json = top_services
-    report.charts_data_json = {"daily_revenue": daily_revenue}
 
+async def _enqueue_report_job(db: AsyncSession, months: list[str]) -> dict:
+    job = await enqueue_job(db, "report_metrics", {"months": months}, total=len(months))
     await db.commit()
-    await db.refresh(report)
-
+    job_worker.notify()
     return {
-        "message": "Report generated",
-        "report_month": month,
-        "revenue_total": revenue,
-        "appointments_count": appt_count,
-        "new_clients_count": new_clients,
+        "message": "Report generation queued",
+        "job_id": job.id,
+        "status": job.status,
+        "months": len(months),
+        "from": months[0],
+        "to": months[-1],
     }
 
 
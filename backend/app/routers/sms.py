@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, Form
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.client import Client
 from app.models.communication import SmsMessage, ChatSession
 from app.services.twilio_service import twilio_service
@@ -156,7 +156,7 @@ async def send_sms(
 
 
 @router.get("/history/{client_id}", response_model=list)
-async def get_sms_history(client_id: int, db: AsyncSession = Depends(get_db)):
+async def get_sms_history(client_id: int, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(SmsMessage)
         .where(SmsMessage.client_id == client_id)
@@ -0,0 +1,70 @@
+"""
+Delta sync for the web and mobile apps.
+
+Clients start with since=0, keep the returned "since" token, and pass it back
+on the next poll. Each call returns the current state of every row changed
+after the token plus the ids of rows deleted since then.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.database import get_read_db
+from app.models.change_log import ChangeLogEntry
+from app.services.change_log import SYNC_ENTITIES
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.get("")
+async def get_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    result = await db.execute(
+        select(
+            ChangeLogEntry.id,
+            ChangeLogEntry.entity,
+            ChangeLogEntry.entity_id,
+            ChangeLogEntry.op,
+        )
+        .where(ChangeLogEntry.id > since)
+        .order_by(ChangeLogEntry.id)
+        .limit(limit + 1)
+    )
+    entries = result.all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    # Only the newest change per row matters; later entries overwrite earlier ones
+    latest: dict[tuple[str, int], tuple[int, str]] = {}
+    for entry in entries:
+        latest[(entry.entity, entry.entity_id)] = (entry.id, entry.op)
+
+    changes: dict[str, list] = {name: [] for name in SYNC_ENTITIES}
+    deleted: dict[str, list[int]] = {name: [] for name in SYNC_ENTITIES}
+    versions: dict[str, dict[int, int]] = {name: {} for name in SYNC_ENTITIES}
+    for (entity, entity_id), (version, op) in latest.items():
+        if entity not in SYNC_ENTITIES:
+            continue
+        if op == "delete":
+            deleted[entity].append(entity_id)
+        else:
+            versions[entity][entity_id] = version
+
+    for entity, row_versions in versions.items():
+        if not row_versions:
+            continue
+        model, columns = SYNC_ENTITIES[entity]
+        rows = await db.execute(select(*columns).where(model.id.in_(row_versions)))
+        # A row missing here was deleted after this batch; its tombstone follows
+        changes[entity] = [
+            {**row, "version": row_versions[row["id"]]} for row in rows.mappings()
+        ]
+
+    return {
+        "since": entries[-1].id if entries else since,
+        "has_more": has_more,
+        "changes": changes,
+        "deleted": deleted,
+    }
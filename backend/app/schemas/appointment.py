@@ -1,11 +1,18 @@
 from datetime import datetime
-from pydantic import BaseModel, model_validator
+from typing import Annotated
+from pydantic import BaseModel, Field, model_validator
+from app.services.availability import MAX_APPOINTMENT_SPAN
+
+# Double-booking and availability scans only look MAX_APPOINTMENT_SPAN back
+# for bookings that could reach a slot, so no booking may run longer
+MAX_DURATION_MINUTES = int(MAX_APPOINTMENT_SPAN.total_seconds()) // 60
+DurationMinutes = Annotated[int, Field(gt=0, le=MAX_DURATION_MINUTES)]
 
 
 class AppointmentCreate(BaseModel):
     client_id: int
     service_type: str
-    duration_minutes: int
+    duration_minutes: DurationMinutes
     price: float
     start_datetime: datetime
     notes: str | None = None
@@ -23,9 +30,27 @@ class AppointmentCreate(BaseModel):
         return self.start_datetime + timedelta(minutes=self.duration_minutes)
 
 
+class AppointmentSeriesCreate(BaseModel):
+    # Visits every interval_weeks, starting at first_start_datetime
+    client_id: int
+    service_type: str
+    duration_minutes: DurationMinutes
+    price: float
+    first_start_datetime: datetime
+    interval_weeks: int = 6
+    occurrences: int
+    notes: str | None = None
+
+
+class AppointmentBulkCreate(BaseModel):
+    # Explicit appointments and/or a recurring series, booked all-or-nothing
+    appointments: list[AppointmentCreate] = []
+    series: AppointmentSeriesCreate | None = None
+
+
 class AppointmentUpdate(BaseModel):
     service_type: str | None = None
-    duration_minutes: int | None = None
+    duration_minutes: DurationMinutes | None = None
     price: float | None = None
     status: str | None = None
     start_datetime: datetime | None = None
@@ -49,6 +74,7 @@ class AppointmentRead(BaseModel):
     deposit_paid: bool
     deposit_amount: float
     cancellation_reason: str | None
+    series_id: int | None = None
     created_at: datetime
 
     # Nested client info
@@ -70,3 +96,14 @@ class AppointmentListItem(BaseModel):
     deposit_paid: bool
 
     model_config = {"from_attributes": True}
+
+
+class AppointmentImportRow(BaseModel):
+    # Historical appointment matched to a client by (normalized) phone
+    phone: str
+    service_type: str
+    start_datetime: datetime
+    duration_minutes: DurationMinutes = 60
+    price: float = 0.0
+    status: str = "completed"
+    notes: str | None = None
@@ -3,6 +3,17 @@ from pydantic import BaseModel, EmailStr, field_validator
 import re
 
 
+def normalize_phone(v: str) -> str:
+    """Normalize a phone number to E.164 (US default), raising ValueError if invalid."""
+    # Strip whitespace and common formatting
+    cleaned = re.sub(r"[\s\-\(\)\.]+", "", v)
+    if not cleaned.startswith("+"):
+        cleaned = "+1" + cleaned.lstrip("1")
+    if not re.match(r"^\+\d{10,15}$", cleaned):
+        raise ValueError("Phone must be in E.164 format (e.g. +12125551234)")
+    return cleaned
+
+
 class ClientBase(BaseModel):
     full_name: str
     phone: str
@@ -14,13 +25,7 @@ class ClientBase(BaseModel):
     @field_validator("phone")
     @classmethod
     def validate_phone(cls, v: str) -> str:
-        # Strip whitespace and common formatting
-        cleaned = re.sub(r"[\s\-\(\)\.]+", "", v)
-        if not cleaned.startswith("+"):
-            cleaned = "+1" + cleaned.lstrip("1")
-        if not re.match(r"^\+\d{10,15}$", cleaned):
-            raise ValueError("Phone must be in E.164 format (e.g. +12125551234)")
-        return cleaned
+        return normalize_phone(v)
 
 
 class ClientCreate(ClientBase):
@@ -63,6 +68,22 @@ class ClientListItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ClientImportRow(BaseModel):
+    # Phone is normalized for the whole batch by the importer, not per row here
+    full_name: str
+    phone: str
+    email: str | None = None
+    notes: str | None = None
+    first_visit_date: date | None = None
+    gdpr_consent: bool = False
+
+
+class ClientImport(BaseModel):
+    """Raw rows from a previous booking tool; each row is validated individually."""
+    clients: list[dict] = []
+    appointments: list[dict] = []
+
+
 class WaitlistEntryCreate(BaseModel):
     client_id: int
     desired_service: str
@@ -0,0 +1,78 @@
+"""
+Batched appointment creation (POST /appointments/bulk) and recurring series.
+
+A batch is checked against existing bookings (and itself) in one pass under
+the booking lock, then inserted with a single multi-row INSERT. Google
+Calendar events for the whole batch are queued in the calendar outbox with
+one more statement; the outbox worker creates them with batched API requests.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.appointment import Appointment
+from app.services.availability import mark_days_changed
+from app.services.change_log import record_changes
+
+MAX_BULK_APPOINTMENTS = 200
+
+
+def appointment_row(
+    client_id: int,
+    service_type: str,
+    duration_minutes: int,
+    price: float,
+    start_datetime: datetime,
+    notes: str | None = None,
+    deposit_paid: bool = False,
+    deposit_amount: float = 0.0,
+) -> dict:
+    return {
+        "client_id": client_id,
+        "service_type": service_type,
+        "duration_minutes": duration_minutes,
+        "price": price,
+        "status": "scheduled",
+        "start_datetime": start_datetime,
+        "end_datetime": start_datetime + timedelta(minutes=duration_minutes),
+        "notes": notes,
+        "deposit_paid": deposit_paid,
+        "deposit_amount": deposit_amount,
+        "series_id": None,
+    }
+
+
+def series_rows(series) -> list[dict]:
+    """One appointment row per occurrence of an AppointmentSeriesCreate."""
+    return [
+        appointment_row(
+            series.client_id,
+            series.service_type,
+            series.duration_minutes,
+            series.price,
+            series.first_start_datetime + timedelta(weeks=series.interval_weeks * n),
+            series.notes,
+        )
+        for n in range(series.occurrences)
+    ]
+
+
+async def insert_appointments(db: AsyncSession, rows: list[dict]) -> list[int]:
+    """
+    Insert already-validated rows with one statement, returning ids in row
+    order, and record them for sync, caches and availability (the Core
+    insert bypasses the ORM hooks). Caller holds the booking lock and commits.
+    """
+    result = await db.execute(
+        insert(Appointment).returning(Appointment.id, sort_by_parameter_order=True), rows
+    )
+    ids = list(result.scalars().all())
+    await record_changes(db, "appointments", ids)
+    days = set()
+    for row in rows:
+        day = row["start_datetime"].date()
+        while day <= row["end_datetime"].date():
+            days.add(day)
+            day += timedelta(days=1)
+    mark_days_changed(db.sync_session, days)
+    return ids
+
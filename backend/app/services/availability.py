@@ -0,0 +1,220 @@
+"""
+Local availability engine (GET /calendar/slots).
+
+Free slots are computed from the appointments table instead of a Google
+freebusy round trip. Each day is reduced to a busy bitmap — an int with one
+bit per minute of opening hours (SALON_HOURS_START..SALON_HOURS_END), set
+wherever a booked appointment overlaps. Where a booking of a given length
+fits is then a few whole-day bitwise operations: AND the free bitmap with
+itself shifted by doubling widths until each remaining bit starts a long
+enough free run, then keep the bits on the slot grid. Nothing is evaluated
+per candidate slot, so scanning weeks ahead (GET /calendar/next-available)
+is as cheap as answering for one day.
+
+Bitmaps are built for a whole date range with one query and kept in memory.
+An after_flush hook records the days each appointment write touches (before
+and after a reschedule) and they are dropped when the transaction commits;
+a write whose previous times weren't loaded drops every cached day.
+"""
+import math
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import and_, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.models.appointment import Appointment
+from app.services.counters import flushed_values
+
+settings = get_settings()
+
+# Appointments in these statuses don't occupy their time slot
+FREE_STATUSES = ("cancelled", "no_show")
+SLOT_STEP_MINUTES = 30
+# No appointment runs longer than this, so one day back bounds the start scan
+MAX_APPOINTMENT_SPAN = timedelta(days=1)
+MAX_CACHED_DAYS = 730
+
+# Session.info key the hook fills with the days a transaction rescheduled,
+# booked or freed (or ALL_DAYS when they aren't known)
+AFFECTED_DAYS_KEY = "availability_days"
+ALL_DAYS = "all"
+
+
+def _minutes(hhmm: str) -> int:
+    hours, minutes = map(int, hhmm.split(":"))
+    return hours * 60 + minutes
+
+
+class AvailabilityIndex:
+    def __init__(self, opens: str, closes: str):
+        self.open_minute = _minutes(opens)
+        self.close_minute = _minutes(closes)
+        self.day_minutes = max(0, self.close_minute - self.open_minute)
+        self._day_mask = (1 << self.day_minutes) - 1
+        # One bit at each slot start offset
+        self._grid_mask = sum(1 << offset for offset in range(0, self.day_minutes, SLOT_STEP_MINUTES))
+        self._days: OrderedDict[date, int] = OrderedDict()
+        # Bumped on every invalidation so bitmaps built from a snapshot taken
+        # before a concurrent commit are never stored
+        self._generation = 0
+
+    def opening(self, day: date) -> datetime:
+        return datetime.combine(day, time()) + timedelta(minutes=self.open_minute)
+
+    def closing(self, day: date) -> datetime:
+        return datetime.combine(day, time()) + timedelta(minutes=self.close_minute)
+
+    def _mark(self, bitmaps: dict[date, int], start: datetime, end: datetime) -> None:
+        day = start.date()
+        while day <= end.date():
+            if day in bitmaps:
+                first = max(0, int((start - self.opening(day)).total_seconds() // 60))
+                last = min(self.day_minutes, math.ceil((end - self.opening(day)).total_seconds() / 60))
+                if last > first:
+                    bitmaps[day] |= ((1 << (last - first)) - 1) << first
+            day += timedelta(days=1)
+
+    async def bitmaps(self, db: AsyncSession, first: date, last: date) -> dict[date, int]:
+        """Busy bitmaps for every day in [first, last]; missing days are loaded in one query."""
+        days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+        # Snapshot before awaiting: a commit may invalidate cached days meanwhile
+        cached = {day: self._days[day] for day in days if day in self._days}
+        missing = [day for day in days if day not in cached]
+        if missing:
+            generation = self._generation
+            loaded = {day: 0 for day in missing}
+            window_start, window_end = self.opening(missing[0]), self.closing(missing[-1])
+            result = await db.execute(
+                select(Appointment.start_datetime, Appointment.end_datetime).where(
+                    and_(
+                        Appointment.start_datetime >= window_start - MAX_APPOINTMENT_SPAN,
+                        Appointment.start_datetime < window_end,
+                        Appointment.end_datetime > window_start,
+                        Appointment.status.notin_(FREE_STATUSES),
+                    )
+                )
+            )
+            for start, end in result.all():
+                self._mark(loaded, start, end)
+            if generation == self._generation:
+                self._days.update(loaded)
+                while len(self._days) > MAX_CACHED_DAYS:
+                    self._days.popitem(last=False)
+            return {day: cached[day] if day in cached else loaded[day] for day in days}
+        for day in days:
+            self._days.move_to_end(day)
+        return cached
+
+    def fitting_starts(self, busy: int, duration_minutes: int) -> int:
+        """Bitmask of slot-grid offsets where `duration_minutes` free minutes begin."""
+        if duration_minutes <= 0 or duration_minutes > self.day_minutes:
+            return 0
+        # Invariant: bit i is set iff minutes i..i+length-1 are all free
+        fits, length = ~busy & self._day_mask, 1
+        while length < duration_minutes:
+            step = min(length, duration_minutes - length)
+            fits &= fits >> step
+            length += step
+        return fits & self._grid_mask
+
+    def free_slots(self, day: date, busy: int, duration_minutes: int, not_before: int = 0) -> list[datetime]:
+        """Slot starts on `day` (at or after minute offset `not_before`) whose whole duration is free."""
+        fits = self.fitting_starts(busy, duration_minutes) >> not_before << not_before
+        opening = self.opening(day)
+        slots = []
+        while fits:
+            lowest = fits & -fits
+            slots.append(opening + timedelta(minutes=lowest.bit_length() - 1))
+            fits ^= lowest
+        return slots
+
+    async def available_slots(self, db: AsyncSession, day: date, duration_minutes: int) -> list[str]:
+        """Available booking slots for a day as ISO datetime strings."""
+        busy = (await self.bitmaps(db, day, day))[day]
+        return [slot.isoformat() for slot in self.free_slots(day, busy, duration_minutes)]
+
+    async def next_available(
+        self,
+        db: AsyncSession,
+        duration_minutes: int,
+        after: datetime,
+        count: int,
+        horizon_days: int,
+    ) -> list[datetime]:
+        """The first `count` slots starting at or after `after`, searching `horizon_days` ahead."""
+        slots: list[datetime] = []
+        first = after.date()
+        end = first + timedelta(days=horizon_days)
+        while first < end and len(slots) < count:
+            last = min(first + timedelta(days=6), end - timedelta(days=1))
+            for day, busy in (await self.bitmaps(db, first, last)).items():
+                not_before = max(0, math.ceil((after - self.opening(day)).total_seconds() / 60))
+                slots.extend(self.free_slots(day, busy, duration_minutes, not_before))
+                if len(slots) >= count:
+                    break
+            first = last + timedelta(days=1)
+        return slots[:count]
+
+    def invalidate(self, days) -> None:
+        self._generation += 1
+        if days == ALL_DAYS:
+            self._days.clear()
+            return
+        for day in days:
+            self._days.pop(day, None)
+
+
+availability = AvailabilityIndex(settings.salon_hours_start, settings.salon_hours_end)
+
+
+def _span_days(values: dict) -> set[date]:
+    start, end = values["start_datetime"], values["end_datetime"]
+    if not start or not end:
+        return set()
+    return {start.date() + timedelta(days=i) for i in range((end.date() - start.date()).days + 1)}
+
+
+def mark_days_changed(session: Session, days=ALL_DAYS) -> None:
+    """Drop cached days when `session` commits — for Core writes that bypass the hook."""
+    affected = session.info.get(AFFECTED_DAYS_KEY) or set()
+    if days == ALL_DAYS or affected == ALL_DAYS:
+        session.info[AFFECTED_DAYS_KEY] = ALL_DAYS
+    else:
+        session.info[AFFECTED_DAYS_KEY] = affected | set(days)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_affected_days(session, flush_context):
+    columns = ("start_datetime", "end_datetime")
+    days: set[date] = set()
+    for collection, before, after in (
+        (session.new, False, True),
+        (session.dirty, True, True),
+        (session.deleted, True, False),
+    ):
+        for obj in collection:
+            if not isinstance(obj, Appointment):
+                continue
+            old = flushed_values(obj, columns, True) if before else {}
+            new = flushed_values(obj, columns, False) if after else {}
+            if old is None or new is None:
+                mark_days_changed(session)
+                return
+            for values in (old, new):
+                if values:
+                    days |= _span_days(values)
+    if days:
+        mark_days_changed(session, days)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    days = session.info.pop(AFFECTED_DAYS_KEY, None)
+    if days:
+        availability.invalidate(days)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(AFFECTED_DAYS_KEY, None)
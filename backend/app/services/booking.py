@@ -0,0 +1,101 @@
+"""
+Double-booking prevention.
+
+A booking overlaps another when each starts before the other ends, ignoring
+appointments that no longer hold their slot (see availability.FREE_STATUSES).
+The probe is a range scan on ix_appointments_start_end: appointments never
+span more than MAX_APPOINTMENT_SPAN, so only rows starting within that
+window before the new booking's end can overlap it, and the index covers the
+end/status filter.
+
+Check-then-write is made atomic by lock_bookings(), called before the check:
+on SQLite it opens the write transaction with a no-op UPDATE, so the
+database write lock is held until commit; on Postgres it takes the
+change-log advisory lock, which every synced write takes before commit
+anyway (app.services.change_log).
+
+Bulk paths (import, series) check a whole batch with find_batch_overlaps():
+one range query for existing bookings plus a sort-and-sweep over the batch.
+"""
+from datetime import datetime
+from sqlalchemy import and_, false, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import is_sqlite
+from app.models.appointment import Appointment
+from app.services.availability import FREE_STATUSES, MAX_APPOINTMENT_SPAN
+from app.services.change_log import hold_change_log_lock
+
+
+def holds_slot(status: str | None) -> bool:
+    return (status or "scheduled") not in FREE_STATUSES
+
+
+def _overlaps(start: datetime, end: datetime):
+    return and_(
+        Appointment.start_datetime >= start - MAX_APPOINTMENT_SPAN,
+        Appointment.start_datetime < end,
+        Appointment.end_datetime > start,
+        Appointment.status.notin_(FREE_STATUSES),
+    )
+
+
+async def lock_bookings(db: AsyncSession) -> None:
+    """Serialize booking writes until the transaction ends."""
+    if is_sqlite:
+        await db.execute(
+            update(Appointment).where(false()).execution_options(synchronize_session=False)
+        )
+    else:
+        await db.run_sync(hold_change_log_lock)
+
+
+async def find_overlaps(db: AsyncSession, appt: Appointment) -> list:
+    """Other slot-holding appointments overlapping a flushed appointment."""
+    result = await db.execute(
+        select(Appointment.id, Appointment.start_datetime, Appointment.end_datetime)
+        .where(and_(_overlaps(appt.start_datetime, appt.end_datetime), Appointment.id != appt.id))
+        .order_by(Appointment.start_datetime)
+    )
+    return result.all()
+
+
+def describe_overlaps(overlaps: list) -> str:
+    bookings = ", ".join(
+        f"#{row.id} {row.start_datetime:%Y-%m-%d %H:%M}–{row.end_datetime:%H:%M}" for row in overlaps
+    )
+    return f"Overlaps an existing booking: {bookings}"
+
+
+async def find_batch_overlaps(db: AsyncSession, rows: list[dict]) -> set[int]:
+    """
+    Indexes of slot-holding `rows` (dicts with start_datetime, end_datetime and
+    optionally status, not yet inserted) that overlap an existing booking or
+    another row.
+    """
+    candidates = [i for i, row in enumerate(rows) if holds_slot(row.get("status"))]
+    if not candidates:
+        return set()
+    first = min(rows[i]["start_datetime"] for i in candidates)
+    last = max(rows[i]["end_datetime"] for i in candidates)
+    result = await db.execute(
+        select(Appointment.start_datetime, Appointment.end_datetime).where(_overlaps(first, last))
+    )
+
+    # Sweep every interval in start order, remembering the one reaching
+    # furthest; an interval starting before that end overlaps it
+    intervals = [(start, end, None) for start, end in result.all()]
+    intervals += [(rows[i]["start_datetime"], rows[i]["end_datetime"], i) for i in candidates]
+    intervals.sort(key=lambda interval: (interval[0], interval[2] is not None))
+
+    flagged: set[int] = set()
+    reach_end: datetime | None = None
+    reach_index: int | None = None
+    for start, end, index in intervals:
+        if reach_end is not None and start < reach_end:
+            if index is not None:
+                flagged.add(index)
+            if reach_index is not None:
+                flagged.add(reach_index)
+        if reach_end is None or end > reach_end:
+            reach_end, reach_index = end, index
+    return flagged
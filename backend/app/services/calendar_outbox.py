@@ -0,0 +1,232 @@
+"""
+Transactional outbox for Google Calendar writes.
+
+Booking endpoints never call Google themselves. They add a calendar_outbox
+row in the same transaction as the appointment change, so the calendar
+write is queued exactly when the booking commits (and never when it rolls
+back). A worker task in the API process drains the outbox:
+
+- it claims due rows with a conditional UPDATE that leases them for
+  CLAIM_LEASE, so rows left behind by a crashed process become due again
+  by themselves;
+- it brings each appointment's event in line with the appointment's
+  current state: create it (batched for the whole claim), update it, or
+  delete it once the appointment no longer holds its slot. Several queued
+  changes to one appointment therefore collapse into one call;
+- it deletes rows that succeeded. Failures are retried with exponential
+  backoff (CALENDAR_OUTBOX_RETRY_SECONDS, doubling, capped at
+  MAX_RETRY_DELAY) and marked failed after CALENDAR_OUTBOX_MAX_ATTEMPTS.
+
+Committing a session that queued rows wakes the worker straight away.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Iterable
+from sqlalchemy import delete, event, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.appointment import Appointment
+from app.models.calendar_outbox import CalendarOutboxEntry
+from app.models.client import Client
+from app.services.booking import holds_slot
+from app.services.google_calendar import google_calendar_service
+
+settings = get_settings()
+
+CLAIM_LEASE = timedelta(minutes=5)
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+# Session.info flag set when a transaction queued outbox rows
+QUEUED_KEY = "calendar_outbox_queued"
+
+
+def queue_calendar_sync(db: AsyncSession, appointment: Appointment, op: str) -> None:
+    """Queue a calendar write for a flushed appointment in the caller's transaction."""
+    if not google_calendar_service.is_configured():
+        return
+    db.add(CalendarOutboxEntry(appointment_id=appointment.id, op=op))
+    db.sync_session.info[QUEUED_KEY] = True
+
+
+async def queue_calendar_sync_many(db: AsyncSession, appointment_ids: Iterable[int], op: str) -> int:
+    """Queue calendar writes for many appointments with one statement. Returns the number queued."""
+    if not google_calendar_service.is_configured():
+        return 0
+    rows = [{"appointment_id": appointment_id, "op": op} for appointment_id in appointment_ids]
+    if rows:
+        await db.execute(insert(CalendarOutboxEntry), rows)
+        db.sync_session.info[QUEUED_KEY] = True
+    return len(rows)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    delay = timedelta(seconds=settings.calendar_outbox_retry_seconds * 2 ** (attempts - 1))
+    return min(delay, MAX_RETRY_DELAY)
+
+
+async def outbox_summary(db: AsyncSession) -> dict:
+    result = await db.execute(
+        select(CalendarOutboxEntry.status, func.count()).group_by(CalendarOutboxEntry.status)
+    )
+    counts = dict(result.all())
+    return {"pending": counts.get("pending", 0), "failed": counts.get("failed", 0)}
+
+
+class CalendarOutboxWorker:
+    def __init__(self, poll_seconds: float, batch_size: int):
+        self._poll_seconds = poll_seconds
+        self._batch_size = max(1, batch_size)
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        """Wake the worker after committing outbox rows; safe to call from any thread."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._loop = None
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                drained = await self.drain_once()
+            except Exception as e:
+                print(f"[CalendarOutbox] Drain failed: {e}")
+                drained = 0
+            if drained:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain_once(self) -> int:
+        """Claim and push one batch of due entries. Returns how many were claimed."""
+        claimed = await self._claim()
+        if not claimed:
+            return 0
+        appointment_ids = {appointment_id for _, appointment_id, _ in claimed}
+        try:
+            errors = await self._push(appointment_ids)
+        except Exception as e:
+            # Couldn't reach Google at all (not connected, token refresh failed, ...)
+            errors = dict.fromkeys(appointment_ids, str(e) or type(e).__name__)
+        await self._record_outcomes(claimed, errors)
+        return len(claimed)
+
+    async def _claim(self) -> list[tuple[int, int, int]]:
+        now = datetime.now()
+        due = (
+            select(CalendarOutboxEntry.id)
+            .where(CalendarOutboxEntry.status == "pending", CalendarOutboxEntry.next_attempt_at <= now)
+            .order_by(CalendarOutboxEntry.id)
+            .limit(self._batch_size)
+        )
+        async with AsyncSessionLocal() as db:
+            # Conditional update so a row is only ever leased to one drain
+            result = await db.execute(
+                update(CalendarOutboxEntry)
+                .where(
+                    CalendarOutboxEntry.id.in_(due.scalar_subquery()),
+                    CalendarOutboxEntry.status == "pending",
+                    CalendarOutboxEntry.next_attempt_at <= now,
+                )
+                .values(next_attempt_at=now + CLAIM_LEASE)
+                .returning(
+                    CalendarOutboxEntry.id,
+                    CalendarOutboxEntry.appointment_id,
+                    CalendarOutboxEntry.attempts,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            claimed = [tuple(row) for row in result.all()]
+            await db.commit()
+        return claimed
+
+    async def _push(self, appointment_ids: set[int]) -> dict[int, str]:
+        """Sync each appointment's event with its current state. Returns {appointment id: error}."""
+        errors: dict[int, str] = {}
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Appointment, Client)
+                .join(Client, Appointment.client_id == Client.id)
+                .where(Appointment.id.in_(appointment_ids))
+                .order_by(Appointment.start_datetime)
+            )
+            to_create = []
+            for appt, client in result.all():
+                if holds_slot(appt.status) and not appt.google_event_id:
+                    to_create.append((appt, client))
+                elif holds_slot(appt.status):
+                    if not await google_calendar_service.update_event(db, appt.google_event_id, appt, client):
+                        errors[appt.id] = "Google Calendar update failed"
+                elif appt.google_event_id:
+                    if await google_calendar_service.delete_event(db, appt.google_event_id):
+                        appt.google_event_id = None
+                    else:
+                        errors[appt.id] = "Google Calendar delete failed"
+
+            if to_create:
+                event_ids = await google_calendar_service.create_events(db, to_create)
+                for appt, _ in to_create:
+                    if appt.id in event_ids:
+                        appt.google_event_id = event_ids[appt.id]
+                    else:
+                        errors[appt.id] = "Google Calendar create failed"
+            await db.commit()
+        return errors
+
+    async def _record_outcomes(self, claimed: list[tuple[int, int, int]], errors: dict[int, str]) -> None:
+        now = datetime.now()
+        succeeded = [entry_id for entry_id, appointment_id, _ in claimed if appointment_id not in errors]
+        async with AsyncSessionLocal() as db:
+            if succeeded:
+                await db.execute(delete(CalendarOutboxEntry).where(CalendarOutboxEntry.id.in_(succeeded)))
+            for entry_id, appointment_id, attempts in claimed:
+                if appointment_id not in errors:
+                    continue
+                attempts += 1
+                gave_up = attempts >= settings.calendar_outbox_max_attempts
+                await db.execute(
+                    update(CalendarOutboxEntry)
+                    .where(CalendarOutboxEntry.id == entry_id)
+                    .values(
+                        attempts=attempts,
+                        status="failed" if gave_up else "pending",
+                        next_attempt_at=now + retry_delay(attempts),
+                        last_error=errors[appointment_id],
+                    )
+                )
+                if gave_up:
+                    print(f"[CalendarOutbox] Giving up on appointment {appointment_id}: {errors[appointment_id]}")
+            await db.commit()
+
+
+calendar_outbox_worker = CalendarOutboxWorker(
+    settings.calendar_outbox_poll_seconds, settings.calendar_outbox_batch_size
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_worker_on_commit(session):
+    if session.info.pop(QUEUED_KEY, None):
+        calendar_outbox_worker.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(QUEUED_KEY, None)
@@ -0,0 +1,141 @@
+"""
+Change tracking for delta sync.
+
+Every ORM flush that inserts, updates or deletes a synced entity appends a
+row to change_log in the same transaction, so the log can never disagree with
+the data it describes. GET /sync reads the log to hand web and mobile clients
+just the rows that changed since their last token, plus tombstones for rows
+that were deleted.
+
+Core-level bulk writes bypass the ORM flush — call record_changes() for those.
+
+Sync tokens are change_log ids, so ids must become visible in id order: a
+client holding token N never looks below N again. SQLite guarantees that by
+serializing writers. On Postgres, concurrent transactions could commit out of
+id order, so every transaction takes a transaction-scoped advisory lock
+before its first change_log insert; ids are then allocated and committed one
+transaction at a time. Booking writes reuse the same lock (see
+app.services.booking), so the two never wait on each other in opposite order.
+"""
+from typing import Iterable
+from sqlalchemy import delete, event, exists, func, insert, select
+from sqlalchemy.orm import Session, aliased
+from app.cache import CHANGED_ENTITIES_KEY
+from app.database import is_sqlite
+from app.models.appointment import Appointment
+from app.models.change_log import ChangeLogEntry
+from app.models.client import Client
+from app.models.communication import ChatSession
+from app.models.inventory import InventoryProduct
+from app.models.lead import ExtensionLead
+from app.models.report import AftercareSequence, Report
+
+# Sync entity name -> (model, columns served in /sync). Chat sessions only
+# expose metadata; the transcript and session token stay behind /chat.
+SYNC_ENTITIES = {
+    "clients": (Client, tuple(Client.__table__.columns)),
+    "appointments": (Appointment, tuple(Appointment.__table__.columns)),
+    "leads": (ExtensionLead, tuple(ExtensionLead.__table__.columns)),
+    "inventory": (InventoryProduct, tuple(InventoryProduct.__table__.columns)),
+    "aftercare": (AftercareSequence, tuple(AftercareSequence.__table__.columns)),
+    "chat_sessions": (
+        ChatSession,
+        (
+            ChatSession.id,
+            ChatSession.client_id,
+            ChatSession.channel,
+            ChatSession.created_at,
+            ChatSession.updated_at,
+        ),
+    ),
+}
+
+# Logged only so conditional GET (app.conditional) can version them; /sync skips them
+VERSIONED_ENTITIES = {"reports": Report}
+
+_ENTITY_BY_MODEL = {model: name for name, (model, _) in SYNC_ENTITIES.items()}
+_ENTITY_BY_MODEL.update({model: name for name, model in VERSIONED_ENTITIES.items()})
+
+# Arbitrary key for pg_advisory_xact_lock, shared by every change_log writer
+CHANGE_LOG_LOCK_KEY = 7_201_812
+# Session.info flag set once the current transaction holds that lock
+LOCKED_KEY = "change_log_locked"
+
+
+def hold_change_log_lock(session: Session) -> None:
+    """Hold the change-log lock until the transaction ends (Postgres only)."""
+    if is_sqlite or session.info.get(LOCKED_KEY):
+        return
+    session.connection().execute(select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK_KEY)))
+    session.info[LOCKED_KEY] = True
+
+
+async def record_changes(db, entity: str, ids: Iterable[int], op: str = "upsert") -> None:
+    """Append change-log rows for a Core-level bulk write in the caller's transaction."""
+    rows = [{"entity": entity, "entity_id": entity_id, "op": op} for entity_id in ids]
+    if rows:
+        await db.run_sync(hold_change_log_lock)
+        await db.execute(insert(ChangeLogEntry), rows)
+        db.sync_session.info.setdefault(CHANGED_ENTITIES_KEY, set()).add(entity)
+
+
+async def compact_change_log(db) -> int:
+    """
+    Drop log rows superseded by a newer row for the same entity. A client at
+    any token still sees the newest change for every entity after it, so this
+    never loses an update or a tombstone. Returns the number of rows removed.
+    """
+    newer = aliased(ChangeLogEntry)
+    result = await db.execute(
+        delete(ChangeLogEntry).where(
+            exists().where(
+                newer.entity == ChangeLogEntry.entity,
+                newer.entity_id == ChangeLogEntry.entity_id,
+                newer.id > ChangeLogEntry.id,
+            )
+        )
+    )
+    return result.rowcount
+
+
+@event.listens_for(Session, "after_flush")
+def _log_flushed_changes(session, flush_context):
+    # new/dirty/deleted still hold their pre-flush contents here, and new rows
+    # already have their primary keys.
+    changes: dict[tuple[str, int], str] = {}
+    for obj in session.new:
+        entity = _ENTITY_BY_MODEL.get(type(obj))
+        if entity:
+            changes[(entity, obj.id)] = "upsert"
+    for obj in session.dirty:
+        entity = _ENTITY_BY_MODEL.get(type(obj))
+        if entity and session.is_modified(obj, include_collections=False):
+            changes[(entity, obj.id)] = "upsert"
+    for obj in session.deleted:
+        entity = _ENTITY_BY_MODEL.get(type(obj))
+        if entity:
+            changes[(entity, obj.id)] = "delete"
+
+    if changes:
+        # Read on commit to invalidate cached dashboard views (app.cache)
+        session.info.setdefault(CHANGED_ENTITIES_KEY, set()).update(
+            entity for entity, _ in changes
+        )
+        hold_change_log_lock(session)
+        session.connection().execute(
+            insert(ChangeLogEntry),
+            [
+                {"entity": entity, "entity_id": entity_id, "op": op}
+                for (entity, entity_id), op in changes.items()
+            ],
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _unlock_on_commit(session):
+    session.info.pop(LOCKED_KEY, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _unlock_on_rollback(session):
+    session.info.pop(LOCKED_KEY, None)
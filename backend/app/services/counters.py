@@ -0,0 +1,179 @@
+"""
+Transactionally maintained dashboard counters.
+
+Each counter is defined once: the model it counts, the columns its condition
+reads, and that condition both in Python and as SQL. An after_flush hook
+compares every flushed row's condition before and after the write and applies
+the net change to the counters table on the same connection, so the counts
+commit or roll back together with the rows they describe. That covers every
+ORM write path (completing or no-showing appointments, the lapsed-client
+job, lead stage changes, stock adjustments, ...). When a row's previous value
+wasn't loaded, the affected counter is recounted in SQL instead.
+
+Core-level bulk writes bypass the hook; reconcile_counters() (run by the
+scheduler) recounts everything, repairs drift and reports what it fixed.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable
+from sqlalchemy import and_, event, func, select, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+from app.models.appointment import Appointment
+from app.models.client import Client
+from app.models.counter import Counter
+from app.models.inventory import InventoryProduct
+from app.models.lead import ExtensionLead
+
+CLOSED_LEAD_STAGES = ("lost", "booked")
+
+
+@dataclass(frozen=True)
+class CounterDef:
+    model: type
+    columns: tuple[str, ...]
+    matches: Callable[[dict[str, Any]], bool]
+    condition: Any
+
+
+COUNTERS = {
+    "lapsed_clients": CounterDef(
+        Client,
+        ("is_lapsed",),
+        lambda row: bool(row["is_lapsed"]),
+        Client.is_lapsed == True,  # noqa: E712
+    ),
+    "active_leads": CounterDef(
+        ExtensionLead,
+        ("pipeline_stage",),
+        lambda row: row["pipeline_stage"] not in CLOSED_LEAD_STAGES,
+        ExtensionLead.pipeline_stage.notin_(CLOSED_LEAD_STAGES),
+    ),
+    "needs_review_appointments": CounterDef(
+        Appointment,
+        ("status",),
+        lambda row: row["status"] == "needs_review",
+        Appointment.status == "needs_review",
+    ),
+    "low_stock_products": CounterDef(
+        InventoryProduct,
+        ("is_active", "current_stock", "reorder_threshold"),
+        lambda row: bool(row["is_active"])
+        and float(row["current_stock"]) <= float(row["reorder_threshold"]),
+        and_(
+            InventoryProduct.is_active == True,  # noqa: E712
+            InventoryProduct.current_stock <= InventoryProduct.reorder_threshold,
+        ),
+    ),
+}
+
+_COUNTERS_BY_MODEL: dict[type, list[tuple[str, CounterDef]]] = {}
+for _name, _definition in COUNTERS.items():
+    _COUNTERS_BY_MODEL.setdefault(_definition.model, []).append((_name, _definition))
+
+
+def _count_query(definition: CounterDef):
+    return select(func.count()).select_from(definition.model).where(definition.condition)
+
+
+async def read_counters(db, *names: str) -> dict[str, int]:
+    """Current values for the named counters, in one primary-key lookup."""
+    result = await db.execute(select(Counter.name, Counter.value).where(Counter.name.in_(names)))
+    values = dict(result.all())
+    # Not seeded yet (reconciliation creates missing rows) — count directly
+    for name in set(names) - set(values):
+        values[name] = (await db.execute(_count_query(COUNTERS[name]))).scalar() or 0
+    return values
+
+
+def counter_value(name: str):
+    """A counter as a scalar subquery, for folding into a larger statement."""
+    return select(Counter.value).where(Counter.name == name).scalar_subquery()
+
+
+async def reconcile_counters(db) -> dict[str, dict]:
+    """
+    Recount every counter and overwrite any that drifted (or were never
+    seeded). Returns {name: {"stored": old, "actual": new}} for the ones fixed.
+    """
+    actual = (await db.execute(
+        select(*(_count_query(d).scalar_subquery().label(n) for n, d in COUNTERS.items()))
+    )).one()._asdict()
+    stored = dict((await db.execute(select(Counter.name, Counter.value))).all())
+
+    drift = {}
+    for name, value in actual.items():
+        if stored.get(name) == value:
+            continue
+        drift[name] = {"stored": stored.get(name), "actual": value}
+        if name in stored:
+            await db.execute(update(Counter).where(Counter.name == name).values(value=value))
+        else:
+            db.add(Counter(name=name, value=value))
+    await db.flush()
+    return drift
+
+
+def flushed_values(obj, columns: tuple[str, ...], before: bool) -> dict | None:
+    """
+    Column values of a row inside an after_flush hook, as they were before the
+    flush (`before=True`) or as written. None if they aren't known without
+    another query (never loaded, or assigned before being loaded).
+    """
+    state = sa_inspect(obj)
+    values = {}
+    for column in columns:
+        if column not in state.dict:
+            return None
+        current = state.dict[column]
+        if not before:
+            values[column] = current
+            continue
+        history = state.attrs[column].history
+        if history.deleted:
+            values[column] = history.deleted[0]
+        elif history.added:
+            return None
+        else:
+            values[column] = current
+    return values
+
+
+def _matches(definition: CounterDef, values: dict | None) -> bool | None:
+    return None if values is None else definition.matches(values)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_counter_deltas(session, flush_context):
+    deltas: dict[str, int] = {}
+    recount: set[str] = set()
+
+    for collection, before, after in (
+        (session.new, False, True),
+        (session.dirty, True, True),
+        (session.deleted, True, False),
+    ):
+        for obj in collection:
+            for name, definition in _COUNTERS_BY_MODEL.get(type(obj), ()):
+                if name in recount:
+                    continue
+                was = _matches(definition, flushed_values(obj, definition.columns, True)) if before else False
+                now = _matches(definition, flushed_values(obj, definition.columns, False)) if after else False
+                if was is None or now is None:
+                    recount.add(name)
+                elif was != now:
+                    deltas[name] = deltas.get(name, 0) + (1 if now else -1)
+
+    deltas = {name: delta for name, delta in deltas.items() if delta and name not in recount}
+    if not deltas and not recount:
+        return
+    connection = session.connection()
+    for name, delta in deltas.items():
+        connection.execute(
+            update(Counter).where(Counter.name == name).values(value=Counter.value + delta)
+        )
+    for name in recount:
+        connection.execute(
+            update(Counter)
+            .where(Counter.name == name)
+            .values(value=_count_query(COUNTERS[name]).scalar_subquery())
+        )
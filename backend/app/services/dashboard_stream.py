@@ -0,0 +1,219 @@
+"""
+Server-push dashboard updates (GET /dashboard/stream).
+
+One background task per process owns the dashboard state. It wakes up when a
+commit invalidates dashboard data (or every refresh interval, for time-based
+thresholds), re-reads the cached views once, diffs them against the last
+state, and appends numbered delta events to a short replay buffer. Every
+connected client just tails that buffer, so N open tabs cost one
+recomputation per write instead of N polls per minute. The task only runs
+while someone is connected: it starts with the first subscriber, stops when
+the last one leaves, and on restart publishes whatever changed meanwhile so
+Last-Event-ID resumes stay complete. stop() ends it at shutdown.
+
+Event types:
+- snapshot: full {"kpis", "alerts", "today"} state (on connect, or when the
+  client's Last-Event-ID is too old to replay)
+- kpis: {"changed": {...}} — only the KPI values that moved
+- alerts: {"added", "updated", "removed", "total", "has_errors"}
+- today: {"date", "added", "updated", "removed", totals...} for today's
+  appointments, e.g. a status change to completed/cancelled
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+HEARTBEAT_SECONDS = 15
+# Batch bursts of commits (e.g. complete + aftercare) into one recompute
+DEBOUNCE_SECONDS = 0.25
+REPLAY_BUFFER_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+
+def _alert_key(alert: dict) -> str:
+    return f"{alert['type']}:{alert.get('item_id', '')}"
+
+
+def _diff_by_key(old: list[dict], new: list[dict], key: Callable[[dict], Any]) -> dict:
+    old_by_key = {key(item): item for item in old}
+    new_by_key = {key(item): item for item in new}
+    return {
+        "added": [item for k, item in new_by_key.items() if k not in old_by_key],
+        "updated": [
+            item for k, item in new_by_key.items()
+            if k in old_by_key and old_by_key[k] != item
+        ],
+        "removed": [k for k in old_by_key if k not in new_by_key],
+    }
+
+
+def diff_snapshots(old: dict, new: dict) -> list[tuple[str, dict]]:
+    """Delta events turning dashboard state `old` into `new`."""
+    events = []
+
+    changed_kpis = {k: v for k, v in new["kpis"].items() if old["kpis"].get(k) != v}
+    if changed_kpis:
+        events.append(("kpis", {"changed": changed_kpis}))
+
+    alerts = _diff_by_key(old["alerts"]["alerts"], new["alerts"]["alerts"], _alert_key)
+    if any(alerts.values()):
+        events.append((
+            "alerts",
+            {**alerts, "total": new["alerts"]["total"], "has_errors": new["alerts"]["has_errors"]},
+        ))
+
+    today = _diff_by_key(
+        old["today"]["appointments"] if old["today"]["date"] == new["today"]["date"] else [],
+        new["today"]["appointments"],
+        lambda appt: appt["id"],
+    )
+    if old["today"]["date"] != new["today"]["date"]:
+        today["removed"] = [appt["id"] for appt in old["today"]["appointments"]]
+    if any(today.values()) or old["today"]["revenue_today"] != new["today"]["revenue_today"]:
+        events.append((
+            "today",
+            {
+                "date": new["today"]["date"],
+                **today,
+                "total_appointments": new["today"]["total_appointments"],
+                "completed_count": new["today"]["completed_count"],
+                "revenue_today": new["today"]["revenue_today"],
+            },
+        ))
+    return events
+
+
+def format_event(event_id: str | None, event_type: str, data: Any) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class DashboardBroadcaster:
+    def __init__(self, snapshot: Callable[[], Awaitable[dict]], refresh_seconds: float):
+        self._snapshot = snapshot
+        self._refresh_seconds = refresh_seconds
+        self._epoch = int(time.time())
+        self._state: dict | None = None
+        self._last_id = 0
+        self._events: deque[tuple[int, str, dict]] = deque(maxlen=REPLAY_BUFFER_SIZE)
+        self._dirty: asyncio.Event | None = None
+        self._updated: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._start_lock = asyncio.Lock()
+        self._subscribers = 0
+
+    def notify(self, entities) -> None:
+        """Invalidation listener; safe to call from any thread."""
+        if self._loop is not None and self._dirty is not None:
+            self._loop.call_soon_threadsafe(self._dirty.set)
+
+    async def _ensure_started(self) -> None:
+        async with self._start_lock:
+            loop = asyncio.get_running_loop()
+            if self._task is not None and not self._task.done() and self._loop is loop:
+                return
+            self._loop = loop
+            self._dirty = asyncio.Event()
+            self._updated = asyncio.Condition()
+            state = await self._snapshot()
+            if self._state is not None:
+                # Changes made while nobody was connected
+                self._record(diff_snapshots(self._state, state))
+            self._state = state
+            if self._subscribers:
+                self._task = asyncio.create_task(self._run())
+
+    def _halt(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+        self._loop = None
+
+    async def stop(self) -> None:
+        """Stop the refresh task (app shutdown)."""
+        task = self._task
+        self._halt()
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _record(self, events: list[tuple[str, dict]]) -> None:
+        for event_type, data in events:
+            self._last_id += 1
+            self._events.append((self._last_id, event_type, data))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._dirty.wait(), timeout=self._refresh_seconds or None)
+                await asyncio.sleep(DEBOUNCE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._dirty.clear()
+            try:
+                state = await self._snapshot()
+            except Exception:
+                logger.exception("Dashboard stream refresh failed")
+                continue
+            events = diff_snapshots(self._state, state)
+            self._state = state
+            if not events:
+                continue
+            self._record(events)
+            async with self._updated:
+                self._updated.notify_all()
+
+    def _event_id(self, n: int) -> str:
+        return f"{self._epoch}-{n}"
+
+    async def stream(self, last_event_id: str | None):
+        """Yield SSE frames for one client, resuming after last_event_id if possible."""
+        self._subscribers += 1
+        try:
+            await self._ensure_started()
+            async for frame in self._frames(last_event_id):
+                yield frame
+        finally:
+            self._subscribers -= 1
+            if not self._subscribers:
+                self._halt()
+
+    async def _frames(self, last_event_id: str | None):
+        # Ids are "<process epoch>-<sequence>" so an id from before a restart
+        # is never mistaken for one in the current sequence
+        resume_from = None
+        if last_event_id:
+            epoch, _, n = last_event_id.partition("-")
+            if epoch == str(self._epoch) and n.isdigit():
+                resume_from = int(n)
+        oldest = self._events[0][0] if self._events else self._last_id + 1
+        if resume_from is not None and oldest - 1 <= resume_from <= self._last_id:
+            cursor = resume_from
+        else:
+            cursor = self._last_id
+            yield format_event(self._event_id(cursor), "snapshot", self._state)
+
+        while True:
+            for n, event_type, data in list(self._events):
+                if n > cursor:
+                    yield format_event(self._event_id(n), event_type, data)
+                    cursor = n
+            async with self._updated:
+                try:
+                    await asyncio.wait_for(
+                        self._updated.wait_for(lambda: self._last_id > cursor),
+                        timeout=HEARTBEAT_SECONDS,
+                    )
+                    heartbeat = False
+                except asyncio.TimeoutError:
+                    heartbeat = True
+            if heartbeat:
+                yield ": heartbeat\n\n"
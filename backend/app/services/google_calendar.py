@@ -2,15 +2,19 @@
 Google Calendar integration service.
 Handles OAuth2 flow and all calendar CRUD operations.
 Tokens are stored in the app_settings table (key: google_tokens).
+googleapiclient and google-auth are blocking, so every network call runs in
+a worker thread (asyncio.to_thread) rather than on the event loop.
 """
+import asyncio
 import json
-from datetime import datetime, timedelta, date
-from typing import Optional
+from datetime import datetime, timedelta
 from app.config import get_settings
 
 settings = get_settings()
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
+# Requests per Google batch call (the API allows up to 50)
+BATCH_SIZE = 50
 
 
 class GoogleCalendarService:
@@ -42,7 +46,7 @@ class GoogleCalendarService:
 
         try:
             flow = self._create_flow()
-            flow.fetch_token(code=code)
+            await asyncio.to_thread(flow.fetch_token, code=code)
             creds = flow.credentials
 
             token_data = {
@@ -99,7 +103,7 @@ class GoogleCalendarService:
         )
 
         if creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+            await asyncio.to_thread(creds.refresh, Request())
             # Save refreshed token
             token_data["token"] = creds.token
             setting.value = json.dumps(token_data)
@@ -107,45 +111,65 @@ class GoogleCalendarService:
 
         return build("calendar", "v3", credentials=creds)
 
-    async def create_event(self, db, appointment, client) -> Optional[str]:
-        """Create a Google Calendar event for an appointment. Returns event ID."""
-        try:
-            service = await self.get_service(db)
-            event = {
-                "summary": f"{client.full_name} — {appointment.service_type}",
-                "description": (
-                    f"Service: {appointment.service_type}\n"
-                    f"Price: ${float(appointment.price):.2f}\n"
-                    f"Phone: {client.phone}\n"
-                    f"Notes: {appointment.notes or 'None'}"
-                ),
-                "start": {
-                    "dateTime": appointment.start_datetime.isoformat(),
-                    "timeZone": settings.salon_timezone,
-                },
-                "end": {
-                    "dateTime": appointment.end_datetime.isoformat(),
-                    "timeZone": settings.salon_timezone,
-                },
-                "reminders": {
-                    "useDefault": False,
-                    "overrides": [
-                        {"method": "popup", "minutes": 60},
-                        {"method": "popup", "minutes": 1440},  # 24h
-                    ],
-                },
-            }
-            result = service.events().insert(calendarId="primary", body=event).execute()
-            return result.get("id")
-        except Exception as e:
-            print(f"Google Calendar create_event error: {e}")
-            return None
+    def _event_body(self, appointment, client) -> dict:
+        return {
+            "summary": f"{client.full_name} — {appointment.service_type}",
+            "description": (
+                f"Service: {appointment.service_type}\n"
+                f"Price: ${float(appointment.price):.2f}\n"
+                f"Phone: {client.phone}\n"
+                f"Notes: {appointment.notes or 'None'}"
+            ),
+            "start": {
+                "dateTime": appointment.start_datetime.isoformat(),
+                "timeZone": settings.salon_timezone,
+            },
+            "end": {
+                "dateTime": appointment.end_datetime.isoformat(),
+                "timeZone": settings.salon_timezone,
+            },
+            "reminders": {
+                "useDefault": False,
+                "overrides": [
+                    {"method": "popup", "minutes": 60},
+                    {"method": "popup", "minutes": 1440},  # 24h
+                ],
+            },
+        }
+
+    async def create_events(self, db, appointments_with_clients: list) -> dict[int, str]:
+        """
+        Create events for many (appointment, client) pairs using batched API
+        requests. Returns {appointment id: event id} for the ones created.
+        """
+        event_ids: dict[int, str] = {}
+
+        def _on_response(request_id, response, exception):
+            if exception is not None:
+                print(f"Google Calendar create_events error (appointment {request_id}): {exception}")
+            elif response.get("id"):
+                event_ids[int(request_id)] = response["id"]
+
+        service = await self.get_service(db)
+        for start in range(0, len(appointments_with_clients), BATCH_SIZE):
+            batch = service.new_batch_http_request(callback=_on_response)
+            for appointment, client in appointments_with_clients[start:start + BATCH_SIZE]:
+                batch.add(
+                    service.events().insert(
+                        calendarId="primary", body=self._event_body(appointment, client)
+                    ),
+                    request_id=str(appointment.id),
+                )
+            await asyncio.to_thread(batch.execute)
+        return event_ids
 
     async def update_event(self, db, google_event_id: str, appointment, client) -> bool:
         """Update an existing Google Calendar event."""
         try:
             service = await self.get_service(db)
-            event = service.events().get(calendarId="primary", eventId=google_event_id).execute()
+            event = await asyncio.to_thread(
+                service.events().get(calendarId="primary", eventId=google_event_id).execute
+            )
             event["summary"] = f"{client.full_name} — {appointment.service_type}"
             event["description"] = (
                 f"Service: {appointment.service_type}\n"
@@ -155,7 +179,9 @@ class GoogleCalendarService:
             )
             event["start"]["dateTime"] = appointment.start_datetime.isoformat()
             event["end"]["dateTime"] = appointment.end_datetime.isoformat()
-            service.events().update(calendarId="primary", eventId=google_event_id, body=event).execute()
+            await asyncio.to_thread(
+                service.events().update(calendarId="primary", eventId=google_event_id, body=event).execute
+            )
             return True
         except Exception as e:
             print(f"Google Calendar update_event error: {e}")
@@ -165,68 +191,24 @@ class GoogleCalendarService:
         """Delete a Google Calendar event."""
         try:
             service = await self.get_service(db)
-            service.events().delete(calendarId="primary", eventId=google_event_id).execute()
+            await asyncio.to_thread(
+                service.events().delete(calendarId="primary", eventId=google_event_id).execute
+            )
             return True
         except Exception as e:
+            # Already deleted on the Google side
+            if getattr(getattr(e, "resp", None), "status", None) in (404, 410):
+                return True
             print(f"Google Calendar delete_event error: {e}")
             return False
 
-    async def get_available_slots(
-        self,
-        db,
-        check_date: date,
-        duration_minutes: int = 60
-    ) -> list[str]:
-        """Return available booking slots as ISO datetime strings."""
-        try:
-            service = await self.get_service(db)
-            start_of_day = datetime.combine(check_date, datetime.strptime(settings.salon_hours_start, "%H:%M").time())
-            end_of_day = datetime.combine(check_date, datetime.strptime(settings.salon_hours_end, "%H:%M").time())
-
-            # Get busy times
-            body = {
-                "timeMin": start_of_day.isoformat() + "Z",
-                "timeMax": end_of_day.isoformat() + "Z",
-                "items": [{"id": "primary"}],
-            }
-            freebusy = service.freebusy().query(body=body).execute()
-            busy = freebusy.get("calendars", {}).get("primary", {}).get("busy", [])
-
-            # Build list of busy intervals
-            busy_intervals = [
-                (
-                    datetime.fromisoformat(b["start"].replace("Z", "")),
-                    datetime.fromisoformat(b["end"].replace("Z", "")),
-                )
-                for b in busy
-            ]
-
-            # Generate 30-minute slots and filter out busy ones
-            slots = []
-            slot_start = start_of_day
-            while slot_start + timedelta(minutes=duration_minutes) <= end_of_day:
-                slot_end = slot_start + timedelta(minutes=duration_minutes)
-                # Check if this slot overlaps any busy period
-                is_free = all(
-                    slot_end <= busy_start or slot_start >= busy_end
-                    for busy_start, busy_end in busy_intervals
-                )
-                if is_free:
-                    slots.append(slot_start.isoformat())
-                slot_start += timedelta(minutes=30)  # 30-min increments
-
-            return slots
-        except Exception as e:
-            print(f"Google Calendar get_available_slots error: {e}")
-            return []
-
     async def sync_from_google(self, db) -> list[dict]:
         """Pull events from Google Calendar for the next 90 days."""
         try:
             service = await self.get_service(db)
             now = datetime.utcnow().isoformat() + "Z"
             end = (datetime.utcnow() + timedelta(days=90)).isoformat() + "Z"
-            events_result = (
+            events_result = await asyncio.to_thread(
                 service.events()
                 .list(
                     calendarId="primary",
@@ -235,7 +217,7 @@ class GoogleCalendarService:
                     singleEvents=True,
                     orderBy="startTime",
                 )
-                .execute()
+                .execute
             )
             return events_result.get("items", [])
         except Exception as e:
@@ -248,7 +230,7 @@ class GoogleCalendarService:
             return {"connected": False, "reason": "Google credentials not configured"}
         try:
             service = await self.get_service(db)
-            cal = service.calendars().get(calendarId="primary").execute()
+            cal = await asyncio.to_thread(service.calendars().get(calendarId="primary").execute)
             return {"connected": True, "calendar_name": cal.get("summary", "Primary")}
         except RuntimeError as e:
             return {"connected": False, "reason": str(e)}
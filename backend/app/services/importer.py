@@ -0,0 +1,276 @@
+"""
+Bulk import of clients and historical appointments from a previous booking tool.
+
+Rows are validated one by one so a bad row is reported rather than failing the
+file, but all database work is set-wise: one upsert for the clients, one
+phone -> id lookup, one insert for the appointments and one UPDATE that
+recomputes visit stats for every touched client. Imported upcoming bookings
+that overlap existing ones (or each other) are flagged needs_review.
+
+CLI:
+    python -m app.services.importer --clients clients.csv --appointments appointments.csv
+"""
+from datetime import timedelta
+from typing import Iterable
+from pydantic import ValidationError
+from sqlalchemy import and_, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import is_sqlite
+from app.models.appointment import Appointment
+from app.models.client import Client
+from app.schemas.appointment import AppointmentImportRow
+from app.schemas.client import ClientImportRow, normalize_phone
+from app.services.availability import mark_days_changed
+from app.services.booking import find_batch_overlaps, lock_bookings
+from app.services.change_log import record_changes
+from app.services.counters import reconcile_counters
+from app.services.rollups import rebuild_rollups
+
+APPOINTMENT_STATUSES = {"scheduled", "completed", "cancelled", "no_show", "needs_review"}
+
+# Keeps IN lists well under SQLite's bound-parameter limit
+CHUNK_SIZE = 500
+
+
+def _chunks(items: list, size: int = CHUNK_SIZE) -> Iterable[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _row_error(errors: list, section: str, index: int, message: str) -> None:
+    # Rows are numbered from 1 in the order they were submitted
+    errors.append({"section": section, "row": index + 1, "error": message})
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in exc.errors()
+    )
+
+
+def _normalize_phones(raw_rows: list[dict], section: str, errors: list) -> dict[int, str]:
+    """Normalize every row's phone up front; returns {row index: E.164 phone}."""
+    phones = {}
+    for index, raw in enumerate(raw_rows):
+        try:
+            phones[index] = normalize_phone(str(raw.get("phone") or ""))
+        except ValueError as e:
+            _row_error(errors, section, index, f"phone: {e}")
+    return phones
+
+
+async def _client_ids_by_phone(db: AsyncSession, phones: Iterable[str]) -> dict[str, int]:
+    ids = {}
+    for chunk in _chunks(list(set(phones))):
+        result = await db.execute(select(Client.phone, Client.id).where(Client.phone.in_(chunk)))
+        ids.update({phone: client_id for phone, client_id in result.all()})
+    return ids
+
+
+async def _upsert_clients(db: AsyncSession, raw_rows: list[dict], errors: list) -> dict:
+    phones = _normalize_phones(raw_rows, "clients", errors)
+
+    # Dedupe in memory: later rows for the same phone fill in or override the
+    # fields they actually give; consent given by any row is kept
+    merged: dict[str, dict] = {}
+    duplicates = 0
+    for index, phone in phones.items():
+        try:
+            row = ClientImportRow.model_validate({**raw_rows[index], "phone": phone})
+        except ValidationError as e:
+            _row_error(errors, "clients", index, _validation_message(e))
+            continue
+        values = row.model_dump(exclude_unset=True, exclude_none=True)
+        if phone in merged:
+            duplicates += 1
+            consent = merged[phone].get("gdpr_consent", False) or values.get("gdpr_consent", False)
+            merged[phone].update(values, gdpr_consent=consent)
+        else:
+            merged[phone] = values
+
+    if not merged:
+        return {"imported": 0, "duplicates_merged": duplicates}
+
+    insert_fn = sqlite_insert if is_sqlite else pg_insert
+    stmt = insert_fn(Client)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Client.phone],
+        set_={
+            "full_name": stmt.excluded.full_name,
+            "email": func.coalesce(stmt.excluded.email, Client.email),
+            "notes": func.coalesce(stmt.excluded.notes, Client.notes),
+            "first_visit_date": func.coalesce(Client.first_visit_date, stmt.excluded.first_visit_date),
+            # Re-imports can record consent but never withdraw it
+            "gdpr_consent": or_(Client.gdpr_consent, stmt.excluded.gdpr_consent),
+            "updated_at": func.now(),
+        },
+    )
+    # executemany needs every row to bind the same keys
+    rows = [
+        {
+            "full_name": values["full_name"],
+            "phone": values["phone"],
+            "email": values.get("email"),
+            "notes": values.get("notes"),
+            "first_visit_date": values.get("first_visit_date"),
+            "gdpr_consent": values.get("gdpr_consent", False),
+        }
+        for values in merged.values()
+    ]
+    for chunk in _chunks(rows):
+        await db.execute(stmt, chunk)
+
+    client_ids = await _client_ids_by_phone(db, merged)
+    await record_changes(db, "clients", client_ids.values())
+    return {"imported": len(merged), "duplicates_merged": duplicates}
+
+
+async def _insert_appointments(db: AsyncSession, raw_rows: list[dict], errors: list) -> tuple[dict, set[int]]:
+    phones = _normalize_phones(raw_rows, "appointments", errors)
+    client_ids = await _client_ids_by_phone(db, phones.values())
+
+    pending: dict[tuple[int, object], dict] = {}
+    duplicates = 0
+    for index, phone in phones.items():
+        try:
+            row = AppointmentImportRow.model_validate({**raw_rows[index], "phone": phone})
+        except ValidationError as e:
+            _row_error(errors, "appointments", index, _validation_message(e))
+            continue
+        client_id = client_ids.get(phone)
+        if client_id is None:
+            _row_error(errors, "appointments", index, f"phone: no client with phone {phone}")
+            continue
+        if row.status not in APPOINTMENT_STATUSES:
+            _row_error(errors, "appointments", index, f"status: must be one of {sorted(APPOINTMENT_STATUSES)}")
+            continue
+        key = (client_id, row.start_datetime)
+        if key in pending:
+            duplicates += 1
+            continue
+        pending[key] = {
+            "client_id": client_id,
+            "service_type": row.service_type,
+            "duration_minutes": row.duration_minutes,
+            "price": row.price,
+            "status": row.status,
+            "start_datetime": row.start_datetime,
+            "end_datetime": row.start_datetime + timedelta(minutes=row.duration_minutes),
+            "notes": row.notes,
+        }
+
+    # Re-running an import must not duplicate history already in the database
+    keys = list(pending)
+    for chunk in _chunks(keys):
+        result = await db.execute(
+            select(Appointment.client_id, Appointment.start_datetime).where(
+                tuple_(Appointment.client_id, Appointment.start_datetime).in_(chunk)
+            )
+        )
+        for existing in result.all():
+            if pending.pop(tuple(existing), None) is not None:
+                duplicates += 1
+
+    rows = list(pending.values())
+    # Upcoming bookings that collide with the calendar or each other are
+    # imported for review rather than as confirmed slots
+    await lock_bookings(db)
+    upcoming = [row for row in rows if row["status"] == "scheduled"]
+    flagged = await find_batch_overlaps(db, upcoming)
+    for index in flagged:
+        upcoming[index]["status"] = "needs_review"
+
+    appointment_ids = []
+    for chunk in _chunks(rows):
+        result = await db.execute(insert(Appointment).returning(Appointment.id), chunk)
+        appointment_ids.extend(result.scalars().all())
+    await record_changes(db, "appointments", appointment_ids)
+    mark_days_changed(db.sync_session)
+
+    touched = {row["client_id"] for row in rows}
+    summary = {"imported": len(rows), "duplicates_skipped": duplicates, "overlaps_flagged": len(flagged)}
+    return summary, touched
+
+
+async def recompute_client_stats(db: AsyncSession, client_ids: Iterable[int]) -> None:
+    """Recompute visit count, spend and visit dates from completed appointments."""
+    completed = and_(
+        Appointment.client_id == Client.id,
+        Appointment.status == "completed",
+    )
+    visit_count = select(func.count(Appointment.id)).where(completed).scalar_subquery()
+    spent = select(func.coalesce(func.sum(Appointment.price), 0)).where(completed).scalar_subquery()
+    last_visit = select(func.date(func.max(Appointment.start_datetime))).where(completed).scalar_subquery()
+    first_visit = select(func.date(func.min(Appointment.start_datetime))).where(completed).scalar_subquery()
+
+    ids = list(client_ids)
+    for chunk in _chunks(ids):
+        await db.execute(
+            update(Client)
+            .where(Client.id.in_(chunk))
+            .values(
+                total_visits=visit_count,
+                total_spent=spent,
+                last_visit_date=last_visit,
+                first_visit_date=func.coalesce(Client.first_visit_date, first_visit),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    await record_changes(db, "clients", ids)
+
+
+async def import_records(db: AsyncSession, clients: list[dict], appointments: list[dict]) -> dict:
+    """Import clients, then appointments matched to them by phone. Caller commits."""
+    errors: list[dict] = []
+    client_summary = await _upsert_clients(db, clients, errors)
+    appointment_summary, touched = await _insert_appointments(db, appointments, errors)
+    if touched:
+        await recompute_client_stats(db, touched)
+    # The bulk writes bypass the ORM counter and rollup hooks. Imports are
+    # rare and mostly history, so rebuild the rollups wholesale.
+    await reconcile_counters(db)
+    await rebuild_rollups(db)
+    return {
+        "clients": client_summary,
+        "appointments": appointment_summary,
+        "errors": errors,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import csv
+    import json
+
+    parser = argparse.ArgumentParser(description="Bulk import clients and historical appointments")
+    parser.add_argument("--clients", help="CSV with full_name, phone, email, notes, first_visit_date")
+    parser.add_argument(
+        "--appointments",
+        help="CSV with phone, service_type, start_datetime, duration_minutes, price, status, notes",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Validate and roll back")
+    args = parser.parse_args()
+
+    def _read_csv(path: str | None) -> list[dict]:
+        if not path:
+            return []
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            # Empty cells mean "not provided", not empty strings
+            return [{k: v for k, v in row.items() if v not in ("", None)} for row in csv.DictReader(f)]
+
+    async def _main():
+        from app.database import AsyncSessionLocal, run_migrations
+
+        await run_migrations()
+        async with AsyncSessionLocal() as db:
+            summary = await import_records(db, _read_csv(args.clients), _read_csv(args.appointments))
+            if args.dry_run:
+                await db.rollback()
+            else:
+                await db.commit()
+        print(json.dumps(summary, indent=2))
+
+    asyncio.run(_main())
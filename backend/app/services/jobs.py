@@ -0,0 +1,200 @@
+"""
+Background jobs.
+
+Endpoints that would otherwise do heavy work inline enqueue a row in the jobs
+table and return its id straight away; clients poll GET /jobs/{id} for status
+and progress. A worker task in the API process claims queued jobs oldest
+first (JOB_WORKER_CONCURRENCY at a time) and runs the handler registered for
+the job's kind:
+
+    @job_handler("report_metrics")
+    async def run(params: dict, progress: JobProgress) -> dict: ...
+
+Jobs live in the database, so nothing is lost on restart: anything left
+running by a previous process is put back in the queue when the worker starts.
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.job import Job
+
+settings = get_settings()
+
+JobHandler = Callable[[dict, "JobProgress"], Awaitable[dict | None]]
+JOB_HANDLERS: dict[str, JobHandler] = {}
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+
+def job_handler(kind: str):
+    """Register the coroutine that runs jobs of `kind`."""
+    def _register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+    return _register
+
+
+async def enqueue_job(db: AsyncSession, kind: str, params: dict, total: int = 1) -> Job:
+    """Queue a job in the caller's transaction; call job_worker.notify() after committing."""
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"No handler registered for job kind {kind!r}")
+    job = Job(kind=kind, params_json=json.dumps(params), status="queued", progress_total=total)
+    db.add(job)
+    await db.flush()
+    return job
+
+
+def job_status(job: Job) -> dict:
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "progress": {
+            "done": job.progress_done,
+            "total": job.progress_total,
+            "percent": round(100 * job.progress_done / job.progress_total, 1)
+            if job.progress_total else 0.0,
+        },
+        "params": json.loads(job.params_json) if job.params_json else None,
+        "result": json.loads(job.result_json) if job.result_json else None,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+class JobProgress:
+    """Handed to a running handler to report how far along it is."""
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+
+    async def update(self, done: int, total: int | None = None) -> None:
+        values = {"progress_done": done}
+        if total is not None:
+            values["progress_total"] = total
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(Job).where(Job.id == self.job_id).values(**values))
+            await db.commit()
+
+
+async def prune_jobs(db: AsyncSession, older_than_days: int) -> int:
+    """Delete finished jobs older than the given age. Returns the number removed."""
+    cutoff = datetime.now() - timedelta(days=older_than_days)
+    result = await db.execute(
+        delete(Job).where(Job.status.in_(FINISHED_STATUSES), Job.finished_at < cutoff)
+    )
+    return result.rowcount
+
+
+class JobWorker:
+    def __init__(self, concurrency: int, poll_seconds: float):
+        self._concurrency = max(1, concurrency)
+        self._poll_seconds = poll_seconds
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+
+    def notify(self) -> None:
+        """Wake the worker after committing a new job; safe to call from any thread."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def start(self) -> None:
+        async with AsyncSessionLocal() as db:
+            requeued = await db.execute(
+                update(Job).where(Job.status == "running").values(status="queued", started_at=None)
+            )
+            await db.commit()
+        if requeued.rowcount:
+            print(f"[Jobs] Re-queued {requeued.rowcount} jobs interrupted by a restart")
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        tasks = [t for t in (self._task, *self._running) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._loop = None
+
+    async def _run(self) -> None:
+        slots = asyncio.Semaphore(self._concurrency)
+        while True:
+            await slots.acquire()
+            self._wake.clear()
+            try:
+                job_id = await self._claim_next()
+            except Exception as e:
+                print(f"[Jobs] Failed to claim a job: {e}")
+                job_id = None
+            if job_id is None:
+                slots.release()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self._poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.create_task(self._execute(job_id))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+            task.add_done_callback(lambda _: slots.release())
+
+    async def _claim_next(self) -> int | None:
+        async with AsyncSessionLocal() as db:
+            while True:
+                job_id = (await db.execute(
+                    select(Job.id).where(Job.status == "queued").order_by(Job.id).limit(1)
+                )).scalar()
+                if job_id is None:
+                    return None
+                # Conditional update so two workers never both take the same job
+                claimed = await db.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.status == "queued")
+                    .values(status="running", started_at=datetime.now())
+                )
+                await db.commit()
+                if claimed.rowcount:
+                    return job_id
+
+    async def _execute(self, job_id: int) -> None:
+        async with AsyncSessionLocal() as db:
+            job = await db.get(Job, job_id)
+            if job is None:
+                # Deleted between claim and execute; nothing left to run or update
+                print(f"[Jobs] Job {job_id} disappeared before it could run")
+                return
+            kind, params = job.kind, json.loads(job.params_json or "{}")
+
+        try:
+            handler = JOB_HANDLERS[kind]
+            result = await handler(params, JobProgress(job_id))
+            values = dict(
+                status="succeeded",
+                progress_done=Job.progress_total,
+                result_json=json.dumps(result, default=str) if result is not None else None,
+            )
+        except asyncio.CancelledError:
+            # Shutting down; the next start() puts it back in the queue
+            raise
+        except Exception as e:
+            print(f"[Jobs] Job {job_id} ({kind}) failed: {e}")
+            values = dict(status="failed", error=str(e) or type(e).__name__)
+
+        values["finished_at"] = datetime.now()
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(Job).where(Job.id == job_id).values(**values))
+            await db.commit()
+
+
+job_worker = JobWorker(settings.job_worker_concurrency, settings.job_poll_seconds)
@@ -0,0 +1,217 @@
+"""
+Monthly report computation.
+
+Every metric for a month comes from one statement: the month's daily_rollup
+rows, its daily_service_rollup rows and a single row of the two client/lead
+counts that don't roll up by day, UNION ALLed together and folded in Python.
+Generation runs as a background job (kind "report_metrics", see
+app.services.jobs): months are computed concurrently on separate read
+sessions, REPORT_BACKFILL_CONCURRENCY at a time, and each batch is saved with
+one upsert before progress is reported.
+"""
+import asyncio
+import json
+from datetime import datetime
+from sqlalchemy import Date, String, and_, func, literal, null, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
+from app.database import AsyncSessionLocal, ReadSessionLocal, is_sqlite
+from app.models.client import Client
+from app.models.lead import ExtensionLead
+from app.models.report import Report
+from app.models.rollup import DailyRollup, DailyServiceRollup
+from app.models.types import to_cents
+from app.services.change_log import record_changes
+from app.services.jobs import JobProgress, job_handler
+
+settings = get_settings()
+
+TOP_SERVICES = 5
+
+
+def month_bounds(month: str) -> tuple[datetime, datetime]:
+    """[start, end) datetimes for a "YYYY-MM" month. Raises ValueError if malformed."""
+    year, mon = map(int, month.split("-"))
+    start = datetime(year, mon, 1)
+    end = datetime(year + 1, 1, 1) if mon == 12 else datetime(year, mon + 1, 1)
+    return start, end
+
+
+def month_range(first: str, last: str) -> list[str]:
+    """Every "YYYY-MM" month from first to last inclusive."""
+    start, _ = month_bounds(first)
+    end, _ = month_bounds(last)
+    months = []
+    while start <= end:
+        months.append(start.strftime("%Y-%m"))
+        start = month_bounds(months[-1])[1]
+    return months
+
+
+def _month_statement(month_start: datetime, month_end: datetime):
+    first_day, end_day = month_start.date(), month_end.date()
+    zero = literal(0)
+
+    days = select(
+        literal("day").label("kind"),
+        DailyRollup.day.label("day"),
+        null().cast(String).label("service_type"),
+        DailyRollup.revenue.label("revenue"),
+        DailyRollup.completed_count.label("count"),
+        DailyRollup.new_clients_count.label("new_clients"),
+        zero.label("lapsed_recovered"),
+        zero.label("leads_converted"),
+    ).where(and_(DailyRollup.day >= first_day, DailyRollup.day < end_day))
+
+    services = select(
+        literal("service"),
+        DailyServiceRollup.day,
+        DailyServiceRollup.service_type,
+        DailyServiceRollup.revenue,
+        DailyServiceRollup.completed_count,
+        zero, zero, zero,
+    ).where(and_(DailyServiceRollup.day >= first_day, DailyServiceRollup.day < end_day))
+
+    # Lapsed clients recovered (simplified: clients with last_visit_date in
+    # this month who have >1 visits) and leads converted this month
+    lapsed_recovered = select(func.count(Client.id)).where(
+        and_(
+            Client.last_visit_date >= first_day,
+            Client.last_visit_date < end_day,
+            Client.total_visits > 1,
+            Client.is_lapsed == False,  # noqa: E712
+        )
+    ).scalar_subquery()
+    leads_converted = select(func.count(ExtensionLead.id)).where(
+        and_(
+            ExtensionLead.pipeline_stage == "booked",
+            ExtensionLead.updated_at >= month_start,
+            ExtensionLead.updated_at < month_end,
+        )
+    ).scalar_subquery()
+    counts = select(
+        literal("counts"),
+        null().cast(Date),
+        null().cast(String),
+        zero, zero, zero,
+        lapsed_recovered,
+        leads_converted,
+    )
+
+    return union_all(days, services, counts)
+
+
+async def compute_month_report(db: AsyncSession, month: str) -> dict:
+    """All report metrics for a "YYYY-MM" month, in one round trip."""
+    month_start, month_end = month_bounds(month)
+    rows = (await db.execute(_month_statement(month_start, month_end))).all()
+
+    revenue_cents = appointments = new_clients = lapsed_recovered = leads_converted = 0
+    daily_revenue = []
+    services: dict[str, list[int]] = {}
+    for row in rows:
+        if row.kind == "day":
+            revenue_cents += to_cents(row.revenue)
+            appointments += row.count
+            new_clients += row.new_clients
+            if row.count:
+                daily_revenue.append((row.day, row.revenue))
+        elif row.kind == "service":
+            totals = services.setdefault(row.service_type, [0, 0])
+            totals[0] += row.count
+            totals[1] += to_cents(row.revenue)
+        else:
+            lapsed_recovered, leads_converted = row.lapsed_recovered, row.leads_converted
+
+    top_services = sorted(
+        ((name, count, cents) for name, (count, cents) in services.items() if count),
+        key=lambda item: (-item[1], item[0]),
+    )[:TOP_SERVICES]
+    return {
+        "report_month": month,
+        "revenue_total": revenue_cents / 100,
+        "appointments_count": appointments,
+        "new_clients_count": new_clients,
+        "lapsed_recovered": lapsed_recovered,
+        "leads_converted": leads_converted,
+        "top_services": [
+            {"service": name, "count": count, "revenue": cents / 100}
+            for name, count, cents in top_services
+        ],
+        "daily_revenue": [
+            {"date": str(day), "revenue": revenue} for day, revenue in sorted(daily_revenue)
+        ],
+    }
+
+
+async def save_reports(db: AsyncSession, reports: list[dict]) -> None:
+    """Insert or overwrite the computed metrics of each report (one statement). Caller commits."""
+    if not reports:
+        return
+    insert_fn = sqlite_insert if is_sqlite else pg_insert
+    stmt = insert_fn(Report)
+    columns = (
+        "revenue_total", "appointments_count", "new_clients_count",
+        "lapsed_recovered", "leads_converted", "top_services_json", "charts_data_json",
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Report.report_month],
+        set_={**{c: stmt.excluded[c] for c in columns}, "updated_at": func.now()},
+    ).returning(Report.id)
+    result = await db.execute(
+        stmt,
+        [
+            {
+                "report_month": r["report_month"],
+                "revenue_total": r["revenue_total"],
+                "appointments_count": r["appointments_count"],
+                "new_clients_count": r["new_clients_count"],
+                "lapsed_recovered": r["lapsed_recovered"],
+                "leads_converted": r["leads_converted"],
+                "top_services_json": json.dumps(r["top_services"]),
+                "charts_data_json": json.dumps({"daily_revenue": r["daily_revenue"]}),
+            }
+            for r in reports
+        ],
+    )
+    await record_changes(db, "reports", result.scalars().all())
+
+
+async def compute_months(months: list[str], concurrency: int | None = None) -> list[dict]:
+    """Compute many months concurrently, each on its own read session."""
+    semaphore = asyncio.Semaphore(concurrency or settings.report_backfill_concurrency)
+
+    async def _compute(month: str) -> dict:
+        async with semaphore:
+            async with ReadSessionLocal() as db:
+                return await compute_month_report(db, month)
+
+    return list(await asyncio.gather(*(_compute(month) for month in months)))
+
+
+def report_summary(report: dict) -> dict:
+    return {
+        "report_month": report["report_month"],
+        "revenue_total": report["revenue_total"],
+        "appointments_count": report["appointments_count"],
+        "new_clients_count": report["new_clients_count"],
+    }
+
+
+@job_handler("report_metrics")
+async def run_report_job(params: dict, progress: JobProgress) -> dict:
+    """Compute and save the reports for params["months"], one batch at a time."""
+    months = params["months"]
+    batch_size = max(1, settings.report_backfill_concurrency)
+    await progress.update(0, len(months))
+    summaries = []
+    for start in range(0, len(months), batch_size):
+        reports = await compute_months(months[start:start + batch_size])
+        async with AsyncSessionLocal() as db:
+            await save_reports(db, reports)
+            await db.commit()
+        summaries.extend(report_summary(r) for r in reports)
+        await progress.update(start + len(reports))
+    return {"reports": summaries}
@@ -0,0 +1,213 @@
+"""
+Cohort retention analytics (GET /reports/cohorts).
+
+Clients are grouped into monthly acquisition cohorts by first_visit_date. The
+heavy lifting is set-wise in the database: a handful of GROUP BY statements
+reduce the whole appointment history to small matrices — active clients per
+(cohort, months since first visit), clients per (cohort, month of last
+visit), and rebooking gaps per (previous service, weeks) via a LAG window —
+so the Python side only folds a few hundred aggregate cells, however many
+appointments there are.
+
+Only completed months are analysed, so a result never changes until the
+month rolls over (or history is edited); the router caches it per closed
+month.
+"""
+from datetime import date, datetime
+from sqlalchemy import Integer, and_, cast, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import is_sqlite
+from app.models.appointment import Appointment
+from app.models.client import Client
+
+# A client with no completed visit for this many months counts as churned
+# (matches the 90-day lapsed-client rule)
+CHURN_AFTER_MONTHS = 3
+
+
+def _month_index(column):
+    """Months since year 0 — lets month offsets be computed with plain subtraction."""
+    return extract("year", column) * 12 + extract("month", column) - 1
+
+
+def _month_label(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _weeks_between(later, earlier):
+    if is_sqlite:
+        return cast((func.julianday(later) - func.julianday(earlier)) / 7, Integer)
+    return func.floor(extract("epoch", later - earlier) / (7 * 86400))
+
+
+def _percentile(histogram: dict[int, int], fraction: float) -> int | None:
+    total = sum(histogram.values())
+    if not total:
+        return None
+    threshold = fraction * total
+    seen = 0
+    for weeks in sorted(histogram):
+        seen += histogram[weeks]
+        if seen >= threshold:
+            return weeks
+    return None
+
+
+async def cohort_retention(db: AsyncSession, as_of: str, months: int) -> dict:
+    """
+    Retention for the `months` cohorts up to and including the closed month
+    `as_of` ("YYYY-MM"). Activity after `as_of` is ignored.
+    """
+    year, mon = map(int, as_of.split("-"))
+    last_index = year * 12 + mon - 1
+    first_index = last_index - months + 1
+    window_end = datetime(year + mon // 12, mon % 12 + 1, 1)
+
+    cohort = _month_index(Client.first_visit_date)
+    in_window = and_(
+        Client.first_visit_date.is_not(None),
+        Client.first_visit_date < window_end.date(),
+        cohort >= first_index,
+    )
+
+    # Distinct (client, month) pairs with a completed visit
+    active = (
+        select(Appointment.client_id, _month_index(Appointment.start_datetime).label("month"))
+        .where(and_(Appointment.status == "completed", Appointment.start_datetime < window_end))
+        .distinct()
+        .subquery()
+    )
+
+    sizes_result = await db.execute(
+        select(cohort, func.count(Client.id)).where(in_window).group_by(cohort)
+    )
+    sizes = {int(c): n for c, n in sizes_result.all()}
+
+    offset = active.c.month - cohort
+    matrix_result = await db.execute(
+        select(cohort, offset, func.count())
+        .select_from(Client)
+        .join(active, active.c.client_id == Client.id)
+        .where(and_(in_window, offset >= 0))
+        .group_by(cohort, offset)
+    )
+    matrix: dict[int, dict[int, int]] = {}
+    for c, k, n in matrix_result.all():
+        matrix.setdefault(int(c), {})[int(k)] = n
+
+    # Month of each client's last visit relative to their cohort; clients
+    # with no completed visit on record count as last seen in month 0
+    last_seen = (
+        select(active.c.client_id, func.max(active.c.month).label("month"))
+        .group_by(active.c.client_id)
+        .subquery()
+    )
+    last_offset = func.coalesce(last_seen.c.month - cohort, 0)
+    churn_result = await db.execute(
+        select(cohort, last_offset, func.count())
+        .select_from(Client)
+        .outerjoin(last_seen, last_seen.c.client_id == Client.id)
+        .where(in_window)
+        .group_by(cohort, last_offset)
+    )
+    last_by_cohort: dict[int, dict[int, int]] = {}
+    for c, k, n in churn_result.all():
+        last_by_cohort.setdefault(int(c), {})[max(int(k), 0)] = n
+
+    cohorts = []
+    retained_sum: dict[int, int] = {}
+    eligible_sum: dict[int, int] = {}
+    for index in range(first_index, last_index + 1):
+        size = sizes.get(index, 0)
+        age = last_index - index
+        counts = [matrix.get(index, {}).get(k, 0) for k in range(age + 1)]
+        for k, n in enumerate(counts):
+            retained_sum[k] = retained_sum.get(k, 0) + n
+            eligible_sum[k] = eligible_sum.get(k, 0) + size
+        cohorts.append({
+            "cohort": _month_label(index),
+            "size": size,
+            "active": counts,
+            "retention": [round(n / size, 4) if size else None for n in counts],
+        })
+
+    # Churn curve: of the clients whose cohort is old enough to tell, the
+    # share whose last visit was at or before month k
+    churn_curve = []
+    for k in range(months - CHURN_AFTER_MONTHS):
+        eligible = churned = 0
+        for index, by_offset in last_by_cohort.items():
+            if last_index - index < k + CHURN_AFTER_MONTHS:
+                continue
+            eligible += sum(by_offset.values())
+            churned += sum(n for last, n in by_offset.items() if last <= k)
+        churn_curve.append({
+            "month": k,
+            "eligible": eligible,
+            "churned_pct": round(100 * churned / eligible, 1) if eligible else None,
+        })
+
+    return {
+        "as_of": as_of,
+        "cohorts": cohorts,
+        "average_retention": [
+            round(retained_sum[k] / eligible_sum[k], 4) if eligible_sum[k] else None
+            for k in sorted(eligible_sum)
+        ],
+        "churn_after_months": CHURN_AFTER_MONTHS,
+        "churn_curve": churn_curve,
+        "rebooking_intervals": await rebooking_intervals(db, window_end),
+    }
+
+
+async def rebooking_intervals(db: AsyncSession, before: datetime) -> dict:
+    """Weeks between each completed visit and the client's next one, overall and by service."""
+    completed = (
+        select(
+            Appointment.start_datetime.label("start"),
+            func.lag(Appointment.start_datetime).over(
+                partition_by=Appointment.client_id, order_by=Appointment.start_datetime
+            ).label("previous_start"),
+            func.lag(Appointment.service_type).over(
+                partition_by=Appointment.client_id, order_by=Appointment.start_datetime
+            ).label("previous_service"),
+        )
+        .where(and_(Appointment.status == "completed", Appointment.start_datetime < before))
+        .subquery()
+    )
+    weeks = _weeks_between(completed.c.start, completed.c.previous_start)
+    result = await db.execute(
+        select(completed.c.previous_service, weeks, func.count())
+        .where(completed.c.previous_start.is_not(None))
+        .group_by(completed.c.previous_service, weeks)
+    )
+
+    overall: dict[int, int] = {}
+    by_service: dict[str, dict[int, int]] = {}
+    for service, w, n in result.all():
+        w = int(w)
+        overall[w] = overall.get(w, 0) + n
+        service_hist = by_service.setdefault(service, {})
+        service_hist[w] = service_hist.get(w, 0) + n
+
+    def _summary(histogram: dict[int, int]) -> dict:
+        return {
+            "count": sum(histogram.values()),
+            "p25_weeks": _percentile(histogram, 0.25),
+            "median_weeks": _percentile(histogram, 0.5),
+            "p75_weeks": _percentile(histogram, 0.75),
+        }
+
+    return {
+        **_summary(overall),
+        "histogram_weeks": [{"weeks": w, "count": overall[w]} for w in sorted(overall)],
+        "by_service": {
+            service: _summary(hist) for service, hist in sorted(by_service.items())
+        },
+    }
+
+
+def last_closed_month(today: date | None = None) -> str:
+    today = today or date.today()
+    index = today.year * 12 + today.month - 2
+    return _month_label(index)
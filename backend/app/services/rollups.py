@@ -0,0 +1,235 @@
+"""
+Daily revenue/activity rollups (daily_rollup, daily_service_rollup).
+
+An after_flush hook turns every flushed appointment into its contribution to
+the rollups before and after the write — revenue and completed count for
+completed appointments, otherwise a no-show or cancellation — and upserts the
+difference in the same transaction. A status transition, price edit or
+reschedule therefore moves exactly the totals it affects; new clients are
+counted on their created_at date the same way.
+
+rebuild_rollups() recomputes a date range from the source rows (backfill,
+or repair after Core-level bulk writes that bypass the hook).
+"""
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from sqlalchemy import and_, case, delete, event, func, insert, literal, select, union_all
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.database import is_sqlite
+from app.models.appointment import Appointment
+from app.models.client import Client
+from app.models.rollup import DailyRollup, DailyServiceRollup
+from app.models.types import to_cents
+from app.services.counters import flushed_values
+
+APPOINTMENT_COLUMNS = ("start_datetime", "status", "price", "service_type")
+DAILY_METRICS = ("revenue", "completed_count", "no_show_count", "cancelled_count", "new_clients_count")
+SERVICE_METRICS = ("completed_count", "revenue")
+
+_insert = sqlite_insert if is_sqlite else pg_insert
+
+
+def _add_contribution(values: dict, sign: int, daily: dict, services: dict) -> None:
+    day = values["start_datetime"].date()
+    status = values["status"]
+    if status == "completed":
+        cents = sign * to_cents(values["price"])
+        daily[day]["revenue"] += cents
+        daily[day]["completed_count"] += sign
+        services[(day, values["service_type"])]["revenue"] += cents
+        services[(day, values["service_type"])]["completed_count"] += sign
+    elif status == "no_show":
+        daily[day]["no_show_count"] += sign
+    elif status == "cancelled":
+        daily[day]["cancelled_count"] += sign
+
+
+def _increment(model, keys: tuple[str, ...], metrics: tuple[str, ...]):
+    stmt = _insert(model)
+    set_ = {metric: getattr(model, metric) + stmt.excluded[metric] for metric in metrics}
+    if "updated_at" in model.__table__.c:
+        set_["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=list(keys), set_=set_)
+
+
+def _increment_rows(deltas: dict, keys: tuple[str, ...], metrics: tuple[str, ...]) -> list[dict]:
+    rows = []
+    for key, metric_deltas in deltas.items():
+        if not any(metric_deltas.values()):
+            continue
+        key = key if isinstance(key, tuple) else (key,)
+        row = dict(zip(keys, key))
+        # Revenue is accumulated in cents; Money binds dollars
+        row.update({m: metric_deltas[m] / 100 if m == "revenue" else metric_deltas[m] for m in metrics})
+        rows.append(row)
+    return rows
+
+
+def _new_clients_increment(client_ids: list[int]):
+    day = func.date(Client.created_at)
+    stmt = _insert(DailyRollup).from_select(
+        ["day", "new_clients_count"],
+        select(day, func.count(Client.id)).where(Client.id.in_(client_ids)).group_by(day),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["day"],
+        set_={
+            "new_clients_count": DailyRollup.new_clients_count + stmt.excluded.new_clients_count,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def _rebuild_statements(start: date, end: date) -> list:
+    """Statements replacing the rollups for days in [start, end) with fresh totals."""
+    start_dt = datetime.combine(start, datetime.min.time())
+    end_dt = datetime.combine(end, datetime.min.time())
+    completed = Appointment.status == "completed"
+
+    def _when(condition, value=1):
+        return func.sum(case((condition, value), else_=0))
+
+    appt_day = func.date(Appointment.start_datetime)
+    in_range = and_(Appointment.start_datetime >= start_dt, Appointment.start_datetime < end_dt)
+    appointments = (
+        select(
+            appt_day.label("day"),
+            _when(completed, Appointment.price).label("revenue"),
+            _when(completed).label("completed_count"),
+            _when(Appointment.status == "no_show").label("no_show_count"),
+            _when(Appointment.status == "cancelled").label("cancelled_count"),
+            literal(0).label("new_clients_count"),
+        )
+        .where(in_range)
+        .group_by(appt_day)
+    )
+    client_day = func.date(Client.created_at)
+    clients = (
+        select(
+            client_day.label("day"),
+            literal(0), literal(0), literal(0), literal(0),
+            func.count(Client.id).label("new_clients_count"),
+        )
+        .where(and_(Client.created_at >= start_dt, Client.created_at < end_dt))
+        .group_by(client_day)
+    )
+    combined = union_all(appointments, clients).subquery()
+
+    return [
+        delete(DailyRollup).where(and_(DailyRollup.day >= start, DailyRollup.day < end)),
+        delete(DailyServiceRollup).where(
+            and_(DailyServiceRollup.day >= start, DailyServiceRollup.day < end)
+        ),
+        insert(DailyRollup).from_select(
+            ["day", *DAILY_METRICS],
+            select(
+                combined.c.day,
+                *(func.sum(combined.c[metric]) for metric in DAILY_METRICS),
+            ).group_by(combined.c.day),
+        ),
+        insert(DailyServiceRollup).from_select(
+            ["day", "service_type", *SERVICE_METRICS],
+            select(
+                appt_day,
+                Appointment.service_type,
+                func.count(Appointment.id),
+                func.sum(Appointment.price),
+            )
+            .where(and_(in_range, completed))
+            .group_by(appt_day, Appointment.service_type),
+        ),
+    ]
+
+
+async def rebuild_rollups(db, start: date | None = None, end: date | None = None) -> dict:
+    """
+    Recompute rollups for [start, end) from the appointments and clients
+    tables; defaults to the whole history. Caller commits.
+    """
+    if start is None or end is None:
+        first_appt, last_appt, first_client, last_client = (await db.execute(
+            select(
+                select(func.min(Appointment.start_datetime)).scalar_subquery(),
+                select(func.max(Appointment.start_datetime)).scalar_subquery(),
+                select(func.min(Client.created_at)).scalar_subquery(),
+                select(func.max(Client.created_at)).scalar_subquery(),
+            )
+        )).one()
+        firsts = [d.date() for d in (first_appt, first_client) if d]
+        lasts = [d.date() for d in (last_appt, last_client) if d]
+        if not firsts:
+            return {"from": None, "to": None, "days": 0}
+        start = start or min(firsts)
+        end = end or max(lasts) + timedelta(days=1)
+
+    for statement in _rebuild_statements(start, end):
+        await db.execute(statement)
+    days = (await db.execute(
+        select(func.count()).select_from(DailyRollup)
+        .where(and_(DailyRollup.day >= start, DailyRollup.day < end))
+    )).scalar()
+    return {"from": start.isoformat(), "to": end.isoformat(), "days": days}
+
+
+def _known_days(obj) -> set[date]:
+    state = sa_inspect(obj)
+    days = {d.date() for d in state.attrs.start_datetime.history.deleted if d}
+    if state.dict.get("start_datetime"):
+        days.add(state.dict["start_datetime"].date())
+    return days
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_rollup_deltas(session, flush_context):
+    daily = defaultdict(lambda: dict.fromkeys(DAILY_METRICS, 0))
+    services = defaultdict(lambda: dict.fromkeys(SERVICE_METRICS, 0))
+    rebuild_days: set[date] = set()
+    new_client_ids = [obj.id for obj in session.new if isinstance(obj, Client)]
+
+    for obj in session.deleted:
+        if isinstance(obj, Client):
+            # The row is gone; recount the day it was created on
+            created_at = sa_inspect(obj).dict.get("created_at")
+            if created_at:
+                rebuild_days.add(created_at.date())
+
+    for collection, before, after in (
+        (session.new, False, True),
+        (session.dirty, True, True),
+        (session.deleted, True, False),
+    ):
+        for obj in collection:
+            if not isinstance(obj, Appointment):
+                continue
+            old = flushed_values(obj, APPOINTMENT_COLUMNS, True) if before else {}
+            new = flushed_values(obj, APPOINTMENT_COLUMNS, False) if after else {}
+            if old is None or new is None:
+                # Previous values weren't loaded: recount the affected days
+                rebuild_days.update(_known_days(obj))
+            elif old != new:
+                if old:
+                    _add_contribution(old, -1, daily, services)
+                if new:
+                    _add_contribution(new, 1, daily, services)
+
+    daily_rows = _increment_rows(daily, ("day",), DAILY_METRICS)
+    service_rows = _increment_rows(services, ("day", "service_type"), SERVICE_METRICS)
+    if not (daily_rows or service_rows or new_client_ids or rebuild_days):
+        return
+
+    connection = session.connection()
+    if daily_rows:
+        connection.execute(_increment(DailyRollup, ("day",), DAILY_METRICS), daily_rows)
+    if service_rows:
+        connection.execute(
+            _increment(DailyServiceRollup, ("day", "service_type"), SERVICE_METRICS), service_rows
+        )
+    if new_client_ids:
+        connection.execute(_new_clients_increment(new_client_ids))
+    # Rebuilding replaces whatever the increments above did to those days
+    for day in sorted(rebuild_days):
+        for statement in _rebuild_statements(day, day + timedelta(days=1)):
+            connection.execute(statement)
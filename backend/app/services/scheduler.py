@@ -4,6 +4,7 @@ Started in FastAPI lifespan context manager (main.py).
 """
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from app.config import get_settings
 
 settings = get_settings()
@@ -200,6 +201,57 @@ async def flag_leads_for_followup():
         print(f"[Scheduler] {len(leads)} leads need follow-up today")
 
 
+async def compact_change_log():
+    """Drop superseded change-log rows so /sync scans stay short."""
+    from app.database import AsyncSessionLocal
+    from app.services.change_log import compact_change_log as _compact
+
+    async with AsyncSessionLocal() as db:
+        removed = await _compact(db)
+        await db.commit()
+        print(f"[Scheduler] Compacted change log ({removed} superseded rows)")
+
+
+async def reconcile_counters():
+    """Recount the maintained dashboard counters and repair any drift."""
+    from app.database import AsyncSessionLocal
+    from app.services.counters import reconcile_counters as _reconcile
+
+    async with AsyncSessionLocal() as db:
+        drift = await _reconcile(db)
+        await db.commit()
+    if drift:
+        print(f"[Scheduler] Repaired counter drift: {drift}")
+
+
+async def prune_jobs():
+    """Delete finished background jobs past their retention period."""
+    from app.database import AsyncSessionLocal
+    from app.services.jobs import prune_jobs as _prune
+
+    async with AsyncSessionLocal() as db:
+        removed = await _prune(db, settings.job_retention_days)
+        await db.commit()
+    print(f"[Scheduler] Pruned {removed} finished jobs")
+
+
+async def checkpoint_sqlite_wal():
+    """Fold the SQLite WAL back into the main database file."""
+    from app.database import sqlite_checkpoint
+
+    result = await sqlite_checkpoint()
+    if result and result[0]:
+        print(f"[Scheduler] WAL checkpoint incomplete (busy): {result}")
+
+
+async def optimize_sqlite():
+    """Run PRAGMA optimize so the planner keeps using the hot-query indexes."""
+    from app.database import sqlite_optimize
+
+    await sqlite_optimize()
+    print("[Scheduler] SQLite optimize complete")
+
+
 def setup_scheduler():
     """Configure and return the scheduler with all jobs."""
     scheduler.add_job(
@@ -226,4 +278,39 @@ def setup_scheduler():
         id="flag_followup",
         replace_existing=True,
     )
+    scheduler.add_job(
+        compact_change_log,
+        CronTrigger(hour=3, minute=0),
+        id="compact_change_log",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        prune_jobs,
+        CronTrigger(hour=3, minute=15),
+        id="prune_jobs",
+        replace_existing=True,
+    )
+    if settings.counter_reconcile_interval_minutes > 0:
+        scheduler.add_job(
+            reconcile_counters,
+            IntervalTrigger(minutes=settings.counter_reconcile_interval_minutes),
+            id="reconcile_counters",
+            replace_existing=True,
+        )
+
+    from app.database import is_sqlite
+    if is_sqlite and settings.sqlite_checkpoint_interval_minutes > 0:
+        scheduler.add_job(
+            checkpoint_sqlite_wal,
+            IntervalTrigger(minutes=settings.sqlite_checkpoint_interval_minutes),
+            id="sqlite_checkpoint",
+            replace_existing=True,
+        )
+    if is_sqlite and settings.sqlite_optimize_interval_hours > 0:
+        scheduler.add_job(
+            optimize_sqlite,
+            IntervalTrigger(hours=settings.sqlite_optimize_interval_hours),
+            id="sqlite_optimize",
+            replace_existing=True,
+        )
     return scheduler
@@ -0,0 +1,129 @@
+"""
+Benchmark: ORM hydration vs column projection for appointment list endpoints.
+
+Compares the old read path (load Appointment + Client entities, rebuild each
+row from __table__.columns, validate) with the projection path used by
+app.routers.appointments (select LIST_COLUMNS, validate Core rows directly).
+
+    cd backend
+    python -m benchmarks.list_projection            # 20,000 rows
+    python -m benchmarks.list_projection --rows 50000
+
+Reports CPU time and peak Python memory per row for each path.
+"""
+import argparse
+import asyncio
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.appointment import Appointment
+from app.models.client import Client
+from app.routers.appointments import LIST_COLUMNS
+from app.schemas.appointment import AppointmentListItem
+
+adapter = TypeAdapter(list[AppointmentListItem])
+
+
+async def seed(engine, rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        clients = max(rows // 10, 1)
+        now = datetime(2025, 1, 1, 9)
+        await conn.execute(
+            insert(Client),
+            [
+                {"full_name": f"Client {i}", "phone": f"+1555{i:07d}",
+                 "total_visits": 0, "total_spent": 0, "is_lapsed": False,
+                 "gdpr_consent": False, "created_at": now, "updated_at": now}
+                for i in range(clients)
+            ],
+        )
+        await conn.execute(
+            insert(Appointment),
+            [
+                {"client_id": i % clients + 1, "service_type": "Tape-In Extensions",
+                 "duration_minutes": 90, "price": 450, "status": "completed",
+                 "start_datetime": now + timedelta(hours=i),
+                 "end_datetime": now + timedelta(hours=i, minutes=90),
+                 "notes": "Bring reference photos", "deposit_paid": True,
+                 "deposit_amount": 50, "created_at": now, "updated_at": now}
+                for i in range(rows)
+            ],
+        )
+
+
+async def orm_path(session) -> list:
+    result = await session.execute(
+        select(Appointment, Client).join(Client, Appointment.client_id == Client.id)
+    )
+    return adapter.validate_python([
+        {**{c.key: getattr(a, c.key) for c in a.__table__.columns},
+         "client_name": cl.full_name, "price": float(a.price),
+         "deposit_amount": float(a.deposit_amount)}
+        for a, cl in result.all()
+    ])
+
+
+async def projection_path(session) -> list:
+    result = await session.execute(
+        select(*LIST_COLUMNS).join(Client, Appointment.client_id == Client.id)
+    )
+    return adapter.validate_python(result.mappings().all())
+
+
+async def measure(sessionmaker, fn, rows: int, repeat: int) -> tuple[float, float]:
+    # CPU timing runs without tracemalloc, which would otherwise dominate
+    cpu = []
+    for _ in range(repeat):
+        async with sessionmaker() as session:
+            gc.collect()
+            start = time.process_time()
+            out = await fn(session)
+            cpu.append(time.process_time() - start)
+            assert len(out) == rows
+        del out
+
+    async with sessionmaker() as session:
+        gc.collect()
+        tracemalloc.start()
+        out = await fn(session)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert len(out) == rows
+    return min(cpu) / rows * 1e6, peak / rows
+
+
+async def main(rows: int, repeat: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    await seed(engine, rows)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    results = {}
+    for name, fn in (("orm", orm_path), ("projection", projection_path)):
+        results[name] = await measure(sessionmaker, fn, rows, repeat)
+
+    print(f"{rows:,} appointment rows, best of {repeat}")
+    print(f"{'path':<12}{'CPU us/row':>12}{'peak B/row':>12}")
+    for name, (cpu_us, mem_b) in results.items():
+        print(f"{name:<12}{cpu_us:>12.2f}{mem_b:>12.0f}")
+    orm, proj = results["orm"], results["projection"]
+    print(f"projection: {orm[0] / proj[0]:.1f}x less CPU, {orm[1] / proj[1]:.1f}x less memory per row")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -1,9 +1,16 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import create_tables
+from app.database import run_migrations
+from app.services.calendar_outbox import calendar_outbox_worker
+from app.services.jobs import job_worker
 from app.services.scheduler import setup_scheduler
 from app.config import get_settings
+from app.pagination import NEXT_CURSOR_HEADER
+from app.instrumentation import (
+    QUERY_COUNT_HEADER, QUERY_TIME_HEADER, SLOWEST_QUERY_HEADER,
+    check_budget, track_queries,
+)
 from app.routers import (
     clients,
     appointments,
@@ -15,18 +22,26 @@ from app.routers import (
     aftercare,
     reports,
     dashboard,
+    sync,
+    exports,
+    jobs,
 )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    await create_tables()
+    await run_migrations()
     scheduler = setup_scheduler()
     scheduler.start()
-    print("Salon API started. Scheduler running.")
+    await job_worker.start()
+    await calendar_outbox_worker.start()
+    print("Salon API started. Scheduler, job worker and calendar outbox running.")
     yield
     # Shutdown
+    await dashboard.broadcaster.stop()
+    await calendar_outbox_worker.stop()
+    await job_worker.stop()
     scheduler.shutdown(wait=False)
     print("Salon API shutting down.")
 
@@ -47,8 +62,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", NEXT_CURSOR_HEADER, QUERY_COUNT_HEADER, QUERY_TIME_HEADER, SLOWEST_QUERY_HEADER],
 )
 
+
+@app.middleware("http")
+async def instrument_sql(request: Request, call_next):
+    with track_queries(f"{request.method} {request.url.path}") as stats:
+        response = await call_next(request)
+    check_budget(stats)
+    if settings.debug:
+        response.headers[QUERY_COUNT_HEADER] = str(stats.count)
+        response.headers[QUERY_TIME_HEADER] = f"{stats.total_ms:.1f}"
+        if stats.slowest:
+            response.headers[SLOWEST_QUERY_HEADER] = f"{stats.slowest[0][0]:.1f}"
+    return response
+
+
 API_PREFIX = "/api/v1"
 
 app.include_router(clients.router, prefix=API_PREFIX)
@@ -61,6 +91,9 @@ app.include_router(sms.router, prefix=API_PREFIX)
 app.include_router(aftercare.router, prefix=API_PREFIX)
 app.include_router(reports.router, prefix=API_PREFIX)
 app.include_router(dashboard.router, prefix=API_PREFIX)
+app.include_router(sync.router, prefix=API_PREFIX)
+app.include_router(exports.router, prefix=API_PREFIX)
+app.include_router(jobs.router, prefix=API_PREFIX)
 
 
 @app.get("/")
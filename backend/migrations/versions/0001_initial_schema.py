@@ -0,0 +1,243 @@
+"""Initial schema
+
+Mirrors the tables previously created by Base.metadata.create_all().
+Databases created that way are stamped at this revision on first startup.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 22:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('app_settings',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('key', sa.String(length=120), nullable=False),
+    sa.Column('value', sa.Text(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    op.create_table('clients',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('full_name', sa.String(length=120), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('first_visit_date', sa.Date(), nullable=True),
+    sa.Column('last_visit_date', sa.Date(), nullable=True),
+    sa.Column('total_visits', sa.Integer(), nullable=False),
+    sa.Column('total_spent', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('is_lapsed', sa.Boolean(), nullable=False),
+    sa.Column('hair_profile', sa.Text(), nullable=True),
+    sa.Column('gdpr_consent', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('phone')
+    )
+    op.create_table('inventory_products',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=120), nullable=False),
+    sa.Column('sku', sa.String(length=60), nullable=True),
+    sa.Column('category', sa.String(length=60), nullable=False),
+    sa.Column('supplier_name', sa.String(length=120), nullable=True),
+    sa.Column('supplier_contact', sa.String(length=255), nullable=True),
+    sa.Column('unit_cost', sa.Numeric(precision=8, scale=2), nullable=True),
+    sa.Column('retail_price', sa.Numeric(precision=8, scale=2), nullable=True),
+    sa.Column('current_stock', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('stock_unit', sa.String(length=20), nullable=False),
+    sa.Column('reorder_threshold', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('reorder_quantity', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('last_ordered_at', sa.DateTime(), nullable=True),
+    sa.Column('last_restocked_at', sa.DateTime(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('sku')
+    )
+    op.create_table('purchase_orders',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('supplier_name', sa.String(length=120), nullable=True),
+    sa.Column('ai_generated', sa.Boolean(), nullable=False),
+    sa.Column('items_json', sa.Text(), nullable=False),
+    sa.Column('total_cost', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('ordered_at', sa.DateTime(), nullable=True),
+    sa.Column('received_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('reports',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('report_month', sa.String(length=7), nullable=False),
+    sa.Column('revenue_total', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('appointments_count', sa.Integer(), nullable=False),
+    sa.Column('new_clients_count', sa.Integer(), nullable=False),
+    sa.Column('lapsed_recovered', sa.Integer(), nullable=False),
+    sa.Column('leads_converted', sa.Integer(), nullable=False),
+    sa.Column('top_services_json', sa.Text(), nullable=True),
+    sa.Column('inventory_spend', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('ai_summary_text', sa.Text(), nullable=True),
+    sa.Column('ai_generated_at', sa.DateTime(), nullable=True),
+    sa.Column('charts_data_json', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('report_month')
+    )
+    op.create_table('appointments',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('service_type', sa.String(length=60), nullable=False),
+    sa.Column('duration_minutes', sa.Integer(), nullable=False),
+    sa.Column('price', sa.Numeric(precision=8, scale=2), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('start_datetime', sa.DateTime(), nullable=False),
+    sa.Column('end_datetime', sa.DateTime(), nullable=False),
+    sa.Column('google_event_id', sa.String(length=255), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('deposit_paid', sa.Boolean(), nullable=False),
+    sa.Column('deposit_amount', sa.Numeric(precision=8, scale=2), nullable=False),
+    sa.Column('cancellation_reason', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('chat_sessions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('session_token', sa.String(length=64), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=True),
+    sa.Column('channel', sa.String(length=20), nullable=False),
+    sa.Column('messages_json', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('session_token')
+    )
+    op.create_table('extension_leads',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=True),
+    sa.Column('name', sa.String(length=120), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=True),
+    sa.Column('source', sa.String(length=60), nullable=True),
+    sa.Column('hair_length', sa.String(length=30), nullable=True),
+    sa.Column('hair_texture', sa.String(length=30), nullable=True),
+    sa.Column('desired_length', sa.String(length=30), nullable=True),
+    sa.Column('desired_color', sa.String(length=60), nullable=True),
+    sa.Column('extension_type', sa.String(length=60), nullable=True),
+    sa.Column('budget_range', sa.String(length=40), nullable=True),
+    sa.Column('timeline', sa.String(length=40), nullable=True),
+    sa.Column('ai_qualification_score', sa.Integer(), nullable=True),
+    sa.Column('ai_qualification_tier', sa.String(length=20), nullable=True),
+    sa.Column('ai_qualification_notes', sa.Text(), nullable=True),
+    sa.Column('pipeline_stage', sa.String(length=30), nullable=False),
+    sa.Column('quote_amount', sa.Numeric(precision=8, scale=2), nullable=True),
+    sa.Column('quote_text', sa.Text(), nullable=True),
+    sa.Column('quote_sent_at', sa.DateTime(), nullable=True),
+    sa.Column('follow_up_count', sa.Integer(), nullable=False),
+    sa.Column('last_follow_up_at', sa.DateTime(), nullable=True),
+    sa.Column('next_follow_up_at', sa.DateTime(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('waitlist_entries',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('desired_service', sa.String(length=60), nullable=False),
+    sa.Column('desired_date_from', sa.Date(), nullable=True),
+    sa.Column('desired_date_to', sa.Date(), nullable=True),
+    sa.Column('flexibility_notes', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('notified_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('inventory_transactions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('transaction_type', sa.String(length=20), nullable=False),
+    sa.Column('quantity_change', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('quantity_after', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('appointment_id', sa.Integer(), nullable=True),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['appointment_id'], ['appointments.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['inventory_products.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('sms_messages',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=True),
+    sa.Column('lead_id', sa.Integer(), nullable=True),
+    sa.Column('appointment_id', sa.Integer(), nullable=True),
+    sa.Column('phone_number', sa.String(length=20), nullable=False),
+    sa.Column('direction', sa.String(length=10), nullable=False),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('twilio_sid', sa.String(length=64), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('message_type', sa.String(length=40), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['appointment_id'], ['appointments.id'], ),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.ForeignKeyConstraint(['lead_id'], ['extension_leads.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('aftercare_sequences',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('appointment_id', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('d3_sent_at', sa.DateTime(), nullable=True),
+    sa.Column('d3_response', sa.Text(), nullable=True),
+    sa.Column('d3_sms_id', sa.Integer(), nullable=True),
+    sa.Column('w2_sent_at', sa.DateTime(), nullable=True),
+    sa.Column('w2_response', sa.Text(), nullable=True),
+    sa.Column('w2_sms_id', sa.Integer(), nullable=True),
+    sa.Column('upsell_offer_sent', sa.Boolean(), nullable=False),
+    sa.Column('upsell_offer_type', sa.String(length=60), nullable=True),
+    sa.Column('upsell_converted', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['appointment_id'], ['appointments.id'], ),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+    sa.ForeignKeyConstraint(['d3_sms_id'], ['sms_messages.id'], ),
+    sa.ForeignKeyConstraint(['w2_sms_id'], ['sms_messages.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('appointment_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('aftercare_sequences')
+    op.drop_table('sms_messages')
+    op.drop_table('inventory_transactions')
+    op.drop_table('waitlist_entries')
+    op.drop_table('extension_leads')
+    op.drop_table('chat_sessions')
+    op.drop_table('appointments')
+    op.drop_table('reports')
+    op.drop_table('purchase_orders')
+    op.drop_table('inventory_products')
+    op.drop_table('clients')
+    op.drop_table('app_settings')
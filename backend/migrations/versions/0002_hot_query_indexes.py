@@ -0,0 +1,86 @@
+"""Composite and partial indexes for hot queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 22:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_clients_created_at', 'clients', ['created_at'])
+    op.create_index('ix_clients_full_name', 'clients', ['full_name'])
+    op.create_index(
+        'ix_clients_lapsed_last_visit', 'clients', ['last_visit_date'],
+        sqlite_where=sa.text('is_lapsed'),
+        postgresql_where=sa.text('is_lapsed'),
+    )
+    op.create_index('ix_clients_last_visit_date', 'clients', ['last_visit_date'])
+    op.create_index('ix_inventory_products_active_category_name', 'inventory_products', ['is_active', 'category', 'name'])
+    op.create_index('ix_purchase_orders_created_at', 'purchase_orders', ['created_at'])
+    op.create_index('ix_appointments_client_start', 'appointments', ['client_id', 'start_datetime'])
+    op.create_index(
+        'ix_appointments_google_event_id', 'appointments', ['google_event_id'],
+        sqlite_where=sa.text('google_event_id IS NOT NULL'),
+        postgresql_where=sa.text('google_event_id IS NOT NULL'),
+    )
+    op.create_index('ix_appointments_start', 'appointments', ['start_datetime'])
+    op.create_index('ix_appointments_status_start', 'appointments', ['status', 'start_datetime'])
+    op.create_index('ix_extension_leads_created_at', 'extension_leads', ['created_at'])
+    op.create_index(
+        'ix_extension_leads_open_follow_up', 'extension_leads', ['next_follow_up_at'],
+        sqlite_where=sa.text("pipeline_stage NOT IN ('lost', 'booked')"),
+        postgresql_where=sa.text("pipeline_stage NOT IN ('lost', 'booked')"),
+    )
+    op.create_index('ix_extension_leads_stage_created', 'extension_leads', ['pipeline_stage', 'created_at'])
+    op.create_index('ix_waitlist_entries_status_created', 'waitlist_entries', ['status', 'created_at'])
+    op.create_index('ix_inventory_transactions_product_created', 'inventory_transactions', ['product_id', 'created_at'])
+    op.create_index('ix_inventory_transactions_type_created', 'inventory_transactions', ['transaction_type', 'created_at'])
+    op.create_index('ix_sms_messages_client_created', 'sms_messages', ['client_id', 'created_at'])
+    op.create_index('ix_sms_messages_lead_created', 'sms_messages', ['lead_id', 'created_at'])
+    op.create_index('ix_aftercare_sequences_created_at', 'aftercare_sequences', ['created_at'])
+    op.create_index(
+        'ix_aftercare_sequences_d3_pending', 'aftercare_sequences', ['appointment_id'],
+        sqlite_where=sa.text('d3_sent_at IS NULL'),
+        postgresql_where=sa.text('d3_sent_at IS NULL'),
+    )
+    op.create_index(
+        'ix_aftercare_sequences_w2_pending', 'aftercare_sequences', ['appointment_id'],
+        sqlite_where=sa.text('w2_sent_at IS NULL AND d3_sent_at IS NOT NULL'),
+        postgresql_where=sa.text('w2_sent_at IS NULL AND d3_sent_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_aftercare_sequences_w2_pending', table_name='aftercare_sequences')
+    op.drop_index('ix_aftercare_sequences_d3_pending', table_name='aftercare_sequences')
+    op.drop_index('ix_aftercare_sequences_created_at', table_name='aftercare_sequences')
+    op.drop_index('ix_sms_messages_lead_created', table_name='sms_messages')
+    op.drop_index('ix_sms_messages_client_created', table_name='sms_messages')
+    op.drop_index('ix_inventory_transactions_type_created', table_name='inventory_transactions')
+    op.drop_index('ix_inventory_transactions_product_created', table_name='inventory_transactions')
+    op.drop_index('ix_waitlist_entries_status_created', table_name='waitlist_entries')
+    op.drop_index('ix_extension_leads_stage_created', table_name='extension_leads')
+    op.drop_index('ix_extension_leads_open_follow_up', table_name='extension_leads')
+    op.drop_index('ix_extension_leads_created_at', table_name='extension_leads')
+    op.drop_index('ix_appointments_status_start', table_name='appointments')
+    op.drop_index('ix_appointments_start', table_name='appointments')
+    op.drop_index('ix_appointments_google_event_id', table_name='appointments')
+    op.drop_index('ix_appointments_client_start', table_name='appointments')
+    op.drop_index('ix_purchase_orders_created_at', table_name='purchase_orders')
+    op.drop_index('ix_inventory_products_active_category_name', table_name='inventory_products')
+    op.drop_index('ix_clients_last_visit_date', table_name='clients')
+    op.drop_index('ix_clients_lapsed_last_visit', table_name='clients')
+    op.drop_index('ix_clients_full_name', table_name='clients')
+    op.drop_index('ix_clients_created_at', table_name='clients')
@@ -0,0 +1,50 @@
+"""Extend list-ordering indexes with id for keyset pagination
+
+List endpoints now page on (sort key, id); the tie-breaking id has to be in
+the index for the seek to be a single range scan on Postgres (SQLite already
+appends the rowid, but the explicit column keeps both backends identical).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 23:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, old index, old columns, new index, new columns)
+REPLACED = [
+    ('clients', 'ix_clients_full_name', ['full_name'],
+     'ix_clients_full_name_id', ['full_name', 'id']),
+    ('appointments', 'ix_appointments_start', ['start_datetime'],
+     'ix_appointments_start_id', ['start_datetime', 'id']),
+    ('extension_leads', 'ix_extension_leads_created_at', ['created_at'],
+     'ix_extension_leads_created_id', ['created_at', 'id']),
+    ('extension_leads', 'ix_extension_leads_stage_created', ['pipeline_stage', 'created_at'],
+     'ix_extension_leads_stage_created_id', ['pipeline_stage', 'created_at', 'id']),
+    ('purchase_orders', 'ix_purchase_orders_created_at', ['created_at'],
+     'ix_purchase_orders_created_id', ['created_at', 'id']),
+    ('waitlist_entries', 'ix_waitlist_entries_status_created', ['status', 'created_at'],
+     'ix_waitlist_entries_status_created_id', ['status', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    for table, old_name, _, new_name, new_cols in REPLACED:
+        op.create_index(new_name, table, new_cols)
+        op.drop_index(old_name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, old_name, old_cols, new_name, _ in reversed(REPLACED):
+        op.create_index(old_name, table, old_cols)
+        op.drop_index(new_name, table_name=table)
@@ -0,0 +1,104 @@
+"""Store money as integer cents
+
+Converts every Numeric money column to an integer number of cents
+(app.models.types.Money). Existing values are rounded to the nearest cent.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> [(column, original Numeric type, nullable)]
+MONEY_COLUMNS = {
+    'appointments': [
+        ('price', sa.Numeric(precision=8, scale=2), False),
+        ('deposit_amount', sa.Numeric(precision=8, scale=2), False),
+    ],
+    'clients': [
+        ('total_spent', sa.Numeric(precision=10, scale=2), False),
+    ],
+    'inventory_products': [
+        ('unit_cost', sa.Numeric(precision=8, scale=2), True),
+        ('retail_price', sa.Numeric(precision=8, scale=2), True),
+    ],
+    'purchase_orders': [
+        ('total_cost', sa.Numeric(precision=10, scale=2), True),
+    ],
+    'extension_leads': [
+        ('quote_amount', sa.Numeric(precision=8, scale=2), True),
+    ],
+    'reports': [
+        ('revenue_total', sa.Numeric(precision=10, scale=2), False),
+        ('inventory_spend', sa.Numeric(precision=10, scale=2), False),
+    ],
+}
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    for table, columns in MONEY_COLUMNS.items():
+        if is_postgres:
+            for column, numeric, nullable in columns:
+                op.alter_column(
+                    table, column,
+                    existing_type=numeric,
+                    existing_nullable=nullable,
+                    type_=sa.Integer(),
+                    postgresql_using=f'ROUND({column} * 100)::integer',
+                )
+            continue
+
+        # SQLite: scale the values in place, then rebuild the table with
+        # INTEGER columns (batch mode copies the data across)
+        op.execute(
+            f'UPDATE {table} SET '
+            + ', '.join(f'{c} = CAST(ROUND({c} * 100) AS INTEGER)' for c, _, _ in columns)
+        )
+        with op.batch_alter_table(table) as batch_op:
+            for column, numeric, nullable in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=numeric,
+                    existing_nullable=nullable,
+                    type_=sa.Integer(),
+                )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    for table, columns in MONEY_COLUMNS.items():
+        if is_postgres:
+            for column, numeric, nullable in columns:
+                op.alter_column(
+                    table, column,
+                    existing_type=sa.Integer(),
+                    existing_nullable=nullable,
+                    type_=numeric,
+                    postgresql_using=f'{column} / 100.0',
+                )
+            continue
+
+        with op.batch_alter_table(table) as batch_op:
+            for column, numeric, nullable in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Integer(),
+                    existing_nullable=nullable,
+                    type_=numeric,
+                )
+        op.execute(
+            f'UPDATE {table} SET '
+            + ', '.join(f'{c} = {c} / 100.0' for c, _, _ in columns)
+        )
@@ -0,0 +1,53 @@
+"""Change log for delta sync
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Sync entity name -> table, seeded so the first since=0 sync returns every
+# existing row
+SYNCED_TABLES = {
+    'clients': 'clients',
+    'appointments': 'appointments',
+    'leads': 'extension_leads',
+    'inventory': 'inventory_products',
+    'aftercare': 'aftercare_sequences',
+    'chat_sessions': 'chat_sessions',
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'change_log',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('entity', sa.String(length=30), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('op', sa.String(length=10), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_change_log_entity_entity_id', 'change_log', ['entity', 'entity_id'])
+
+    for entity, table in SYNCED_TABLES.items():
+        op.execute(
+            f"INSERT INTO change_log (entity, entity_id, op, changed_at) "
+            f"SELECT '{entity}', id, 'upsert', CURRENT_TIMESTAMP FROM {table} ORDER BY id"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_change_log_entity_entity_id', table_name='change_log')
+    op.drop_table('change_log')
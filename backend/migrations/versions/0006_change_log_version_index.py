@@ -0,0 +1,28 @@
+"""Index change_log by (entity, id) for per-entity versions
+
+Conditional GET derives each ETag from the newest change_log id for the
+entity, which this index answers with a single backward seek.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 14:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_change_log_entity_id', 'change_log', ['entity', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_change_log_entity_id', table_name='change_log')
@@ -0,0 +1,48 @@
+"""Counters table for dashboard counts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 16:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Counter name -> COUNT query seeding it (mirrors app.services.counters.COUNTERS)
+SEED_QUERIES = {
+    'lapsed_clients': "SELECT COUNT(*) FROM clients WHERE is_lapsed",
+    'active_leads': "SELECT COUNT(*) FROM extension_leads WHERE pipeline_stage NOT IN ('lost', 'booked')",
+    'needs_review_appointments': "SELECT COUNT(*) FROM appointments WHERE status = 'needs_review'",
+    'low_stock_products': (
+        "SELECT COUNT(*) FROM inventory_products "
+        "WHERE is_active AND current_stock <= reorder_threshold"
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'counters',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    for name, query in SEED_QUERIES.items():
+        op.execute(
+            f"INSERT INTO counters (name, value, updated_at) "
+            f"SELECT '{name}', ({query}), CURRENT_TIMESTAMP"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('counters')
@@ -0,0 +1,80 @@
+"""Daily revenue/activity rollup tables
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 18:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_rollup',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('revenue', sa.Integer(), nullable=False),
+        sa.Column('completed_count', sa.Integer(), nullable=False),
+        sa.Column('no_show_count', sa.Integer(), nullable=False),
+        sa.Column('cancelled_count', sa.Integer(), nullable=False),
+        sa.Column('new_clients_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('day'),
+    )
+    op.create_table(
+        'daily_service_rollup',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('service_type', sa.String(length=60), nullable=False),
+        sa.Column('completed_count', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'service_type'),
+    )
+
+    # Backfill from history (revenue is already integer cents)
+    op.execute(
+        """
+        INSERT INTO daily_rollup
+            (day, revenue, completed_count, no_show_count, cancelled_count, new_clients_count, updated_at)
+        SELECT day, SUM(revenue), SUM(completed), SUM(no_shows), SUM(cancelled), SUM(new_clients),
+               CURRENT_TIMESTAMP
+        FROM (
+            SELECT date(start_datetime) AS day,
+                   SUM(CASE WHEN status = 'completed' THEN price ELSE 0 END) AS revenue,
+                   SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS completed,
+                   SUM(CASE WHEN status = 'no_show' THEN 1 ELSE 0 END) AS no_shows,
+                   SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) AS cancelled,
+                   0 AS new_clients
+            FROM appointments
+            GROUP BY date(start_datetime)
+            UNION ALL
+            SELECT date(created_at), 0, 0, 0, 0, COUNT(*)
+            FROM clients
+            WHERE created_at IS NOT NULL
+            GROUP BY date(created_at)
+        ) AS activity
+        GROUP BY day
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO daily_service_rollup (day, service_type, completed_count, revenue)
+        SELECT date(start_datetime), service_type, COUNT(*), SUM(price)
+        FROM appointments
+        WHERE status = 'completed'
+        GROUP BY date(start_datetime), service_type
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_service_rollup')
+    op.drop_table('daily_rollup')
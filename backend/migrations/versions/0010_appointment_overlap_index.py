@@ -0,0 +1,31 @@
+"""Index appointments by (start_datetime, end_datetime, status) for overlap checks
+
+Double-booking checks and availability bitmaps look for slot-holding
+appointments overlapping a window; this makes each a single covering range
+scan on start time.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 10:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, Sequence[str], None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_appointments_start_end', 'appointments', ['start_datetime', 'end_datetime', 'status']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_appointments_start_end', table_name='appointments')
@@ -0,0 +1,51 @@
+"""Recurring appointment series
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 15:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, Sequence[str], None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'appointment_series',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('client_id', sa.Integer(), nullable=False),
+        sa.Column('service_type', sa.String(length=60), nullable=False),
+        sa.Column('duration_minutes', sa.Integer(), nullable=False),
+        sa.Column('price', sa.Integer(), nullable=False),
+        sa.Column('first_start_datetime', sa.DateTime(), nullable=False),
+        sa.Column('interval_weeks', sa.Integer(), nullable=False),
+        sa.Column('occurrences', sa.Integer(), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    with op.batch_alter_table('appointments') as batch_op:
+        batch_op.add_column(sa.Column('series_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_appointments_series_id', 'appointment_series', ['series_id'], ['id']
+        )
+        batch_op.create_index('ix_appointments_series_id', ['series_id'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('appointments') as batch_op:
+        batch_op.drop_index('ix_appointments_series_id')
+        batch_op.drop_constraint('fk_appointments_series_id', type_='foreignkey')
+        batch_op.drop_column('series_id')
+    op.drop_table('appointment_series')
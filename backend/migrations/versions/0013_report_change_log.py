@@ -0,0 +1,31 @@
+"""Seed change_log with existing reports
+
+Conditional GET now versions reports by their newest change_log row like
+every other entity, so give reports that predate this a row to start from.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-21 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, Sequence[str], None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "INSERT INTO change_log (entity, entity_id, op, changed_at) "
+        "SELECT 'reports', id, 'upsert', CURRENT_TIMESTAMP FROM reports ORDER BY id"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM change_log WHERE entity = 'reports'")
@@ -0,0 +1,48 @@
+"""
+The suite runs the whole app (migrations, workers, hooks) against a fresh
+SQLite file, with query budgets enforced, through one TestClient. Tests share
+that database, so each one creates its own clients and uses its own dates.
+"""
+import itertools
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="salon-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/salon.db"
+os.environ["ENFORCE_QUERY_BUDGETS"] = "true"
+os.environ["SALON_TIMEZONE"] = "America/New_York"
+os.environ["SALON_HOURS_START"] = "09:00"
+os.environ["SALON_HOURS_END"] = "18:00"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+import main  # noqa: E402
+
+API = "/api/v1"
+
+_phones = itertools.count(1000)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def run(client):
+    """Await `fn(*args)` on the app's event loop (the engine's connections live there)."""
+    def _run(fn, *args):
+        return client.portal.call(fn, *args)
+    return _run
+
+
+@pytest.fixture
+def new_client(client):
+    """Create a salon client through the API and return its JSON."""
+    def _new_client(**fields):
+        payload = {"full_name": "Test Client", "phone": f"+1212555{next(_phones):04d}", **fields}
+        response = client.post(f"{API}/clients/", json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()
+    return _new_client
@@ -0,0 +1,44 @@
+from datetime import date, timedelta
+from app.database import ReadSessionLocal
+from app.services.availability import availability
+from conftest import API
+
+
+def test_cached_day_invalidated_while_loading_stays_busy(client, run, new_client):
+    owner = new_client()
+    response = client.post(f"{API}/appointments/", json={
+        "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+        "price": 80, "start_datetime": "2032-03-01T10:00:00",
+    })
+    assert response.status_code == 201, response.text
+    booked_day = date(2032, 3, 1)
+
+    async def _load():
+        async with ReadSessionLocal() as db:
+            await availability.bitmaps(db, booked_day, booked_day)
+
+            class CommitsMidQuery:
+                # Another request commits (invalidating the cached day) while this one awaits
+                async def execute(self, statement):
+                    availability.invalidate([booked_day])
+                    return await db.execute(statement)
+
+            return await availability.bitmaps(CommitsMidQuery(), booked_day, booked_day + timedelta(days=1))
+
+    bitmaps = run(_load)
+
+    assert bitmaps[booked_day] != 0
+
+
+def test_next_available_converts_aware_from_to_salon_time(client):
+    # Salon runs on America/New_York (UTC-4 in April)
+    for start, local in (
+        ("2032-04-05T13:00:00Z", "2032-04-05T09:00:00"),
+        ("2032-04-05T17:00:00+02:00", "2032-04-05T11:00:00"),
+        ("2032-04-05T11:00:00", "2032-04-05T11:00:00"),
+    ):
+        response = client.get(f"{API}/calendar/next-available", params={"duration": 60, "from": start, "count": 1})
+
+        assert response.status_code == 200, response.text
+        assert response.json()["from"] == local
+        assert response.json()["available_slots"] == [local]
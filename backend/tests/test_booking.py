@@ -0,0 +1,130 @@
+import pytest
+from conftest import API
+
+
+def _book(client, owner, start, duration=60):
+    return client.post(f"{API}/appointments/", json={
+        "client_id": owner["id"], "service_type": "Cut", "duration_minutes": duration,
+        "price": 80, "start_datetime": start,
+    })
+
+
+def test_create_rejects_overlap(client, new_client):
+    owner = new_client()
+    assert _book(client, owner, "2032-01-05T10:00:00").status_code == 201
+
+    response = _book(client, owner, "2032-01-05T10:30:00")
+
+    assert response.status_code == 409
+    assert "Overlaps an existing booking" in response.json()["detail"]
+    assert _book(client, owner, "2032-01-05T11:00:00").status_code == 201
+
+
+def test_update_rejects_move_and_lengthening_onto_a_booking(client, new_client):
+    owner = new_client()
+    first = _book(client, owner, "2032-01-06T10:00:00").json()
+    second = _book(client, owner, "2032-01-06T12:00:00").json()
+
+    moved = client.put(f"{API}/appointments/{second['id']}", json={"start_datetime": "2032-01-06T10:30:00"})
+    lengthened = client.put(f"{API}/appointments/{first['id']}", json={"duration_minutes": 150})
+
+    assert moved.status_code == 409
+    assert lengthened.status_code == 409
+    assert client.get(f"{API}/appointments/{second['id']}").json()["start_datetime"] == "2032-01-06T12:00:00"
+
+
+def test_update_rejects_reinstating_a_cancelled_booking(client, new_client):
+    owner = new_client()
+    cancelled = _book(client, owner, "2032-01-07T10:00:00").json()
+    client.delete(f"{API}/appointments/{cancelled['id']}")
+    assert _book(client, owner, "2032-01-07T10:00:00").status_code == 201
+
+    response = client.put(f"{API}/appointments/{cancelled['id']}", json={"status": "scheduled"})
+
+    assert response.status_code == 409
+
+
+def test_bulk_rejects_overlaps_with_bookings_and_within_the_batch(client, new_client):
+    owner = new_client()
+    assert _book(client, owner, "2032-01-08T10:00:00").status_code == 201
+    item = {"client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60, "price": 80}
+
+    response = client.post(f"{API}/appointments/bulk", json={"appointments": [
+        {**item, "start_datetime": "2032-01-08T10:30:00"},
+        {**item, "start_datetime": "2032-01-08T14:00:00"},
+        {**item, "start_datetime": "2032-01-08T14:30:00"},
+        {**item, "start_datetime": "2032-01-08T16:00:00"},
+    ]})
+
+    assert response.status_code == 409
+    detail = response.json()["detail"]
+    assert "item 0" in detail and "item 1" in detail and "item 2" in detail
+    assert "item 3" not in detail
+    assert _book(client, owner, "2032-01-08T16:00:00").status_code == 201
+
+
+def test_series_rejects_occurrence_on_a_booking(client, new_client):
+    owner = new_client()
+    assert _book(client, owner, "2032-02-16T10:00:00").status_code == 201
+
+    response = client.post(f"{API}/appointments/bulk", json={"series": {
+        "client_id": owner["id"], "service_type": "Move-up", "duration_minutes": 90, "price": 150,
+        "first_start_datetime": "2032-02-02T09:30:00", "interval_weeks": 2, "occurrences": 3,
+    }})
+
+    assert response.status_code == 409
+    assert "item 1" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("duration", [0, -30, 24 * 60 + 1, 2 * 24 * 60])
+def test_out_of_range_durations_are_rejected(client, new_client, duration):
+    owner = new_client()
+    booked = _book(client, owner, "2032-01-09T10:00:00").json()
+    item = {"client_id": owner["id"], "service_type": "Cut", "duration_minutes": duration, "price": 80}
+
+    assert _book(client, owner, "2032-01-09T08:00:00", duration).status_code == 422
+    assert client.put(f"{API}/appointments/{booked['id']}", json={"duration_minutes": duration}).status_code == 422
+    assert client.post(f"{API}/appointments/bulk", json={
+        "appointments": [{**item, "start_datetime": "2032-01-09T08:00:00"}],
+    }).status_code == 422
+    assert client.post(f"{API}/appointments/bulk", json={"series": {
+        **item, "first_start_datetime": "2032-01-09T08:00:00", "occurrences": 2,
+    }}).status_code == 422
+    client.delete(f"{API}/appointments/{booked['id']}")
+
+
+def test_bulk_books_appointments_and_a_series(client, new_client):
+    owner = new_client()
+    item = {"client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60, "price": 80}
+    # Warm the cached day so the bulk insert has to invalidate it
+    assert "2034-05-01T10:00:00" in client.get(
+        f"{API}/calendar/slots", params={"date": "2034-05-01", "duration": 60}
+    ).json()["available_slots"]
+
+    response = client.post(f"{API}/appointments/bulk", json={
+        "appointments": [
+            {**item, "start_datetime": "2034-05-01T10:00:00"},
+            {**item, "start_datetime": "2034-05-01T11:00:00"},
+        ],
+        "series": {
+            **item, "service_type": "Move-up", "duration_minutes": 90, "price": 150,
+            "first_start_datetime": "2034-05-08T09:30:00", "interval_weeks": 2, "occurrences": 3,
+        },
+    })
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert body["created"] == 5
+    assert [(a["start_datetime"], a["end_datetime"]) for a in body["appointments"]] == [
+        ("2034-05-01T10:00:00", "2034-05-01T11:00:00"),
+        ("2034-05-01T11:00:00", "2034-05-01T12:00:00"),
+        ("2034-05-08T09:30:00", "2034-05-08T11:00:00"),
+        ("2034-05-22T09:30:00", "2034-05-22T11:00:00"),
+        ("2034-06-05T09:30:00", "2034-06-05T11:00:00"),
+    ]
+    stored = [client.get(f"{API}/appointments/{a['id']}").json() for a in body["appointments"]]
+    assert [a["series_id"] for a in stored] == [None, None] + [body["series_id"]] * 3
+    assert {a["status"] for a in stored} == {"scheduled"}
+    assert stored[2]["service_type"] == "Move-up" and stored[2]["price"] == 150
+    slots = client.get(f"{API}/calendar/slots", params={"date": "2034-05-01", "duration": 60}).json()
+    assert not {"2034-05-01T10:00:00", "2034-05-01T11:00:00"} & set(slots["available_slots"])
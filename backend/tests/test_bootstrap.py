@@ -0,0 +1,26 @@
+from datetime import date, datetime, time, timedelta
+from conftest import API
+
+
+def test_bootstrap_matches_the_individual_endpoints(client, new_client):
+    owner = new_client()
+    for start in (
+        datetime.combine(date.today(), time(0, 0)),
+        datetime.combine(date.today() + timedelta(days=2), time(10, 0)),
+    ):
+        response = client.post(f"{API}/appointments/", json={
+            "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 30,
+            "price": 45, "start_datetime": start.isoformat(),
+        })
+        assert response.status_code == 201, response.text
+    client.post(f"{API}/leads/", json={"name": "Bootstrap Lead", "phone": "+12125550166"})
+
+    bootstrap = client.get(f"{API}/dashboard/bootstrap")
+
+    assert bootstrap.status_code == 200, bootstrap.text
+    body = bootstrap.json()
+    assert body["stats"] == client.get(f"{API}/reports/dashboard-stats").json()
+    assert body["alerts"] == client.get(f"{API}/dashboard/alerts").json()
+    assert body["today"] == client.get(f"{API}/dashboard/today").json()
+    assert body["upcoming"] == client.get(f"{API}/appointments/upcoming", params={"days": 7}).json()
+    assert owner["id"] in {appt["client_id"] for appt in body["upcoming"]}
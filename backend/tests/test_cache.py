@@ -0,0 +1,76 @@
+from app.cache import QueryCache, dashboard_cache
+from app.database import AsyncSessionLocal
+from app.models.lead import ExtensionLead
+
+
+def _counting(value="fresh"):
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return value
+    return compute, calls
+
+
+def test_entries_are_served_until_a_dependency_is_invalidated(run):
+    async def _scenario():
+        cache = QueryCache(ttl_seconds=60)
+        compute, calls = _counting()
+        for _ in range(3):
+            assert await cache.get_or_compute("kpis", {"appointments"}, compute) == "fresh"
+        cache.invalidate({"leads"})
+        await cache.get_or_compute("kpis", {"appointments"}, compute)
+        assert len(calls) == 1
+
+        cache.invalidate({"appointments"})
+        await cache.get_or_compute("kpis", {"appointments"}, compute)
+        assert len(calls) == 2
+        assert cache.stats()["kpis"] == {"hits": 3, "misses": 2, "invalidations": 1, "cached_entries": 1}
+
+    run(_scenario)
+
+
+def test_result_computed_across_an_invalidation_is_not_stored(run):
+    async def _scenario():
+        cache = QueryCache(ttl_seconds=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            # A write commits while this computation is still running
+            cache.invalidate({"clients"})
+            return "stale"
+
+        await cache.get_or_compute("alerts", {"clients"}, compute)
+        await cache.get_or_compute("alerts", {"clients"}, compute)
+        assert len(calls) == 2
+
+    run(_scenario)
+
+
+def test_commit_invalidates_dependent_entries_and_rollback_does_not(run):
+    async def _is_cached() -> bool:
+        compute, calls = _counting()
+        await dashboard_cache.get_or_compute("test_leads_view", {"leads"}, compute)
+        return not calls
+
+    async def _write_lead(db, name):
+        db.add(ExtensionLead(name=name, phone="+12125550177"))
+        await db.flush()
+
+    async def _scenario():
+        await _is_cached()
+        async with AsyncSessionLocal() as db:
+            await _write_lead(db, "Rolled Back")
+            await db.rollback()
+            # A later commit in the same session carries no lead changes
+            await db.commit()
+        assert await _is_cached()
+
+        async with AsyncSessionLocal() as db:
+            await _write_lead(db, "Committed")
+            assert await _is_cached()
+            await db.commit()
+        assert not await _is_cached()
+
+    run(_scenario)
@@ -0,0 +1,53 @@
+import time
+import pytest
+from sqlalchemy import delete
+from app.database import AsyncSessionLocal
+from app.models.calendar_outbox import CalendarOutboxEntry
+from app.services.calendar_outbox import calendar_outbox_worker
+from app.services.google_calendar import google_calendar_service
+from conftest import API
+
+
+@pytest.fixture
+def stopped_worker(run, monkeypatch):
+    """Queue entries without the background worker racing the test for them."""
+    run(calendar_outbox_worker.stop)
+    monkeypatch.setattr(google_calendar_service, "is_configured", lambda: True)
+    yield calendar_outbox_worker
+
+    async def _clear():
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(CalendarOutboxEntry))
+            await db.commit()
+    run(_clear)
+    run(calendar_outbox_worker.start)
+
+
+@pytest.fixture
+def far_from_utc(monkeypatch):
+    # SQLite's CURRENT_TIMESTAMP is UTC while the worker works in local time
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_queued_entries_are_claimed_immediately(client, run, new_client, stopped_worker, far_from_utc):
+    owner = new_client()
+    response = client.post(f"{API}/appointments/", json={
+        "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+        "price": 80, "start_datetime": "2031-03-03T10:00:00",
+    })
+    assert response.status_code == 201, response.text
+    single = response.json()["id"]
+    response = client.post(f"{API}/appointments/bulk", json={"appointments": [{
+        "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+        "price": 80, "start_datetime": "2031-03-03T14:00:00",
+    }]})
+    assert response.status_code == 201, response.text
+    bulk = [appt["id"] for appt in response.json()["appointments"]]
+
+    claimed = run(stopped_worker._claim)
+
+    assert {appointment_id for _, appointment_id, _ in claimed} == {single, *bulk}
@@ -0,0 +1,59 @@
+from datetime import date, datetime, timedelta
+from app.database import AsyncSessionLocal
+from app.models.appointment import Appointment
+from app.models.client import Client
+from conftest import API
+
+# First visit, then (start, service, status) per client; nothing else in the
+# suite has visits this early
+HISTORY = [
+    (date(2019, 1, 10), [
+        ("2019-01-10", "Cut", "completed"), ("2019-02-20", "Cut", "completed"), ("2019-04-05", "Color", "completed"),
+    ]),
+    (date(2019, 1, 15), [("2019-01-15", "Cut", "completed"), ("2019-02-15", "Cut", "cancelled")]),
+    (date(2019, 2, 3), [
+        ("2019-02-03", "Color", "completed"), ("2019-03-03", "Color", "completed"),
+        ("2019-05-01", "Color", "completed"),  # after as_of: ignored
+    ]),
+    (date(2019, 4, 10), [("2019-04-10", "Cut", "completed")]),
+]
+
+
+def test_cohort_matrix_on_a_small_history(client, run, new_client):
+    owners = [new_client()["id"] for _ in HISTORY]
+
+    async def _seed():
+        async with AsyncSessionLocal() as db:
+            for owner, (first_visit, visits) in zip(owners, HISTORY):
+                (await db.get(Client, owner)).first_visit_date = first_visit
+                for day, service, status in visits:
+                    start = datetime.fromisoformat(f"{day}T10:00:00")
+                    db.add(Appointment(
+                        client_id=owner, service_type=service, duration_minutes=60, price=80,
+                        status=status, start_datetime=start, end_datetime=start + timedelta(hours=1),
+                    ))
+            await db.commit()
+
+    run(_seed)
+
+    response = client.get(f"{API}/reports/cohorts", params={"as_of": "2019-04", "months": 4})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [(c["cohort"], c["size"], c["active"], c["retention"]) for c in body["cohorts"]] == [
+        ("2019-01", 2, [2, 1, 0, 1], [1.0, 0.5, 0.0, 0.5]),
+        ("2019-02", 1, [1, 1, 0], [1.0, 1.0, 0.0]),
+        ("2019-03", 0, [0, 0], [None, None]),
+        ("2019-04", 1, [1], [1.0]),
+    ]
+    assert body["average_retention"] == [1.0, 0.6667, 0.0, 0.5]
+    # Only the January cohort is old enough; one of its two clients never came back
+    assert body["churn_curve"] == [{"month": 0, "eligible": 2, "churned_pct": 50.0}]
+
+    intervals = body["rebooking_intervals"]
+    assert intervals["histogram_weeks"] == [{"weeks": 4, "count": 1}, {"weeks": 5, "count": 1}, {"weeks": 6, "count": 1}]
+    assert (intervals["p25_weeks"], intervals["median_weeks"], intervals["p75_weeks"]) == (4, 5, 6)
+    assert intervals["by_service"] == {
+        "Color": {"count": 1, "p25_weeks": 4, "median_weeks": 4, "p75_weeks": 4},
+        "Cut": {"count": 2, "p25_weeks": 5, "median_weeks": 5, "p75_weeks": 6},
+    }
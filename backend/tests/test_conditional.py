@@ -0,0 +1,62 @@
+from sqlalchemy import select
+from app.database import AsyncSessionLocal
+from app.models.report import Report
+from app.services.report_builder import save_reports
+from conftest import API
+
+
+def _report(month: str, revenue: float) -> dict:
+    return {
+        "report_month": month, "revenue_total": revenue, "appointments_count": 3,
+        "new_clients_count": 1, "lapsed_recovered": 0, "leads_converted": 0,
+        "top_services": [], "daily_revenue": [],
+    }
+
+
+def _save(run, *reports):
+    async def _write():
+        async with AsyncSessionLocal() as db:
+            await save_reports(db, list(reports))
+            await db.commit()
+    run(_write)
+
+
+def test_report_etag_changes_on_rewrite_within_a_second(client, run):
+    _save(run, _report("2030-01", 100), _report("2030-02", 200))
+    first = client.get(f"{API}/reports/2030-01")
+    assert first.status_code == 200
+    assert client.get(f"{API}/reports/2030-01", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+    # Same row count, same second: only the change log tells the versions apart
+    _save(run, _report("2030-01", 150))
+    second = client.get(f"{API}/reports/2030-01", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 200
+    assert second.json()["revenue_total"] == 150
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+
+def test_report_etag_changes_on_orm_update(client, run):
+    _save(run, _report("2030-03", 300))
+    first = client.get(f"{API}/reports/")
+
+    async def _summarize():
+        async with AsyncSessionLocal() as db:
+            report = (await db.execute(select(Report).where(Report.report_month == "2030-03"))).scalar_one()
+            report.ai_summary_text = "Strong month."
+            await db.commit()
+    run(_summarize)
+
+    second = client.get(f"{API}/reports/", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+
+def test_sync_skips_report_versions(client, run):
+    since = client.get(f"{API}/sync", params={"since": 0, "limit": 5000}).json()["since"]
+    _save(run, _report("2030-04", 400))
+
+    response = client.get(f"{API}/sync", params={"since": since}).json()
+
+    assert "reports" not in response["changes"]
+    assert response["since"] > since
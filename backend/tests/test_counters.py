@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy import select, update
+from app.database import AsyncSessionLocal
+from app.models.client import Client
+from app.models.counter import Counter
+from app.services.counters import COUNTERS, reconcile_counters
+from conftest import API
+
+
+async def _reconcile():
+    async with AsyncSessionLocal() as db:
+        drift = await reconcile_counters(db)
+        await db.commit()
+    return drift
+
+
+async def _stored():
+    async with AsyncSessionLocal() as db:
+        return dict((await db.execute(select(Counter.name, Counter.value))).all())
+
+
+@pytest.fixture
+def counters(run):
+    """Stored counter values; seeded and in line with the tables before the test starts."""
+    run(_reconcile)
+    return lambda: run(_stored)
+
+
+def _book(client, owner, start):
+    response = client.post(f"{API}/appointments/", json={
+        "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+        "price": 80, "start_datetime": start,
+    })
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _flag_for_review(client, appt):
+    response = client.put(f"{API}/appointments/{appt['id']}", json={"status": "needs_review"})
+    assert response.status_code == 200, response.text
+
+
+def test_complete_clears_review_flag_and_lapsed_client(client, run, new_client, counters):
+    owner = new_client()
+
+    async def _lapse():
+        async with AsyncSessionLocal() as db:
+            (await db.get(Client, owner["id"])).is_lapsed = True
+            await db.commit()
+
+    run(_lapse)
+    appt = _book(client, owner, "2033-06-01T10:00:00")
+    _flag_for_review(client, appt)
+    before = counters()
+
+    assert client.post(f"{API}/appointments/{appt['id']}/complete").status_code == 200
+
+    after = counters()
+    assert after["needs_review_appointments"] == before["needs_review_appointments"] - 1
+    assert after["lapsed_clients"] == before["lapsed_clients"] - 1
+
+
+def test_no_show_clears_review_flag(client, new_client, counters):
+    appt = _book(client, new_client(), "2033-06-02T10:00:00")
+    _flag_for_review(client, appt)
+    before = counters()
+
+    assert client.post(f"{API}/appointments/{appt['id']}/no-show").status_code == 200
+
+    assert counters()["needs_review_appointments"] == before["needs_review_appointments"] - 1
+
+
+def test_lead_stage_changes_move_active_leads(client, counters):
+    before = counters()["active_leads"]
+    lead = client.post(f"{API}/leads/", json={"name": "Counter Lead", "phone": "+12125550199"}).json()
+    assert counters()["active_leads"] == before + 1
+
+    client.put(f"{API}/leads/{lead['id']}", json={"pipeline_stage": "booked"})
+    assert counters()["active_leads"] == before
+    client.put(f"{API}/leads/{lead['id']}", json={"pipeline_stage": "lost"})
+    assert counters()["active_leads"] == before
+
+
+def test_adjust_stock_moves_low_stock_products(client, counters):
+    product = client.post(f"{API}/inventory/products", json={
+        "name": "Counter Bonds", "category": "extensions", "current_stock": 10, "reorder_threshold": 5,
+    }).json()
+    before = counters()["low_stock_products"]
+
+    def _adjust(quantity):
+        response = client.post(f"{API}/inventory/products/{product['id']}/adjust", json={
+            "transaction_type": "used" if quantity < 0 else "received", "quantity": quantity,
+        })
+        assert response.status_code == 200, response.text
+
+    _adjust(-6)
+    assert counters()["low_stock_products"] == before + 1
+    _adjust(-1)
+    assert counters()["low_stock_products"] == before + 1
+    _adjust(10)
+    assert counters()["low_stock_products"] == before
+
+
+def test_reconcile_repairs_drifted_counter(run, counters):
+    correct = counters()
+
+    async def _drift():
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(Counter).where(Counter.name == "active_leads").values(value=Counter.value + 5))
+            await db.commit()
+
+    run(_drift)
+
+    assert run(_reconcile) == {
+        "active_leads": {"stored": correct["active_leads"] + 5, "actual": correct["active_leads"]},
+    }
+    assert counters() == correct
+    assert set(correct) == set(COUNTERS)
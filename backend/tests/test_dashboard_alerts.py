@@ -0,0 +1,204 @@
+"""GET /dashboard/alerts: one statement, same panel as the per-category queries it replaced."""
+from datetime import datetime, timedelta
+from sqlalchemy import select, func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cache import dashboard_cache
+from app.config import get_settings
+from app.database import AsyncSessionLocal, ReadSessionLocal
+from app.models.appointment import Appointment
+from app.models.client import Client
+from app.models.inventory import InventoryProduct
+from app.models.lead import ExtensionLead
+from app.models.report import AftercareSequence
+from app.routers.dashboard import ALERTS_DEPENDS_ON
+from conftest import API
+
+
+async def _alerts_per_category(db: AsyncSession) -> dict:
+    """The panel as computed before the single-statement rewrite: one query per category."""
+    now = datetime.now()
+    alerts = []
+
+    low_stock_result = await db.execute(
+        select(InventoryProduct).where(
+            and_(
+                InventoryProduct.is_active == True,  # noqa: E712
+                InventoryProduct.current_stock <= InventoryProduct.reorder_threshold,
+            )
+        )
+    )
+    for item in low_stock_result.scalars().all():
+        alerts.append({
+            "type": "low_stock",
+            "severity": "warning",
+            "title": f"Low stock: {item.name}",
+            "detail": f"{item.current_stock} {item.stock_unit} remaining (threshold: {item.reorder_threshold})",
+            "link": "/inventory",
+            "item_id": item.id,
+        })
+
+    lapsed_count = (await db.execute(
+        select(func.count(Client.id)).where(Client.is_lapsed == True)  # noqa: E712
+    )).scalar() or 0
+    if lapsed_count > 0:
+        alerts.append({
+            "type": "lapsed_clients",
+            "severity": "info",
+            "title": f"{lapsed_count} lapsed client{'s' if lapsed_count != 1 else ''}",
+            "detail": "Haven't visited in 90+ days — consider sending outreach",
+            "link": "/clients?filter=lapsed",
+            "count": lapsed_count,
+        })
+
+    overdue_leads = (await db.execute(
+        select(func.count(ExtensionLead.id)).where(
+            and_(
+                ExtensionLead.next_follow_up_at <= now,
+                ExtensionLead.pipeline_stage.notin_(["lost", "booked"]),
+            )
+        )
+    )).scalar() or 0
+    if overdue_leads > 0:
+        alerts.append({
+            "type": "lead_followup",
+            "severity": "warning",
+            "title": f"{overdue_leads} lead follow-up{'s' if overdue_leads != 1 else ''} due",
+            "detail": "Leads awaiting your follow-up contact",
+            "link": "/leads",
+            "count": overdue_leads,
+        })
+
+    d3_count = (await db.execute(
+        select(func.count(AftercareSequence.id))
+        .join(Appointment, AftercareSequence.appointment_id == Appointment.id)
+        .where(
+            and_(
+                AftercareSequence.d3_sent_at.is_(None),
+                Appointment.end_datetime <= now - timedelta(days=3),
+                Appointment.status == "completed",
+            )
+        )
+    )).scalar() or 0
+    if d3_count > 0:
+        alerts.append({
+            "type": "aftercare_d3",
+            "severity": "info",
+            "title": f"{d3_count} day-3 aftercare due",
+            "detail": "Clients who had appointments 3+ days ago haven't received their check-in",
+            "link": "/aftercare",
+            "count": d3_count,
+        })
+
+    w2_count = (await db.execute(
+        select(func.count(AftercareSequence.id))
+        .join(Appointment, AftercareSequence.appointment_id == Appointment.id)
+        .where(
+            and_(
+                AftercareSequence.w2_sent_at.is_(None),
+                AftercareSequence.d3_sent_at.is_not(None),
+                Appointment.end_datetime <= now - timedelta(days=14),
+                Appointment.status == "completed",
+            )
+        )
+    )).scalar() or 0
+    if w2_count > 0:
+        alerts.append({
+            "type": "aftercare_w2",
+            "severity": "info",
+            "title": f"{w2_count} week-2 aftercare due",
+            "detail": "Clients due for their 2-week follow-up and upsell message",
+            "link": "/aftercare",
+            "count": w2_count,
+        })
+
+    conflicts_count = (await db.execute(
+        select(func.count(Appointment.id)).where(Appointment.status == "needs_review")
+    )).scalar() or 0
+    if conflicts_count > 0:
+        alerts.append({
+            "type": "calendar_conflict",
+            "severity": "error",
+            "title": f"{conflicts_count} calendar conflict{'s' if conflicts_count != 1 else ''}",
+            "detail": "Appointments imported from Google Calendar need review",
+            "link": "/appointments",
+            "count": conflicts_count,
+        })
+
+    no_show_count = (await db.execute(
+        select(func.count(Appointment.id)).where(
+            and_(
+                Appointment.status == "no_show",
+                Appointment.start_datetime >= now - timedelta(days=7),
+            )
+        )
+    )).scalar() or 0
+    if no_show_count > 0:
+        alerts.append({
+            "type": "no_show",
+            "severity": "warning",
+            "title": f"{no_show_count} recent no-show{'s' if no_show_count != 1 else ''}",
+            "detail": "Consider sending re-engagement messages",
+            "link": "/appointments?status=no_show",
+            "count": no_show_count,
+        })
+
+    return {
+        "alerts": alerts,
+        "total": len(alerts),
+        "has_errors": any(a["severity"] == "error" for a in alerts),
+    }
+
+
+async def _seed_every_alert_type():
+    now = datetime.now().replace(microsecond=0)
+    async with AsyncSessionLocal() as db:
+        for name, stock in (("Alert Bonds", 1), ("Alert Clips", 2), ("Alert Glue", 0)):
+            db.add(InventoryProduct(
+                name=name, category="alerts", current_stock=stock, reorder_threshold=5, stock_unit="pcs",
+            ))
+        lapsed = [Client(full_name=f"Alerts Lapsed {i}", phone=f"+1646555{i:04d}", is_lapsed=True) for i in range(2)]
+        db.add_all(lapsed)
+        db.add(ExtensionLead(name="Alerts Lead", phone="+16465550100", next_follow_up_at=now - timedelta(days=1)))
+        await db.flush()
+
+        def appointment(days_ago: int, status: str) -> Appointment:
+            start = (now - timedelta(days=days_ago)).replace(hour=10, minute=0, second=0)
+            return Appointment(
+                client_id=lapsed[0].id, service_type="Cut", duration_minutes=60, price=80,
+                status=status, start_datetime=start, end_datetime=start + timedelta(hours=1),
+            )
+
+        d3_due, w2_due = appointment(5, "completed"), appointment(20, "completed")
+        db.add_all([
+            d3_due, w2_due,
+            appointment(-30, "needs_review"), appointment(-31, "needs_review"),
+            appointment(2, "no_show"),
+        ])
+        await db.flush()
+        db.add_all([
+            AftercareSequence(appointment_id=d3_due.id, client_id=lapsed[0].id),
+            AftercareSequence(appointment_id=w2_due.id, client_id=lapsed[0].id, d3_sent_at=now - timedelta(days=17)),
+        ])
+        await db.commit()
+
+
+def test_alerts_single_statement_matches_per_category(client, run, monkeypatch):
+    run(_seed_every_alert_type)
+    dashboard_cache.invalidate(ALERTS_DEPENDS_ON)
+    monkeypatch.setattr(get_settings(), "debug", True)
+
+    response = client.get(f"{API}/dashboard/alerts")
+
+    assert response.status_code == 200, response.text
+    assert response.headers["X-DB-Query-Count"] == "1"
+
+    async def _expected():
+        async with ReadSessionLocal() as db:
+            return await _alerts_per_category(db)
+
+    expected = run(_expected)
+    assert {alert["type"] for alert in expected["alerts"]} == {
+        "low_stock", "lapsed_clients", "lead_followup", "aftercare_d3",
+        "aftercare_w2", "calendar_conflict", "no_show",
+    }
+    assert response.json() == expected
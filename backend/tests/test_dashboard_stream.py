@@ -0,0 +1,62 @@
+import asyncio
+from app.services.dashboard_stream import DashboardBroadcaster
+
+
+def _counting_broadcaster() -> tuple[DashboardBroadcaster, list[int]]:
+    calls = []
+
+    async def snapshot():
+        calls.append(len(calls) + 1)
+        return {
+            "kpis": {"snapshots": len(calls)},
+            "alerts": {"alerts": [], "total": 0, "has_errors": False},
+            "today": {
+                "date": "2032-01-01", "appointments": [], "total_appointments": 0,
+                "completed_count": 0, "revenue_today": 0,
+            },
+        }
+
+    return DashboardBroadcaster(snapshot, refresh_seconds=0.01), calls
+
+
+def test_refresh_stops_with_last_subscriber_and_catches_up_on_reconnect(run):
+    async def _scenario():
+        broadcaster, calls = _counting_broadcaster()
+        first, second = broadcaster.stream(None), broadcaster.stream(None)
+        assert "event: snapshot" in await anext(first)
+        await anext(second)
+        task = broadcaster._task
+
+        await first.aclose()
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        await second.aclose()
+        await asyncio.wait([task], timeout=1)
+        assert task.cancelled()
+        idle_calls = len(calls)
+        await asyncio.sleep(0.05)
+        assert len(calls) == idle_calls
+
+        # A client resuming from the last id still gets what changed meanwhile
+        resumed = broadcaster.stream(f"{broadcaster._epoch}-{broadcaster._last_id}")
+        assert "event: kpis" in await anext(resumed)
+        assert broadcaster._task is not None
+        await resumed.aclose()
+
+    run(_scenario)
+
+
+def test_stop_cancels_refresh_with_subscribers_connected(run):
+    async def _scenario():
+        broadcaster, _ = _counting_broadcaster()
+        subscriber = broadcaster.stream(None)
+        await anext(subscriber)
+        task = broadcaster._task
+
+        await broadcaster.stop()
+
+        assert task.cancelled()
+        await subscriber.aclose()
+
+    run(_scenario)
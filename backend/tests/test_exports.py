@@ -0,0 +1,33 @@
+import csv
+import io
+import json
+from app.routers import exports
+from conftest import API
+
+
+def test_export_streams_every_row_in_range_across_batches(client, new_client, monkeypatch):
+    monkeypatch.setattr(exports, "BATCH_SIZE", 7)
+    owner = new_client()
+    starts = [f"2034-01-{day:02d}T10:00:00" for day in range(2, 22)] + ["2034-02-01T09:00:00"]
+    response = client.post(f"{API}/appointments/bulk", json={"appointments": [
+        {"client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60, "price": 80, "start_datetime": start}
+        for start in starts
+    ]})
+    assert response.status_code == 201, response.text
+    in_range = [appt["id"] for appt in response.json()["appointments"][:-1]]
+    params = {"from": "2034-01-01", "to": "2034-02-01"}
+
+    as_csv = client.get(f"{API}/exports/appointments", params=params)
+    as_ndjson = client.get(f"{API}/exports/appointments", params={**params, "format": "ndjson"})
+
+    assert as_csv.headers["content-type"].startswith("text/csv")
+    csv_rows = list(csv.DictReader(io.StringIO(as_csv.text)))
+    assert [int(row["id"]) for row in csv_rows] == in_range
+    assert csv_rows[0]["price"] == "80.0"
+    ndjson_rows = [json.loads(line) for line in as_ndjson.text.splitlines()]
+    assert [row["id"] for row in ndjson_rows] == in_range
+    assert ndjson_rows[0]["start_datetime"] == "2034-01-02T10:00:00"
+
+
+def test_unknown_export_is_404(client):
+    assert client.get(f"{API}/exports/secrets").status_code == 404
@@ -0,0 +1,41 @@
+from sqlalchemy import select
+from app.database import AsyncSessionLocal
+from app.models.client import Client
+from conftest import API
+
+
+def test_duplicate_rows_merge_given_fields_and_keep_consent(client, run):
+    phone = "+12125559901"
+    response = client.post(f"{API}/clients/import", json={"clients": [
+        {"full_name": "Ada Early", "phone": phone, "email": "ada@example.com", "gdpr_consent": True},
+        {"full_name": "Ada Later", "phone": "(212) 555-9901", "notes": "Prefers mornings"},
+        {"full_name": "Ada Last", "phone": phone, "gdpr_consent": False},
+    ]})
+    assert response.status_code == 200, response.text
+    assert response.json()["clients"]["duplicates_merged"] == 2
+
+    async def _load():
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(select(Client).where(Client.phone == phone))).scalar_one()
+
+    imported = run(_load)
+    assert imported.full_name == "Ada Last"
+    assert imported.email == "ada@example.com"
+    assert imported.notes == "Prefers mornings"
+    assert imported.gdpr_consent is True
+
+
+def test_reimport_grants_consent_but_never_revokes_it(client, run, new_client):
+    existing = new_client(gdpr_consent=False)
+    phone = existing["phone"]
+
+    async def _consent():
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(select(Client.gdpr_consent).where(Client.phone == phone))).scalar_one()
+
+    for consent, expected in ((True, True), (False, True)):
+        response = client.post(f"{API}/clients/import", json={"clients": [
+            {"full_name": existing["full_name"], "phone": phone, "gdpr_consent": consent},
+        ]})
+        assert response.status_code == 200, response.text
+        assert run(_consent) is expected
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import func, select
+from app.database import AsyncSessionLocal
+from app.instrumentation import QueryBudgetExceeded, track_queries
+from app.models.client import Client
+
+
+def test_over_budget_write_is_rolled_back(run):
+    async def _write():
+        with track_queries("test write") as stats:
+            stats.budget = 1
+            async with AsyncSessionLocal() as db:
+                db.add_all([
+                    Client(full_name="Over Budget", phone="+12125550001"),
+                    Client(full_name="Over Budget", phone="+12125550002"),
+                ])
+                await db.flush()
+                db.add(Client(full_name="Over Budget", phone="+12125550003"))
+                with pytest.raises(QueryBudgetExceeded):
+                    await db.commit()
+                await db.rollback()
+            assert not stats.committed
+
+    async def _count():
+        async with AsyncSessionLocal() as db:
+            return await db.scalar(select(func.count()).where(Client.full_name == "Over Budget"))
+
+    run(_write)
+    assert run(_count) == 0
+
+
+def test_within_budget_write_commits(run):
+    async def _write():
+        with track_queries("test write") as stats:
+            async with AsyncSessionLocal() as db:
+                db.add(Client(full_name="Within Budget", phone="+12125550004"))
+                await db.flush()
+                stats.budget = stats.count + 1
+                await db.commit()
+            assert stats.committed
+    run(_write)
+
+
+def test_later_commit_is_still_checked(run):
+    async def _write():
+        with track_queries("test write") as stats:
+            async with AsyncSessionLocal() as db:
+                db.add(Client(full_name="Second Commit", phone="+12125550005"))
+                await db.commit()
+                stats.budget = stats.count
+                db.add(Client(full_name="Second Commit", phone="+12125550006"))
+                with pytest.raises(QueryBudgetExceeded):
+                    await db.commit()
+                await db.rollback()
+
+    async def _count():
+        async with AsyncSessionLocal() as db:
+            return await db.scalar(select(func.count()).where(Client.full_name == "Second Commit"))
+
+    run(_write)
+    assert run(_count) == 1
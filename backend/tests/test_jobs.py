@@ -0,0 +1,37 @@
+import asyncio
+from datetime import timedelta
+from app.database import AsyncSessionLocal
+from app.models.job import Job
+from app.services.jobs import (
+    FINISHED_STATUSES, JobProgress, JobWorker, enqueue_job, job_handler, job_worker,
+)
+
+
+def test_execute_skips_job_deleted_after_claim(run, capsys):
+    worker = JobWorker(concurrency=1, poll_seconds=60)
+    run(worker._execute, 10**9)
+    assert "disappeared before it could run" in capsys.readouterr().out
+
+
+def test_finished_at_is_recorded_after_the_handler_returns(run):
+    @job_handler("test_sleep")
+    async def _sleep(params: dict, progress: JobProgress) -> dict:
+        await asyncio.sleep(params["seconds"])
+        return {"slept": params["seconds"]}
+
+    async def _scenario():
+        async with AsyncSessionLocal() as db:
+            job_id = (await enqueue_job(db, "test_sleep", {"seconds": 0.3})).id
+            await db.commit()
+        job_worker.notify()
+        for _ in range(200):
+            async with AsyncSessionLocal() as db:
+                job = await db.get(Job, job_id)
+            if job.status in FINISHED_STATUSES:
+                return job
+            await asyncio.sleep(0.02)
+        raise AssertionError("job never finished")
+
+    job = run(_scenario)
+    assert job.status == "succeeded"
+    assert job.finished_at >= job.started_at + timedelta(seconds=0.3)
@@ -0,0 +1,66 @@
+from pathlib import Path
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, select, text
+from app.database import AsyncSessionLocal
+from app.models.appointment import Appointment
+from app.models.types import to_cents
+from conftest import API
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+@pytest.mark.parametrize("amount, cents", [
+    (19.99, 1999), ("0.105", 11), (0.1 + 0.2, 30), (-2.5, -250), (None, None),
+])
+def test_to_cents_rounds_half_up(amount, cents):
+    assert to_cents(amount) == cents
+
+
+def test_migration_scales_existing_money_to_cents_and_back(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/money.db")
+    config = Config(str(ALEMBIC_INI))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "0003")
+        connection.execute(text(
+            "INSERT INTO clients (id, full_name, phone, total_spent, total_visits, is_lapsed, gdpr_consent,"
+            " created_at, updated_at) VALUES (1, 'Old Client', '+12125550100', 1234.56, 0, 0, 0,"
+            " CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+        ))
+        connection.execute(text(
+            "INSERT INTO appointments (client_id, service_type, duration_minutes, price, deposit_amount,"
+            " deposit_paid, status, start_datetime, end_datetime, created_at, updated_at)"
+            " VALUES (1, 'Cut', 60, 80.1, 19.995, 0, 'completed', '2020-01-01 10:00:00',"
+            " '2020-01-01 11:00:00', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+        ))
+
+        command.upgrade(config, "0004")
+        assert connection.execute(text("SELECT price, deposit_amount FROM appointments")).one() == (8010, 2000)
+        assert connection.execute(text("SELECT typeof(total_spent), total_spent FROM clients")).one() == (
+            "integer", 123456,
+        )
+
+        command.downgrade(config, "0003")
+        assert connection.execute(text("SELECT total_spent FROM clients")).scalar() == pytest.approx(1234.56)
+    engine.dispose()
+
+
+def test_money_sums_are_exact(client, run, new_client):
+    owner = new_client()
+    for day, price in enumerate((0.1, 0.2, 0.7, 0.1, 0.2, 0.7), start=1):
+        response = client.post(f"{API}/appointments/", json={
+            "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+            "price": price, "start_datetime": f"2033-08-{day:02d}T10:00:00",
+        })
+        assert client.post(f"{API}/appointments/{response.json()['id']}/complete").status_code == 200
+
+    async def _sum():
+        async with AsyncSessionLocal() as db:
+            return (await db.execute(
+                select(func.sum(Appointment.price)).where(Appointment.client_id == owner["id"])
+            )).scalar()
+
+    assert run(_sum) == 2.0
+    assert client.get(f"{API}/clients/{owner['id']}").json()["total_spent"] == 2.0
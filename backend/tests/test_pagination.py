@@ -0,0 +1,53 @@
+from conftest import API
+
+
+def _walk(client, path, **params):
+    """Every page of a list endpoint, following X-Next-Cursor; returns (ids, page count)."""
+    ids, pages, cursor = [], 0, None
+    while True:
+        response = client.get(f"{API}{path}", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        ids += [row["id"] for row in response.json()]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return ids, pages
+
+
+def test_client_pages_follow_the_cursor_without_gaps_or_repeats(client, new_client):
+    # Duplicate names exercise the id tie-break
+    created = [new_client(full_name=f"Keyset {name}")["id"] for name in ("Bea", "Ada", "Bea", "Cy", "Ada")]
+
+    ids, pages = _walk(client, "/clients/", search="Keyset", limit=2)
+
+    everything = client.get(f"{API}/clients/", params={"search": "Keyset", "limit": 100})
+    assert "X-Next-Cursor" not in everything.headers
+    assert ids == [row["id"] for row in everything.json()]
+    assert sorted(ids) == sorted(created)
+    assert pages == 3
+
+
+def test_appointment_pages_run_newest_first_across_equal_start_times(client, new_client):
+    owner = new_client()
+
+    def _book(start):
+        response = client.post(f"{API}/appointments/", json={
+            "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+            "price": 80, "start_datetime": start,
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    early = _book("2033-07-01T09:00:00")
+    cancelled = _book("2033-07-02T09:00:00")
+    client.delete(f"{API}/appointments/{cancelled}")
+    rebooked = _book("2033-07-02T09:00:00")
+    late = _book("2033-07-03T09:00:00")
+
+    ids, _ = _walk(client, "/appointments/", client_id=owner["id"], limit=1)
+
+    assert ids == [late, rebooked, cancelled, early]
+
+
+def test_invalid_cursor_is_rejected(client):
+    assert client.get(f"{API}/clients/", params={"cursor": "not-a-cursor"}).status_code == 400
@@ -0,0 +1,66 @@
+"""Budgeted write routes stay within budget on their worst-case path (budgets are enforced here)."""
+import json
+from sqlalchemy import delete, select, update
+from app.database import AsyncSessionLocal
+from app.models.appointment import Appointment
+from app.models.report import AppSetting
+from app.services.google_calendar import google_calendar_service
+from conftest import API
+
+
+def test_receive_purchase_order(client):
+    product = client.post(f"{API}/inventory/products", json={
+        "name": "Budget Tape", "category": "extensions", "reorder_threshold": 5,
+        "current_stock": 3, "unit_cost": 12.5,
+    }).json()
+    order = client.post(f"{API}/inventory/purchase-orders", json={
+        "items_json": json.dumps([{"product_id": product["id"], "qty": 10}]), "total_cost": 125,
+    }).json()
+
+    response = client.put(f"{API}/inventory/purchase-orders/{order['id']}", params={"status": "received"})
+
+    assert response.status_code == 200, response.text
+    assert client.get(f"{API}/inventory/products/{product['id']}").json()["product"]["current_stock"] == 13
+
+
+def test_calendar_sync_flagging_completed_and_scheduled(client, run, new_client, monkeypatch):
+    owner = new_client()
+    ids = []
+    for hour in (9, 11):
+        response = client.post(f"{API}/appointments/", json={
+            "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+            "price": 80, "start_datetime": f"2031-05-05T{hour:02d}:00:00",
+        })
+        ids.append(response.json()["id"])
+    client.post(f"{API}/appointments/{ids[0]}/complete")
+
+    async def _link_events():
+        async with AsyncSessionLocal() as db:
+            for appt_id in ids:
+                await db.execute(
+                    update(Appointment).where(Appointment.id == appt_id).values(google_event_id=f"budget-{appt_id}")
+                )
+            db.add(AppSetting(key="google_tokens", value="{}"))
+            await db.commit()
+
+    async def _fake_sync(db):
+        # Same statements as get_service() refreshing an expired token
+        setting = (await db.execute(select(AppSetting).where(AppSetting.key == "google_tokens"))).scalar_one()
+        setting.value = json.dumps({"token": "refreshed"})
+        await db.commit()
+        return [{"id": f"budget-{appt_id}", "start": {"dateTime": "2031-05-06T10:00:00Z"}} for appt_id in ids]
+
+    async def _unlink():
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(AppSetting).where(AppSetting.key == "google_tokens"))
+            await db.commit()
+
+    run(_link_events)
+    monkeypatch.setattr(google_calendar_service, "sync_from_google", _fake_sync)
+    try:
+        response = client.post(f"{API}/calendar/sync")
+    finally:
+        run(_unlink)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["needs_review_count"] == 2
@@ -0,0 +1,68 @@
+from datetime import date
+from sqlalchemy import select
+from app.database import AsyncSessionLocal
+from app.models.rollup import DailyRollup, DailyServiceRollup
+from app.services.rollups import rebuild_rollups
+from conftest import API
+
+START, END = date(2034, 3, 1), date(2034, 4, 1)
+
+
+async def _rollups() -> tuple[dict, dict]:
+    async with AsyncSessionLocal() as db:
+        daily = (await db.execute(
+            select(DailyRollup).where(DailyRollup.day >= START, DailyRollup.day < END)
+        )).scalars()
+        services = (await db.execute(
+            select(DailyServiceRollup).where(DailyServiceRollup.day >= START, DailyServiceRollup.day < END)
+        )).scalars()
+        # Rows a rebuild wouldn't create (all zero) are left out of the comparison
+        return (
+            {row.day: totals for row in daily if any(totals := (
+                row.revenue, row.completed_count, row.no_show_count, row.cancelled_count,
+            ))},
+            {(row.day, row.service_type): (row.revenue, row.completed_count) for row in services if row.completed_count},
+        )
+
+
+async def _rebuild():
+    async with AsyncSessionLocal() as db:
+        await rebuild_rollups(db, START, END)
+        await db.commit()
+
+
+def test_incremental_rollups_match_a_rebuild(client, run, new_client):
+    owner = new_client()
+
+    def _book(start, service="Cut", price=80):
+        response = client.post(f"{API}/appointments/", json={
+            "client_id": owner["id"], "service_type": service, "duration_minutes": 60,
+            "price": price, "start_datetime": start,
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    cut = _book("2034-03-02T10:00:00")
+    color = _book("2034-03-02T12:00:00", "Color", 150.25)
+    moved = _book("2034-03-03T10:00:00", "Color", 99.99)
+    missed = _book("2034-03-03T12:00:00")
+    dropped = _book("2034-03-04T10:00:00")
+    for appt_id in (cut, color, moved):
+        assert client.post(f"{API}/appointments/{appt_id}/complete").status_code == 200
+    client.post(f"{API}/appointments/{missed}/no-show")
+    client.delete(f"{API}/appointments/{dropped}")
+    # Price edit and reschedule after completion move revenue between buckets
+    client.put(f"{API}/appointments/{color}", json={"price": 175})
+    client.put(f"{API}/appointments/{moved}", json={"start_datetime": "2034-03-05T10:00:00"})
+
+    incremental = run(_rollups)
+    assert incremental[0] == {
+        date(2034, 3, 2): (255.0, 2, 0, 0),
+        date(2034, 3, 3): (0.0, 0, 1, 0),
+        date(2034, 3, 4): (0.0, 0, 0, 1),
+        date(2034, 3, 5): (99.99, 1, 0, 0),
+    }
+
+    run(_rebuild)
+
+    assert run(_rollups) == incremental
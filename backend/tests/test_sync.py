@@ -0,0 +1,68 @@
+from app.database import AsyncSessionLocal
+from app.models.lead import ExtensionLead
+from conftest import API
+
+
+def _head(client) -> int:
+    since = 0
+    while True:
+        body = client.get(f"{API}/sync", params={"since": since, "limit": 5000}).json()
+        since = body["since"]
+        if not body["has_more"]:
+            return since
+
+
+def _delete_lead(run, lead_id):
+    async def _delete():
+        async with AsyncSessionLocal() as db:
+            await db.delete(await db.get(ExtensionLead, lead_id))
+            await db.commit()
+    run(_delete)
+
+
+def test_sync_returns_latest_state_of_changed_rows(client, new_client):
+    since = _head(client)
+    owner = new_client(full_name="Sync Before")
+    client.put(f"{API}/clients/{owner['id']}", json={"full_name": "Sync After"})
+    appt = client.post(f"{API}/appointments/", json={
+        "client_id": owner["id"], "service_type": "Cut", "duration_minutes": 60,
+        "price": 80, "start_datetime": "2033-09-01T10:00:00",
+    }).json()
+
+    body = client.get(f"{API}/sync", params={"since": since}).json()
+
+    [synced] = [row for row in body["changes"]["clients"] if row["id"] == owner["id"]]
+    assert synced["full_name"] == "Sync After"
+    assert [row["id"] for row in body["changes"]["appointments"]] == [appt["id"]]
+    assert body["since"] > since
+    assert not body["has_more"]
+    assert client.get(f"{API}/sync", params={"since": body["since"]}).json()["changes"]["clients"] == []
+
+
+def test_sync_reports_deleted_rows_as_tombstones(client, run):
+    kept = client.post(f"{API}/leads/", json={"name": "Sync Kept", "phone": "+12125550181"}).json()
+    since = _head(client)
+    doomed = client.post(f"{API}/leads/", json={"name": "Sync Doomed", "phone": "+12125550182"}).json()
+    client.put(f"{API}/leads/{kept['id']}", json={"notes": "still here"})
+    _delete_lead(run, doomed["id"])
+
+    body = client.get(f"{API}/sync", params={"since": since}).json()
+
+    assert body["deleted"]["leads"] == [doomed["id"]]
+    assert [row["id"] for row in body["changes"]["leads"]] == [kept["id"]]
+
+
+def test_sync_pages_through_has_more(client, new_client):
+    since = _head(client)
+    created = {new_client()["id"] for _ in range(3)}
+
+    seen, pages = set(), 0
+    while True:
+        body = client.get(f"{API}/sync", params={"since": since, "limit": 1}).json()
+        seen |= {row["id"] for row in body["changes"]["clients"]}
+        since, pages = body["since"], pages + 1
+        if not body["has_more"]:
+            break
+
+    assert seen == created
+    assert pages >= 3
@@ -13,6 +13,7 @@ export interface Appointment {
   notes?: string;
   deposit_paid: boolean;
   google_event_id?: string;
+  series_id?: number | null;
 }
 
 export interface AppointmentCreate {
@@ -25,6 +26,24 @@ export interface AppointmentCreate {
   deposit_paid?: boolean;
 }
 
+export interface AppointmentSeriesCreate {
+  client_id: number;
+  service_type: string;
+  duration_minutes: number;
+  price: number;
+  first_start_datetime: string;
+  interval_weeks?: number;
+  occurrences: number;
+  notes?: string;
+}
+
+export interface BulkCreateResult {
+  created: number;
+  series_id: number | null;
+  calendar_sync_queued: number;
+  appointments: { id: number; start_datetime: string; end_datetime: string }[];
+}
+
 export const appointmentsApi = {
   list: (params?: {
     start?: string;
@@ -39,6 +58,12 @@ export const appointmentsApi = {
   create: (data: AppointmentCreate) =>
     api.post<Appointment>("/appointments", data).then((r) => r.data),
 
+  bulkCreate: (data: {
+    appointments?: AppointmentCreate[];
+    series?: AppointmentSeriesCreate;
+  }) =>
+    api.post<BulkCreateResult>("/appointments/bulk", data).then((r) => r.data),
+
   update: (id: number, data: Partial<AppointmentCreate>) =>
     api.put<Appointment>(`/appointments/${id}`, data).then((r) => r.data),
 
@@ -0,0 +1,17 @@
+import api from "./client";
+
+const POLL_INTERVAL_MS = 1000;
+
+export const jobsApi = {
+  get: (id: number) => api.get(`/jobs/${id}`).then((r) => r.data),
+
+  // Poll a background job until it finishes; rejects if it failed.
+  wait: async (id: number) => {
+    for (;;) {
+      const job = await jobsApi.get(id);
+      if (job.status === "succeeded") return job;
+      if (job.status === "failed") throw new Error(job.error || "Job failed");
+      await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    }
+  },
+};
@@ -1,8 +1,12 @@
 import api from "./client";
+import { jobsApi } from "./jobs";
 
 export const reportsApi = {
   list: () => api.get("/reports").then((r) => r.data),
   get: (month: string) => api.get(`/reports/${month}`).then((r) => r.data),
+  // Generation runs as a background job; resolves once the report is saved.
   generate: (month: string) =>
-    api.post(`/reports/${month}/generate`).then((r) => r.data),
+    api
+      .post(`/reports/${month}/generate`)
+      .then((r) => jobsApi.wait(r.data.job_id)),
 };
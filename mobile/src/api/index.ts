@@ -39,3 +39,9 @@ export const inventoryApi = {
   getAlerts: () => api.get("/inventory/alerts").then((r) => r.data),
   listProducts: () => api.get("/inventory/products").then((r) => r.data),
 };
+
+export const syncApi = {
+  // Pass back the "since" token from the previous response (0 for a full sync)
+  changes: (since: number) =>
+    api.get("/sync", { params: { since } }).then((r) => r.data),
+};